@@ -1,24 +1,132 @@
-from sqlalchemy import create_engine
+from fastapi import Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql.dml import UpdateBase
 import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 from dotenv import load_dotenv
+from config.db_monitor import (
+    InstrumentedAsyncQueuePool,
+    SessionLeakDetector,
+    describe_route,
+    instrument_pool,
+    instrument_statements,
+)
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+# 비동기 드라이버(asyncpg) URL - 미설정 시 DATABASE_URL에서 드라이버만 교체
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or make_url(DATABASE_URL).set(drivername="postgresql+asyncpg")
 
+# 읽기 전용 복제 DB - 미설정 시 모든 쿼리를 primary로 보냄
+REPLICA_DATABASE_URL = os.getenv("REPLICA_DATABASE_URL")
+ASYNC_REPLICA_DATABASE_URL = os.getenv("ASYNC_REPLICA_DATABASE_URL") or (
+    make_url(REPLICA_DATABASE_URL).set(drivername="postgresql+asyncpg") if REPLICA_DATABASE_URL else None
+)
+
+# 동기 엔진은 테이블 생성(DDL) 등 관리 작업에만 사용
 engine = create_engine(DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 커넥션 풀 설정
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", -1))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "false").lower() == "true"
+
+# 세션 누수 감지 (디버그용)
+DB_SESSION_LEAK_DETECTION = os.getenv("DB_SESSION_LEAK_DETECTION", "false").lower() == "true"
+DB_SESSION_HOLD_WARN_SECONDS = float(os.getenv("DB_SESSION_HOLD_WARN_SECONDS", 5))
+
+def _create_pooled_async_engine(url) -> AsyncEngine:
+    pooled_engine = create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+    )
+    instrument_pool(pooled_engine.sync_engine)
+    instrument_statements(pooled_engine.sync_engine)
+    return pooled_engine
+
+# 요청 처리용 비동기 엔진 - DB 대기 중 이벤트 루프를 점유하지 않음
+async_engine = _create_pooled_async_engine(ASYNC_DATABASE_URL)
+replica_engine = _create_pooled_async_engine(ASYNC_REPLICA_DATABASE_URL) if ASYNC_REPLICA_DATABASE_URL else async_engine
+
+class RoutingSession(Session):
+    """
+    읽기/쓰기 분리 세션
+    - execution_options(use_replica=True)가 지정된 SELECT만 복제 DB로 보냅니다.
+    - flush, DML, 그리고 같은 트랜잭션 안에서 쓰기 이후의 모든 읽기는 primary를 사용합니다.
+    """
+
+    def __init__(self, *args, primary: Engine, replica: Engine, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.primary = primary
+        self.replica = replica
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if isinstance(clause, UpdateBase):
+            self.info["has_writes"] = True
+            return self.primary
+
+        if self._flushing or self.info.get("has_writes"):
+            return self.primary
+
+        get_execution_options = getattr(clause, "get_execution_options", None)
+        if get_execution_options and get_execution_options().get("use_replica"):
+            return self.replica
+
+        return self.primary
+
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_has_writes(session, flush_context):
+    session.info["has_writes"] = True
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _clear_has_writes(session, transaction):
+    if transaction.parent is None:
+        session.info.pop("has_writes", None)
+
+AsyncSessionLocal = async_sessionmaker(
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    primary=async_engine.sync_engine,
+    replica=replica_engine.sync_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+session_leak_detector = SessionLeakDetector(DB_SESSION_HOLD_WARN_SECONDS) if DB_SESSION_LEAK_DETECTION else None
+
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
-    try:
+@asynccontextmanager
+async def tracked_session(route: str) -> AsyncIterator[AsyncSession]:
+    """
+    세션 누수 감지기에 route로 등록되는 세션
+    요청 의존성(get_db)이 정리된 뒤에도 세션이 필요한 경우(스트리밍 응답 등) 직접 열 때 사용합니다.
+    """
+    async with AsyncSessionLocal() as db:
+        token = session_leak_detector.acquire(route) if session_leak_detector else None
+        try:
+            yield db
+        finally:
+            if token is not None:
+                session_leak_detector.release(token)
+
+async def get_db(request: Request):
+    async with tracked_session(describe_route(request)) as db:
         yield db
-    finally:
-        db.close()
 
 def init_database():
     """데이터베이스 초기화"""
@@ -31,5 +139,7 @@ def create_tables():
     from model.member.email_verification import EmailVerification
     from model.diary.diary import Diary
     from model.diary.diary_image import DiaryImage
-    
+    from model.member.revoked_token import RevokedToken
+    from model.member.email_outbox import EmailOutbox
+
     Base.metadata.create_all(bind=engine)
\ No newline at end of file
@@ -0,0 +1,170 @@
+import asyncio
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from config.logger import get_logger
+from util.metrics import Histogram
+
+logger = get_logger(__name__)
+
+
+class PoolMetrics:
+    """커넥션 풀 지표 (체크아웃 대기 시간, 점유 시간)"""
+
+    def __init__(self):
+        self.checkout_wait = Histogram("db_pool_checkout_wait_seconds")
+        self.hold = Histogram("db_pool_hold_seconds")
+        self.checkout_timeouts = 0
+
+    def snapshot(self) -> dict:
+        return {
+            "checkout_wait": self.checkout_wait.snapshot(),
+            "hold": self.hold.snapshot(),
+            "checkout_timeouts": self.checkout_timeouts,
+        }
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """커넥션을 얻기까지 걸린 시간(대기 + 연결 + pre-ping)을 기록하는 풀"""
+
+    # 풀 로그는 기본 풀과 같은 sqlalchemy 로거 계층을 사용 (루트 로거 DEBUG 설정의 영향 방지)
+    _sqla_logger_namespace = "sqlalchemy.pool.impl.AsyncAdaptedQueuePool"
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            pool_metrics.checkout_timeouts += 1
+            raise
+        finally:
+            pool_metrics.checkout_wait.observe(time.perf_counter() - started)
+
+
+def instrument_pool(engine: Engine) -> None:
+    """풀 이벤트로 커넥션 점유 시간(checkout -> checkin)을 수집합니다."""
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checked_out_at"] = time.perf_counter()
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            pool_metrics.hold.observe(time.perf_counter() - checked_out_at)
+
+
+class StatementCounter:
+    """범위 안에서 실행된 SQL 문장/커밋 수"""
+
+    def __init__(self):
+        self.statements = 0
+        self.commits = 0
+
+
+_statement_counter: ContextVar[Optional[StatementCounter]] = ContextVar("statement_counter", default=None)
+
+
+@contextmanager
+def count_statements() -> Iterator[StatementCounter]:
+    """with 블록 안에서 실행된 SQL 문장과 커밋 수를 셉니다. (벤치마크/테스트용)"""
+    counter = StatementCounter()
+    token = _statement_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _statement_counter.reset(token)
+
+
+def instrument_statements(engine: Engine) -> None:
+    """커넥션 이벤트로 SQL 실행/커밋 횟수를 집계합니다."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _on_execute(conn, cursor, statement, parameters, context, executemany):
+        counter = _statement_counter.get()
+        if counter is not None:
+            counter.statements += 1
+
+    @event.listens_for(engine, "commit")
+    def _on_commit(conn):
+        counter = _statement_counter.get()
+        if counter is not None:
+            counter.commits += 1
+
+
+def describe_route(request: Request) -> str:
+    """로그에 남길 라우트 식별자 (METHOD /path/{param})"""
+    route = request.scope.get("route")
+    path = getattr(route, "path", None) or request.url.path
+    return f"{request.method} {path}"
+
+
+class SessionLeakDetector:
+    """
+    디버그용 세션 누수 감지기
+    - 반환 시점에 임계값보다 오래 점유한 세션의 라우트를 기록합니다.
+    - 주기적으로 아직 반환되지 않은 채 임계값을 넘긴 세션을 기록합니다.
+    """
+
+    def __init__(self, threshold_seconds: float):
+        self.threshold_seconds = threshold_seconds
+        self._open: dict[int, tuple[str, float]] = {}
+        self._reported: set[int] = set()
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+
+    def acquire(self, route: str) -> int:
+        token = next(self._ids)
+        with self._lock:
+            self._open[token] = (route, time.monotonic())
+        return token
+
+    def release(self, token: int) -> None:
+        with self._lock:
+            route, started = self._open.pop(token, (None, None))
+            self._reported.discard(token)
+        if route is None:
+            return
+        held = time.monotonic() - started
+        if held > self.threshold_seconds:
+            logger.warning(f"세션 장기 점유 - 경로: {route}, 점유 시간: {held:.2f}s")
+
+    def scan(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            stale = [
+                (token, route, now - started)
+                for token, (route, started) in self._open.items()
+                if now - started > self.threshold_seconds and token not in self._reported
+            ]
+            self._reported.update(token for token, _, _ in stale)
+        for _, route, held in stale:
+            logger.warning(f"반환되지 않은 세션 감지 - 경로: {route}, 경과 시간: {held:.2f}s")
+
+    def snapshot(self) -> list[dict]:
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {"route": route, "held_seconds": round(now - started, 3)}
+                for route, started in self._open.values()
+            ]
+
+    async def watch(self, interval_seconds: Optional[float] = None) -> None:
+        interval = interval_seconds or max(self.threshold_seconds / 2, 1.0)
+        while True:
+            await asyncio.sleep(interval)
+            self.scan()
@@ -12,10 +12,16 @@ class EmailConfig:
     MAIL_FROM = os.getenv("MAIL_FROM")
     MAIL_SERVER = os.getenv("MAIL_SERVER", "smtp.gmail.com")
     MAIL_PORT = int(os.getenv("MAIL_PORT", 587))
+    MAIL_STARTTLS = os.getenv("MAIL_STARTTLS", "true").lower() == "true"
+    # 접속부터 TLS를 사용하는 SMTPS(보통 465 포트) - MAIL_STARTTLS와 함께 켤 수 없음
+    MAIL_SSL_TLS = os.getenv("MAIL_SSL_TLS", "false").lower() == "true"
+    MAIL_USE_CREDENTIALS = os.getenv("MAIL_USE_CREDENTIALS", "true").lower() == "true"
     
     # 인증코드 설정
     VERIFICATION_CODE_LENGTH = int(os.getenv("VERIFICATION_CODE_LENGTH", 6))
     VERIFICATION_CODE_EXPIRE_MINUTES = int(os.getenv("VERIFICATION_CODE_EXPIRE_MINUTES", 10))
+    # 인증 완료 후 이 시간 안에 가입하지 않으면 다시 인증해야 함 (정리 작업이 이후 인증 레코드를 삭제)
+    VERIFICATION_VERIFIED_RETENTION_HOURS = float(os.getenv("VERIFICATION_VERIFIED_RETENTION_HOURS", 24))
     
     # Rate Limiting 설정
     MAX_VERIFICATION_ATTEMPTS = int(os.getenv("MAX_VERIFICATION_ATTEMPTS", 3))
@@ -42,9 +48,9 @@ class EmailConfig:
     @classmethod
     def validate_config(cls):
         """설정값 검증"""
-        required_fields = [
-            "MAIL_USERNAME", "MAIL_PASSWORD", "MAIL_FROM"
-        ]
+        required_fields = ["MAIL_FROM"]
+        if cls.MAIL_USE_CREDENTIALS:
+            required_fields += ["MAIL_USERNAME", "MAIL_PASSWORD"]
         
         missing_fields = []
         for field in required_fields:
@@ -54,6 +60,9 @@ class EmailConfig:
         if missing_fields:
             raise ValueError(f"필수 이메일 설정이 누락되었습니다: {', '.join(missing_fields)}")
         
+        if cls.MAIL_STARTTLS and cls.MAIL_SSL_TLS:
+            raise ValueError("MAIL_STARTTLS와 MAIL_SSL_TLS는 동시에 사용할 수 없습니다")
+        
         # 설정값 범위 검증
         if cls.VERIFICATION_CODE_LENGTH < 4 or cls.VERIFICATION_CODE_LENGTH > 8:
             raise ValueError("인증코드 길이는 4-8자 사이여야 합니다")
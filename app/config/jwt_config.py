@@ -3,6 +3,8 @@ from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 import os
+import uuid
+from dto.auth_dto import MemberInfoDTO
 
 # JWT 설정
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY")
@@ -13,6 +15,10 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 REFRESH_TOKEN_EXPIRE_DAYS = 7
 
+# 액세스 토큰에 회원 정보(id, nickname, role, created_at)를 담아 인증 시 DB 조회를 생략
+# 회원 정보 변경은 토큰 갱신(/auth/refresh) 시점에 반영됩니다.
+STATELESS_ACCESS_TOKEN = os.getenv("STATELESS_ACCESS_TOKEN", "false").lower() == "true"
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 def get_password_hash(password: str) -> str:
@@ -28,6 +34,35 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     encoded_jwt = jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+def access_token_claims(member: MemberInfoDTO, refresh_jti: Optional[str] = None) -> dict:
+    """
+    액세스 토큰에 담을 클레임 (stateless 모드에서는 회원 정보 포함)
+    리프레시 토큰 쿠키는 /auth/refresh에만 전송되므로, 로그아웃 시 함께 폐기할 수 있도록 rjti로 연결합니다.
+    """
+    claims = {"sub": member.email, "jti": str(uuid.uuid4())}
+    if refresh_jti:
+        claims["rjti"] = refresh_jti
+    if STATELESS_ACCESS_TOKEN:
+        claims.update({
+            "id": str(member.id),
+            "nickname": member.nickname,
+            "role": member.role,
+            "created_at": member.created_at.isoformat(),
+        })
+    return claims
+
+def member_from_claims(payload: dict) -> Optional[MemberInfoDTO]:
+    """stateless 모드의 액세스 토큰이면 클레임만으로 회원 정보를 구성합니다."""
+    if not STATELESS_ACCESS_TOKEN or "id" not in payload:
+        return None
+    return MemberInfoDTO(
+        id=payload["id"],
+        email=payload["sub"],
+        nickname=payload["nickname"],
+        role=payload["role"],
+        created_at=payload["created_at"],
+    )
+
 def create_refresh_token(data: dict) -> str:
     to_encode = data.copy()
     expire = datetime.now(UTC) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
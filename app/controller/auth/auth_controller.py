@@ -1,34 +1,41 @@
-from fastapi import APIRouter, HTTPException, status, Response, Depends, Form, Cookie
-from datetime import timedelta
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, status, Request, Response, Depends, Form, Cookie
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
 
 from config.jwt_config import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
+    REFRESH_TOKEN_EXPIRE_DAYS,
+    access_token_claims,
     create_access_token,
     create_refresh_token,
     verify_refresh_token,
+    verify_token,
 )
 from dto.member_dto import CreateMemberRequestDTO, CreateMemberResponseDTO
 from service.member.member_service import MemberService
-from service.email.email_service import EmailService
-from dependencies.auth_dependencies import get_current_member, oauth2_scheme
+from service.member.member_cache import member_cache, to_member_info
+from service.member.login_throttle import check_login_attempt
+from service.member.token_revocation import token_revocation
+from dependencies.auth_dependencies import get_current_member, oauth2_scheme, optional_oauth2_scheme
 from config.database import get_db
 from config.logger import get_logger
 from model.member.member import Member
+from dao.member.member_dao import MemberDAO
 from dto.auth_dto import MemberInfoDTO
+from util.hash_util import HashingSaturatedError
+from util.rate_limiter import retry_after_header
 
 router = APIRouter()
 logger = get_logger(__name__)
 
 @router.post("/auth/signup", response_model=CreateMemberResponseDTO, status_code=status.HTTP_201_CREATED)
-async def signup(member: CreateMemberRequestDTO, db: Session = Depends(get_db)):
+async def signup(member: CreateMemberRequestDTO, db: AsyncSession = Depends(get_db)):
     """
     회원가입 API (이메일 인증 필요)
     """
     logger.info(f"회원가입 시도 - 이메일: {member.email}")
     member_service = MemberService(db)
-    email_service = EmailService(db)
     
     try:
         # 비밀번호 검증
@@ -38,28 +45,32 @@ async def signup(member: CreateMemberRequestDTO, db: Session = Depends(get_db)):
                 detail="비밀번호는 최소 8자 이상이며, 대문자, 소문자, 숫자, 특수문자 중 3가지 이상을 포함해야 합니다"
             )
         
+        # 이메일/닉네임 중복과 이메일 인증 상태를 한 번의 쿼리로 확인
+        # (동시 가입으로 이 확인을 통과한 중복은 INSERT 시 유니크 제약에서 걸러짐)
+        signup_check = await member_service.check_signup(member.email, member.nickname)
+
         # 이메일 중복 체크
-        if member_service.get_member_by_email(member.email):
+        if signup_check.email_taken:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="이미 가입된 이메일입니다"
             )
         
         # 닉네임 중복 체크
-        if member_service.get_member_by_nickname(member.nickname):
+        if signup_check.nickname_taken:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="이미 사용 중인 닉네임입니다"
             )
         
         # 이메일 인증 상태 확인
-        if not email_service.is_email_verified(member.email):
+        if not signup_check.email_verified:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="이메일 인증이 필요합니다. 먼저 이메일 인증을 완료해주세요"
             )
         
-        created_member = member_service.register_member(
+        created_member = await member_service.register_member(
             email=member.email,
             password=member.password,
             nickname=member.nickname
@@ -81,6 +92,13 @@ async def signup(member: CreateMemberRequestDTO, db: Session = Depends(get_db)):
             updated_at=created_member.updated_at
         )
         
+    except HashingSaturatedError as e:
+        logger.warning(f"회원가입 거부 - 해싱 대기열 포화: {member.email}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        )
     except ValueError as e:
         logger.error(f"회원가입 중 검증 오류 발생: {str(e)}")
         raise HTTPException(
@@ -98,18 +116,38 @@ async def signup(member: CreateMemberRequestDTO, db: Session = Depends(get_db)):
 
 @router.post("/auth/login", response_model=None)
 async def login(
+    request: Request,
     email: str = Form(...),
     password: str = Form(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     response: Response = None
 ):
     """
     로그인 API
     """
     logger.info(f"로그인 시도 - 이메일: {email}")
+
+    # DB 조회와 bcrypt 검증 전에 이메일/IP별 시도 횟수 제한
+    retry_after = check_login_attempt(email, request.client.host if request.client else None)
+    if retry_after:
+        logger.warning(f"로그인 거부 - 시도 횟수 초과: {email}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="로그인 시도가 너무 많습니다. 잠시 후 다시 시도해주세요",
+            headers=retry_after_header(retry_after),
+        )
+
     member_service = MemberService(db)
     
-    member = member_service.login(email, password)
+    try:
+        member = await member_service.login(email, password)
+    except HashingSaturatedError as e:
+        logger.warning(f"로그인 거부 - 해싱 대기열 포화: {email}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        )
     if not member:
         logger.warning(f"로그인 실패 - 이메일: {email}")
         raise HTTPException(
@@ -118,14 +156,15 @@ async def login(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    refresh_jti = str(uuid.uuid4())
+    refresh_token = create_refresh_token(
+        data={"sub": member.email, "jti": refresh_jti}  # JWT ID 추가
+    )
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": member.email, "jti": str(uuid.uuid4())},  # JWT ID 추가
+        data=access_token_claims(to_member_info(member), refresh_jti),  # JWT ID(및 stateless 모드의 회원 클레임) 포함
         expires_delta=access_token_expires
     )
-    refresh_token = create_refresh_token(
-        data={"sub": member.email, "jti": str(uuid.uuid4())}  # JWT ID 추가
-    )
     
     logger.info(f"로그인 성공 - 이메일: {email}")
     response.set_cookie(
@@ -150,7 +189,8 @@ async def login(
 @router.post("/auth/refresh")
 async def refresh_token(
     response: Response,
-    refresh_token: str = Cookie(None)
+    refresh_token: str = Cookie(None),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     액세스 토큰 갱신 API
@@ -164,26 +204,51 @@ async def refresh_token(
         )
     
     payload = verify_refresh_token(refresh_token)
-    if not payload:
+    if not payload or (payload.get("jti") and await token_revocation.is_revoked(db, payload["jti"])):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="유효하지 않은 리프레시 토큰입니다"
         )
     
+    # 토큰에 담을 회원 정보는 갱신 시점에 primary에서 다시 읽음
+    member = await MemberDAO(db).get_member_by_email(payload["sub"], use_replica=False)
+    if member is None:
+        logger.warning(f"토큰 갱신 실패 - 존재하지 않는 회원: {payload['sub']}")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="유효하지 않은 리프레시 토큰입니다"
+        )
+
+    member_info = to_member_info(member)
+    member_cache.set(member_info.email, member_info)
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": payload["sub"]}, expires_delta=access_token_expires
+        data=access_token_claims(member_info, payload.get("jti")), expires_delta=access_token_expires
     )
     
     response.headers["Authorization"] = f"Bearer {access_token}"
     return {"message": "토큰이 갱신되었습니다"}
 
 @router.post("/auth/logout")
-async def logout(response: Response):
+async def logout(
+    response: Response,
+    token: str = Depends(optional_oauth2_scheme),
+    db: AsyncSession = Depends(get_db)
+):
     """
     로그아웃 API
+    액세스 토큰과 연결된 리프레시 토큰(rjti)을 함께 폐기합니다.
     """
     logger.info("로그아웃 요청 처리")
+    payload = verify_token(token) if token else None
+    if payload and payload.get("jti"):
+        await token_revocation.revoke(db, payload["jti"], datetime.fromtimestamp(payload["exp"], timezone.utc))
+        if payload.get("rjti"):
+            # 리프레시 토큰 만료 시각은 알 수 없으므로 최대 수명으로 보관
+            await token_revocation.revoke(
+                db, payload["rjti"], datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+            )
+        logger.info(f"토큰 폐기 완료 - 이메일: {payload.get('sub')}")
     response.delete_cookie("refresh_token")
     return {"message": "로그아웃되었습니다"}
 
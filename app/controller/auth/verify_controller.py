@@ -1,8 +1,12 @@
-from fastapi import APIRouter, HTTPException, status, Depends, BackgroundTasks
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, status, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from config.database import get_db
 from config.logger import get_logger
+from config.email_config import EmailConfig
 from service.email.email_service import EmailService
+from service.email.outbox_worker import outbox_worker
+from service.email.verification_throttle import check_verification_send
+from util.rate_limiter import retry_after_header
 from dto.email_verification_dto import (
     SendVerificationCodeRequestDTO,
     SendVerificationCodeResponseDTO,
@@ -34,8 +38,7 @@ def validate_verification_code(code: str) -> bool:
 @router.post("/email/send-verification", response_model=SendVerificationCodeResponseDTO)
 async def send_verification_code(
     request: SendVerificationCodeRequestDTO,
-    background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     이메일 인증코드 발송 API
@@ -54,23 +57,28 @@ async def send_verification_code(
     
     logger.info(f"이메일 형식 검증 통과: {request.email}")
     
+    # 발송 횟수 제한 - DB 조회/쓰기 전에 메모리에서 확인
+    retry_after = check_verification_send(request.email)
+    if retry_after:
+        logger.warning(f"인증코드 발송 거부 - 발송 횟수 초과: {request.email}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=EmailConfig.get_rate_limit_message(),
+            headers=retry_after_header(retry_after),
+        )
+    
     try:
         logger.info("EmailService 인스턴스 생성 시작")
         email_service = EmailService(db)
         logger.info("EmailService 인스턴스 생성 완료")
         
-        # 인증 레코드 생성
+        # 인증 레코드 생성 (인증 메일은 같은 트랜잭션에서 발송 대기열에 기록)
         logger.info("인증 레코드 생성 시작")
-        verification = email_service.create_verification_record(request.email)
+        verification = await email_service.create_verification_record(request.email)
         logger.info(f"인증 레코드 생성 완료 - ID: {verification.id}, 코드: {verification.verification_code}")
         
-        # 백그라운드에서 이메일 발송 (응답 속도 향상)
-        logger.info("백그라운드 이메일 발송 작업 추가")
-        background_tasks.add_task(
-            email_service.send_verification_email,
-            request.email, 
-            verification.verification_code
-        )
+        # 커밋된 메일을 발송 워커가 바로 처리하도록 알림
+        outbox_worker.notify()
         
         logger.info(f"인증코드 발송 성공 - 이메일: {request.email}")
         return SendVerificationCodeResponseDTO(
@@ -100,7 +108,7 @@ async def send_verification_code(
 @router.post("/email/verify-code", response_model=VerifyCodeResponseDTO)
 async def verify_code(
     request: VerifyCodeRequestDTO,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     이메일 인증코드 검증 API
@@ -133,7 +141,7 @@ async def verify_code(
         
         # 인증코드 검증
         logger.info("인증코드 검증 시작")
-        is_verified = email_service.verify_code(request.email, request.verification_code)
+        is_verified = await email_service.verify_code(request.email, request.verification_code)
         logger.info(f"인증코드 검증 결과: {is_verified}")
         
         if not is_verified:
@@ -166,7 +174,7 @@ async def verify_code(
 @router.get("/email/verification-status/{email}")
 async def check_verification_status(
     email: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     이메일 인증 상태 확인 API
@@ -190,7 +198,7 @@ async def check_verification_status(
         logger.info("EmailService 인스턴스 생성 완료")
         
         logger.info("인증 상태 확인 시작")
-        is_verified = email_service.is_email_verified(email)
+        is_verified = await email_service.is_email_verified(email)
         logger.info(f"인증 상태 확인 결과: {is_verified}")
         
         result = {
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Form, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Form, Query, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from dto.diary_dto import SaveDiaryResponseDTO, GetDiaryResponseDTO
-from config.database import get_db
+from config.database import get_db, tracked_session
+from config.db_monitor import describe_route
 from service.diary.diary_service import DiaryService
-from fastapi.responses import Response, JSONResponse
+from fastapi.responses import Response, JSONResponse, StreamingResponse
 from typing import Optional
 from dependencies.auth_dependencies import get_current_member
 from dto.auth_dto import MemberInfoDTO
@@ -13,10 +14,77 @@ router = APIRouter(prefix="/diary")
 logger = get_logger(__name__)
 
 
+@router.get("", response_model=list[GetDiaryResponseDTO])
+async def get_diaries(
+    from_yyyymmdd: str = Query(..., alias="from"),
+    to_yyyymmdd: str = Query(..., alias="to"),
+    db: AsyncSession = Depends(get_db),
+    current_member: MemberInfoDTO = Depends(get_current_member)
+):
+    """
+    기간(from ~ to, YYYYMMDD) 내의 다이어리를 날짜순으로 조회합니다.
+    """
+    logger.info(f"다이어리 기간 조회 요청 - 기간: {from_yyyymmdd}~{to_yyyymmdd}, 사용자: {current_member.email}")
+    diary_service = DiaryService(db)
+
+    try:
+        diaries = await diary_service.get_diaries(from_yyyymmdd, to_yyyymmdd, current_member.id)
+        return [
+            GetDiaryResponseDTO(
+                id=diary.id,
+                yyyymmdd=diary.yyyymmdd,
+                content=diary.content,
+                image_ids=diary.image_ids
+            )
+            for diary in diaries
+        ]
+    except ValueError as e:
+        logger.error(f"다이어리 기간 조회 중 유효성 검사 오류: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error(f"다이어리 기간 조회 중 예상치 못한 오류: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="다이어리 조회 중 오류가 발생했습니다."
+        )
+
+
+@router.get("/export")
+async def export_diaries(
+    request: Request,
+    current_member: MemberInfoDTO = Depends(get_current_member)
+):
+    """
+    현재 사용자의 전체 다이어리를 NDJSON으로 스트리밍합니다.
+    """
+    logger.info(f"다이어리 내보내기 요청 - 사용자: {current_member.email}")
+    member_id = current_member.id
+    route = describe_route(request)
+
+    async def generate():
+        # yield 의존성(get_db)은 응답 전송 전에 정리되므로 스트리밍 동안 사용할 세션을 직접 엽니다.
+        async with tracked_session(route) as db:
+            try:
+                async for line in DiaryService(db).export_diaries(member_id):
+                    yield line
+            except Exception as e:
+                logger.error(f"다이어리 내보내기 중 예상치 못한 오류: {str(e)}")
+                raise
+
+    return StreamingResponse(
+        generate(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="diaries.ndjson"'}
+    )
+
+
 @router.get("/{yyyymmdd}", response_model=Optional[GetDiaryResponseDTO])
 async def get_diary(
     yyyymmdd: str, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_member: MemberInfoDTO = Depends(get_current_member)
 ):
     """
@@ -26,7 +94,7 @@ async def get_diary(
     diary_service = DiaryService(db)
     
     try:
-        diary = diary_service.get_diary(yyyymmdd, current_member.id)
+        diary = await diary_service.get_diary(yyyymmdd, current_member.id)
         if diary is None:
             return None
 
@@ -55,7 +123,7 @@ async def upsert_diary(
     yyyymmdd: str = Form(...),
     content: str = Form(...),
     images: list[UploadFile] = File(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_member: MemberInfoDTO = Depends(get_current_member)
 ):
     """
@@ -89,7 +157,7 @@ async def upsert_diary(
 @router.get("/image/{diary_image_id}")
 async def get_diary_image(
     diary_image_id: str, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_member: MemberInfoDTO = Depends(get_current_member)
 ):
     """
@@ -99,7 +167,7 @@ async def get_diary_image(
     diary_service = DiaryService(db)
     
     try:
-        image_data, extension = diary_service.get_diary_image(diary_image_id, current_member.id)
+        image_data, extension = await diary_service.get_diary_image(diary_image_id, current_member.id)
         return Response(
             content=image_data,
             media_type=f"image/{extension}",
@@ -0,0 +1,105 @@
+from fastapi import APIRouter, Depends
+
+from config.database import async_engine, replica_engine, session_leak_detector
+from config.db_monitor import pool_metrics
+from config.logger import get_logger
+from dependencies.auth_dependencies import get_current_admin
+from service.email.mail_client import mail_client
+from service.email.outbox_worker import outbox_worker
+from service.email.verification_purge import verification_purge
+from service.email.verification_throttle import verification_limiter
+from service.email.verified_email_cache import verified_email_cache
+from service.member.login_throttle import login_limiter_by_email, login_limiter_by_ip
+from service.member.member_cache import member_cache
+from service.member.token_revocation import token_revocation
+from util.file_io import file_io_executor
+from util.hash_util import HashUtil, hash_executor
+
+# 내부 운영 지표(회원 이메일, 라우트, 풀 상태 등)를 노출하므로 관리자만 조회 가능
+router = APIRouter(prefix="/monitor", dependencies=[Depends(get_current_admin)])
+logger = get_logger(__name__)
+
+
+def _pool_status(pool) -> dict:
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+
+
+@router.get("/db-pool")
+async def get_db_pool_status():
+    """
+    커넥션 풀 상태 및 체크아웃 대기/점유 시간 분포를 조회합니다.
+    """
+    return {
+        "pool": _pool_status(async_engine.pool),
+        "replica_pool": _pool_status(replica_engine.pool) if replica_engine is not async_engine else None,
+        "metrics": pool_metrics.snapshot(),
+        "open_sessions": session_leak_detector.snapshot() if session_leak_detector else None,
+    }
+
+
+@router.get("/hashing")
+async def get_hashing_status():
+    """
+    비밀번호 해싱 스레드 풀의 대기열 상태와 대기/처리 시간 분포, 현재 bcrypt cost를 조회합니다.
+    """
+    return {**hash_executor.snapshot(), "rounds": HashUtil.rounds}
+
+
+@router.get("/file-io")
+async def get_file_io_status():
+    """
+    이미지 파일 I/O 스레드 풀의 사용 현황과 작업별 대기/처리 시간 분포, 읽고 쓴 바이트 수를 조회합니다.
+    """
+    return file_io_executor.snapshot()
+
+
+@router.get("/cache")
+async def get_cache_status():
+    """
+    프로세스 내 캐시의 크기와 적중/실패 횟수를 조회합니다.
+    """
+    return {
+        "member": member_cache.snapshot(),
+        "verified_email": verified_email_cache.snapshot(),
+    }
+
+
+@router.get("/revocation")
+async def get_revocation_status():
+    """
+    토큰 폐기 목록(블룸 필터) 상태와 필터 적중/오탐 횟수를 조회합니다.
+    """
+    return token_revocation.snapshot()
+
+
+@router.get("/rate-limit")
+async def get_rate_limit_status():
+    """
+    요청 횟수 제한기의 추적 키 수와 허용/거부 횟수를 조회합니다.
+    """
+    return {
+        "login_email": login_limiter_by_email.snapshot(),
+        "login_ip": login_limiter_by_ip.snapshot(),
+        "verification_email": verification_limiter.snapshot(),
+    }
+
+
+@router.get("/mail")
+async def get_mail_status():
+    """
+    SMTP 커넥션 풀 상태와 발송 건수, 발송 시간 분포, 발송 대기열 워커 처리 현황을 조회합니다.
+    """
+    return {**mail_client.snapshot(), "outbox": outbox_worker.snapshot()}
+
+
+@router.get("/purge")
+async def get_purge_status():
+    """
+    인증 레코드/발송 완료 메일 정리 작업의 실행 횟수와 종류별 삭제 건수를 조회합니다.
+    """
+    return verification_purge.snapshot()
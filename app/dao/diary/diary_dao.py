@@ -1,33 +1,85 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from model.diary.diary import Diary
+from datetime import date, datetime, UTC
 import uuid
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 class DiaryDAO:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         
-    def save(self, diary: Diary) -> Diary:
-        try:
-            self.db.add(diary)
-            self.db.commit()
-            self.db.refresh(diary)
-            return diary
-        except Exception as e:
-            self.db.rollback()
-            raise e
+    async def save(self, diary: Diary) -> Diary:
+        self.db.add(diary)
+        await self.db.flush()
+        return diary
+
+    async def upsert(self, member_id: uuid.UUID, yyyymmdd: str, content: str, image_ids: list[uuid.UUID]) -> Diary:
+        """
+        (yyyymmdd, member_id) 기준으로 일기를 한 번의 INSERT ... ON CONFLICT DO UPDATE로 저장합니다.
+        동시에 같은 날짜를 저장해도 유니크 제약 위반 없이 마지막 요청이 반영됩니다.
+        """
+        statement = insert(Diary).values(
+            member_id=member_id,
+            yyyymmdd=yyyymmdd,
+            content=content,
+            image_ids=image_ids,
+        )
+        statement = statement.on_conflict_do_update(
+            constraint="uix_diary_date_member",
+            set_={
+                "content": statement.excluded.content,
+                "image_ids": statement.excluded.image_ids,
+                "updated_at": datetime.now(UTC).replace(tzinfo=None),
+            },
+        ).returning(Diary)
+
+        result = await self.db.execute(statement, execution_options={"populate_existing": True})
+        return result.scalars().one()
             
-    def find_by_ids(self, ids: list[uuid.UUID]) -> Optional[Diary]:
-        return self.db.query(Diary).filter(Diary.id.in_(ids)).all()
+    async def find_by_ids(self, ids: list[uuid.UUID]) -> list[Diary]:
+        result = await self.db.execute(select(Diary).filter(Diary.id.in_(ids)))
+        return result.scalars().all()
         
-    def find_by_yyyymmdd(self, member_id: uuid.UUID, yyyymmdd: str) -> Optional[Diary]:
-        return self.db.query(Diary).filter(Diary.member_id == member_id, Diary.yyyymmdd == yyyymmdd).first()
+    async def find_by_yyyymmdd(self, member_id: uuid.UUID, yyyymmdd: str, use_replica: bool = True) -> Optional[Diary]:
+        result = await self.db.execute(
+            select(Diary).
+            filter(Diary.member_id == member_id, Diary.yyyymmdd == yyyymmdd).
+            execution_options(use_replica=use_replica)
+        )
+        return result.scalars().first()
+        
+    async def find_by_date_range(self, member_id: uuid.UUID, start_date: date, end_date: date, use_replica: bool = True) -> list[Diary]:
+        """(member_id, diary_date) 복합 인덱스 범위 조회"""
+        result = await self.db.execute(
+            select(Diary).
+            filter(Diary.member_id == member_id, Diary.diary_date.between(start_date, end_date)).
+            order_by(Diary.diary_date).
+            execution_options(use_replica=use_replica)
+        )
+        return result.scalars().all()
+
+    async def stream_by_member(self, member_id: uuid.UUID, batch_size: int = 500, use_replica: bool = True) -> AsyncIterator[Diary]:
+        """
+        회원의 전체 일기를 서버 사이드 커서로 batch_size개씩 가져옵니다.
+        전체 결과를 메모리에 올리지 않으므로 일기 수와 무관하게 메모리 사용량이 일정합니다.
+        """
+        result = await self.db.stream_scalars(
+            select(Diary).
+            filter(Diary.member_id == member_id).
+            order_by(Diary.diary_date).
+            execution_options(yield_per=batch_size, use_replica=use_replica)
+        )
+        async for diary in result:
+            yield diary
         
-    def delete(self, diary_id: uuid.UUID) -> None:
-        diary = self.find_by_id(diary_id)
+    async def delete(self, diary_id: uuid.UUID) -> None:
+        diary = await self.find_by_id(diary_id)
         if diary:
-            self.db.delete(diary)
-            self.db.commit()
+            await self.db.delete(diary)
+            await self.db.flush()
 
-    def find_by_id(self, diary_id: uuid.UUID) -> Optional[Diary]:
-        return self.db.query(Diary).filter(Diary.id == diary_id).first()
+    async def find_by_id(self, diary_id: uuid.UUID) -> Optional[Diary]:
+        result = await self.db.execute(select(Diary).filter(Diary.id == diary_id))
+        return result.scalars().first()
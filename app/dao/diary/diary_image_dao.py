@@ -1,50 +1,77 @@
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from model.diary.diary_image import DiaryImage
 import uuid
 from typing import Optional
 
 class DiaryImageDAO:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         
-    def save(self, diary_image: DiaryImage) -> DiaryImage:
-        try:
-            self.db.add(diary_image)
-            self.db.commit()
-            self.db.refresh(diary_image)
-            return diary_image
-        except Exception as e:
-            self.db.rollback()
-            raise e
-
-    def save_all(self, diary_images: list[DiaryImage]) -> list[DiaryImage]:
-        try:
-            self.db.add_all(diary_images)
-            self.db.commit()
-            for diary_image in diary_images:
-                self.db.refresh(diary_image)
-            return diary_images
-        except Exception as e:
-            self.db.rollback()
-            raise e
-
-    def find_by_id(self, diary_image_id: uuid.UUID) -> Optional[DiaryImage]:
-        return self.db.query(DiaryImage).filter(DiaryImage.id == diary_image_id).first()
-
-    def find_by_id_with_diary(self, diary_image_id: uuid.UUID) -> Optional[DiaryImage]:
-        return self.db.query(DiaryImage).\
-            options(joinedload(DiaryImage.diary)).\
-            filter(DiaryImage.id == diary_image_id).\
-            first()
-
-    def find_by_ids(self, diary_image_ids: list[uuid.UUID]) -> list[DiaryImage]:
-        return self.db.query(DiaryImage).filter(DiaryImage.id.in_(diary_image_ids)).all()
-
-    def find_by_diary_id(self, diary_id: uuid.UUID) -> list[DiaryImage]:
-        return self.db.query(DiaryImage).filter(DiaryImage.diary_id == diary_id).all()
+    async def save(self, diary_image: DiaryImage) -> DiaryImage:
+        self.db.add(diary_image)
+        await self.db.flush()
+        return diary_image
+
+    async def save_all(self, diary_images: list[DiaryImage]) -> list[DiaryImage]:
+        """
+        이미지 메타데이터를 단일 INSERT ... VALUES (...), (...) RETURNING 문으로 일괄 저장합니다.
+        """
+        if not diary_images:
+            return []
+
+        rows = [
+            {
+                "id": diary_image.id,
+                "diary_id": diary_image.diary_id,
+                "file_name": diary_image.file_name,
+                "extension": diary_image.extension,
+                "base_path": diary_image.base_path,
+            }
+            for diary_image in diary_images
+        ]
+        result = await self.db.scalars(insert(DiaryImage).returning(DiaryImage), rows)
+        return result.all()
+
+    async def find_by_id(self, diary_image_id: uuid.UUID, use_replica: bool = True) -> Optional[DiaryImage]:
+        result = await self.db.execute(
+            select(DiaryImage).
+            filter(DiaryImage.id == diary_image_id).
+            execution_options(use_replica=use_replica)
+        )
+        return result.scalars().first()
+
+    async def find_by_id_with_diary(self, diary_image_id: uuid.UUID) -> Optional[DiaryImage]:
+        result = await self.db.execute(
+            select(DiaryImage).
+            options(joinedload(DiaryImage.diary)).
+            filter(DiaryImage.id == diary_image_id)
+        )
+        return result.scalars().first()
+
+    async def find_by_ids(self, diary_image_ids: list[uuid.UUID]) -> list[DiaryImage]:
+        result = await self.db.execute(select(DiaryImage).filter(DiaryImage.id.in_(diary_image_ids)))
+        return result.scalars().all()
+
+    async def find_by_diary_id(self, diary_id: uuid.UUID) -> list[DiaryImage]:
+        result = await self.db.execute(select(DiaryImage).filter(DiaryImage.diary_id == diary_id))
+        return result.scalars().all()
         
-    def delete(self, diary_image_id: uuid.UUID) -> None:
-        diary_image = self.find_by_id(diary_image_id)
+    async def delete_by_diary_id(self, diary_id: uuid.UUID) -> list[DiaryImage]:
+        """
+        일기에 연결된 이미지 메타데이터를 단일 DELETE ... RETURNING 문으로 지우고, 지운 행을 반환합니다.
+        파일은 지우지 않으므로 커밋 후 반환된 행의 경로로 직접 지워야 합니다.
+        """
+        result = await self.db.scalars(
+            delete(DiaryImage).
+            filter(DiaryImage.diary_id == diary_id).
+            returning(DiaryImage)
+        )
+        return result.all()
+
+    async def delete(self, diary_image_id: uuid.UUID) -> None:
+        diary_image = await self.find_by_id(diary_image_id, use_replica=False)
         if diary_image:
-            self.db.delete(diary_image)
-            self.db.commit()
+            await self.db.delete(diary_image)
+            await self.db.flush()
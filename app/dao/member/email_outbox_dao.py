@@ -0,0 +1,87 @@
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import func
+from model.member.email_outbox import EmailOutbox, OutboxStatus
+from datetime import datetime, timedelta
+from typing import Optional
+import uuid
+
+class EmailOutboxDAO:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def enqueue(self, recipient: str, subject: str, body: str) -> EmailOutbox:
+        outbox = EmailOutbox(recipient=recipient, subject=subject, body=body)
+        self.db.add(outbox)
+        await self.db.flush()
+        return outbox
+
+    async def claim_batch(self, batch_size: int, lease_seconds: float) -> list:
+        """
+        발송할 메일을 최대 batch_size건 가져오면서 임대 시간만큼 다음 발송 시각을 미룹니다.
+        다른 워커가 잠근 행은 건너뛰며, 발송 도중 워커가 죽으면 임대가 끝난 뒤 다시 발송 대상이 됩니다.
+        """
+        due = (
+            select(EmailOutbox.id).
+            filter(EmailOutbox.status == OutboxStatus.PENDING, EmailOutbox.next_attempt_at <= func.now()).
+            order_by(EmailOutbox.next_attempt_at).
+            limit(batch_size).
+            with_for_update(skip_locked=True)
+        )
+        result = await self.db.execute(
+            update(EmailOutbox).
+            filter(EmailOutbox.id.in_(due)).
+            values(
+                attempts=EmailOutbox.attempts + 1,
+                next_attempt_at=func.now() + timedelta(seconds=lease_seconds),
+            ).
+            returning(EmailOutbox.id, EmailOutbox.recipient, EmailOutbox.subject, EmailOutbox.body, EmailOutbox.attempts).
+            execution_options(synchronize_session=False)
+        )
+        return result.all()
+
+    async def mark_sent(self, outbox_ids: list[uuid.UUID]) -> None:
+        await self.db.execute(
+            update(EmailOutbox).
+            filter(EmailOutbox.id.in_(outbox_ids)).
+            values(status=OutboxStatus.SENT, sent_at=func.now(), last_error=None).
+            execution_options(synchronize_session=False)
+        )
+
+    async def release(self, outbox_ids: list[uuid.UUID]) -> None:
+        """임대했지만 발송을 시도하지 못한 메일을 시도 횟수를 되돌려 바로 다시 발송 대상으로 만듭니다."""
+        await self.db.execute(
+            update(EmailOutbox).
+            filter(EmailOutbox.id.in_(outbox_ids)).
+            values(attempts=EmailOutbox.attempts - 1, next_attempt_at=func.now()).
+            execution_options(synchronize_session=False)
+        )
+
+    async def mark_failed(self, outbox_id: uuid.UUID, error: str, retry_in_seconds: Optional[float]) -> None:
+        """retry_in_seconds가 None이면 더 이상 재시도하지 않고 DEAD로 표시합니다."""
+        values = {"last_error": error[:1000]}
+        if retry_in_seconds is None:
+            values["status"] = OutboxStatus.DEAD
+        else:
+            values["next_attempt_at"] = func.now() + timedelta(seconds=retry_in_seconds)
+        await self.db.execute(
+            update(EmailOutbox).
+            filter(EmailOutbox.id == outbox_id).
+            values(**values).
+            execution_options(synchronize_session=False)
+        )
+
+    async def delete_sent(self, before: datetime, batch_size: int) -> int:
+        """before 이전에 발송 완료된 메일을 최대 batch_size건 삭제하고 삭제한 건수를 반환합니다."""
+        batch = (
+            select(EmailOutbox.id).
+            filter(EmailOutbox.status == OutboxStatus.SENT, EmailOutbox.sent_at < before).
+            limit(batch_size).
+            with_for_update(skip_locked=True)
+        )
+        result = await self.db.execute(
+            delete(EmailOutbox).
+            filter(EmailOutbox.id.in_(batch)).
+            execution_options(synchronize_session=False)
+        )
+        return result.rowcount
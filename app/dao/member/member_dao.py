@@ -1,5 +1,7 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, exists, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from model.member.member import Member, MemberRole, MemberGrade
+from model.member.email_verification import EmailVerification
 from typing import Optional, List
 import uuid
 from config.logger import get_logger
@@ -7,36 +9,43 @@ from config.logger import get_logger
 logger = get_logger()
 
 class MemberDAO:
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
         self.session = session
 
-    def create_member(self, email: str, password: str, nickname: str) -> Optional[Member]:
+    async def create_member(self, email: str, password: str, nickname: str) -> Member:
         try:
-            member = Member(email=email, password=password, nickname=nickname)
+            # updated_at은 onupdate만 있는 컬럼이라 값을 지정하지 않으면 flush 직후 별도 SELECT로 다시 읽음
+            member = Member(email=email, password=password, nickname=nickname, updated_at=None)
             self.session.add(member)
-            self.session.commit()
-            self.session.refresh(member)
+            await self.session.flush()
             return member
         except Exception as e:
             logger.error(f"회원 생성 중 오류 발생: {str(e)}")
-            self.session.rollback()
-            return None
+            raise
 
-    def get_member_by_id(self, member_id: uuid.UUID) -> Optional[Member]:
-        return self.session.query(Member).filter(Member.id == member_id).first()
+    async def get_member_by_id(self, member_id: uuid.UUID) -> Optional[Member]:
+        result = await self.session.execute(select(Member).filter(Member.id == member_id))
+        return result.scalars().first()
 
-    def get_member_by_email(self, email: str) -> Optional[Member]:
-        return self.session.query(Member).filter(Member.email == email).first()
+    async def get_member_by_email(self, email: str, use_replica: bool = True) -> Optional[Member]:
+        result = await self.session.execute(
+            select(Member).
+            filter(Member.email == email).
+            execution_options(use_replica=use_replica)
+        )
+        return result.scalars().first()
 
-    def get_members_by_role(self, role: MemberRole) -> List[Member]:
-        return self.session.query(Member).filter(Member.role == role).all()
+    async def get_members_by_role(self, role: MemberRole) -> List[Member]:
+        result = await self.session.execute(select(Member).filter(Member.role == role))
+        return result.scalars().all()
 
-    def get_members_by_grade(self, grade: MemberGrade) -> List[Member]:
-        return self.session.query(Member).filter(Member.grade == grade).all()
+    async def get_members_by_grade(self, grade: MemberGrade) -> List[Member]:
+        result = await self.session.execute(select(Member).filter(Member.grade == grade))
+        return result.scalars().all()
 
-    def update_member(self, member_id: uuid.UUID, **kwargs) -> Optional[Member]:
+    async def update_member(self, member_id: uuid.UUID, **kwargs) -> Optional[Member]:
         try:
-            member = self.get_member_by_id(member_id)
+            member = await self.get_member_by_id(member_id)
             if not member:
                 return None
 
@@ -45,35 +54,63 @@ class MemberDAO:
                 if key in allowed_fields and hasattr(member, key):
                     setattr(member, key, value)
 
-            self.session.commit()
-            self.session.refresh(member)
+            await self.session.flush()
             return member
         except Exception as e:
             logger.error(f"회원 정보 업데이트 중 오류 발생: {str(e)}")
-            self.session.rollback()
-            return None
+            raise
 
-    def delete_member(self, member_id: uuid.UUID) -> bool:
+    async def update_password(self, member_id: uuid.UUID, password: str) -> None:
+        """
+        비밀번호 해시만 갱신합니다. 세션에 로드된 회원 객체를 거치지 않는 단일 UPDATE입니다.
+        """
+        await self.session.execute(
+            update(Member).
+            filter(Member.id == member_id).
+            values(password=password)
+        )
+
+    async def delete_member(self, member_id: uuid.UUID) -> bool:
         try:
-            member = self.get_member_by_id(member_id)
+            member = await self.get_member_by_id(member_id)
             if member:
-                self.session.delete(member)
-                self.session.commit()
+                await self.session.delete(member)
+                await self.session.flush()
                 return True
             return False
         except Exception as e:
             logger.error(f"회원 삭제 중 오류 발생: {str(e)}")
-            self.session.rollback()
-            return False
+            raise
 
-    def find_by_email(self, email: str) -> Optional[Member]:
+    async def find_by_email(self, email: str) -> Optional[Member]:
         """
         이메일로 회원 조회
         """
-        return self.session.query(Member).filter(Member.email == email).first()
+        result = await self.session.execute(select(Member).filter(Member.email == email))
+        return result.scalars().first()
 
-    def find_by_nickname(self, nickname: str) -> Optional[Member]:
+    async def find_by_nickname(self, nickname: str) -> Optional[Member]:
         """
         닉네임으로 회원 조회
         """
-        return self.session.query(Member).filter(Member.nickname == nickname).first() 
\ No newline at end of file
+        result = await self.session.execute(select(Member).filter(Member.nickname == nickname))
+        return result.scalars().first()
+
+    async def check_signup(self, email: str, nickname: str) -> Row:
+        """
+        회원가입 사전 확인을 한 번의 쿼리로 수행합니다.
+        email_taken, nickname_taken, email_verified 세 값을 담은 행을 반환합니다.
+        방금 인증/가입한 내용이 복제 지연으로 누락되지 않도록 primary에서 조회합니다.
+        """
+        result = await self.session.execute(
+            select(
+                exists().where(Member.email == email).label("email_taken"),
+                exists().where(Member.nickname == nickname).label("nickname_taken"),
+                exists().where(
+                    EmailVerification.email == email,
+                    EmailVerification.is_verified.is_(True)
+                ).label("email_verified"),
+            ).
+            execution_options(use_replica=False)
+        )
+        return result.one()
@@ -0,0 +1,36 @@
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from model.member.revoked_token import RevokedToken
+from datetime import datetime
+
+# 폐기 알림 채널 - 커밋 시점에 다른 프로세스의 블룸 필터로 전달
+REVOCATION_CHANNEL = "token_revoked"
+
+class RevokedTokenDAO:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def revoke(self, jti: str, expires_at: datetime) -> None:
+        """이미 폐기된 jti면 무시합니다."""
+        await self.db.execute(
+            insert(RevokedToken).
+            values(jti=jti, expires_at=expires_at).
+            on_conflict_do_nothing(index_elements=[RevokedToken.jti])
+        )
+
+    async def notify(self, jti: str) -> None:
+        """트랜잭션이 커밋될 때 REVOCATION_CHANNEL을 구독 중인 연결로 jti를 보냅니다."""
+        await self.db.execute(select(func.pg_notify(REVOCATION_CHANNEL, jti)))
+
+    async def exists(self, jti: str) -> bool:
+        result = await self.db.execute(select(RevokedToken.jti).filter(RevokedToken.jti == jti))
+        return result.scalar() is not None
+
+    async def find_active_jtis(self, now: datetime) -> list[str]:
+        result = await self.db.execute(select(RevokedToken.jti).filter(RevokedToken.expires_at > now))
+        return result.scalars().all()
+
+    async def delete_expired(self, now: datetime) -> int:
+        result = await self.db.execute(delete(RevokedToken).filter(RevokedToken.expires_at <= now))
+        return result.rowcount
@@ -0,0 +1,27 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class UnitOfWork:
+    """
+    요청 세션 단위 트랜잭션 관리자
+    블록 안의 DAO 호출은 flush만 수행하고, 블록이 정상 종료되면 한 번만 커밋합니다.
+    예외가 발생하면 블록 안의 모든 변경을 롤백합니다.
+    중첩 사용 시 가장 바깥 블록에서만 커밋/롤백합니다.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def __aenter__(self) -> "UnitOfWork":
+        self.db.info["uow_depth"] = self.db.info.get("uow_depth", 0) + 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        depth = self.db.info["uow_depth"] = self.db.info["uow_depth"] - 1
+        if depth > 0:
+            return
+
+        if exc_type is None:
+            await self.db.commit()
+        else:
+            await self.db.rollback()
@@ -1,19 +1,24 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from dao.member.member_dao import MemberDAO
 from dto.auth_dto import MemberInfoDTO
-from config.jwt_config import verify_token
+from model.member.member import MemberRole
+from config.jwt_config import member_from_claims, verify_token
 from config.database import get_db
 from config.logger import get_logger
+from service.member.member_cache import member_cache, to_member_info
+from service.member.token_revocation import token_revocation
 
 logger = get_logger(__name__)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
+# 토큰이 없어도 처리해야 하는 엔드포인트(로그아웃)용
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login", auto_error=False)
 
 async def get_current_member(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> MemberInfoDTO:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -31,13 +36,46 @@ async def get_current_member(
     if email is None:
         logger.warning("토큰 검증 실패: 이메일 정보 없음")
         raise credentials_exception
+
+    # 폐기 여부 확인 - 폐기되지 않은 토큰은 블룸 필터만 확인 (DB 조회 없음)
+    # 로그아웃은 리프레시 토큰(rjti)도 폐기하므로, 같은 리프레시 토큰으로 갱신한 다른 액세스 토큰도 거부
+    for claim in ("jti", "rjti"):
+        jti = payload.get(claim)
+        if jti and await token_revocation.is_revoked(db, jti):
+            logger.warning(f"토큰 검증 실패: 폐기된 토큰 ({email})")
+            raise credentials_exception
         
+    # stateless 모드: 검증된 클레임만으로 회원 정보 구성 (DB 조회 없음)
+    member_info = member_from_claims(payload)
+    if member_info is not None:
+        logger.debug(f"사용자 인증 성공 (토큰 클레임): {email}")
+        return member_info
+
+    member_info = member_cache.get(email)
+    if member_info is not None:
+        logger.debug(f"사용자 인증 성공 (캐시): {email}")
+        return member_info
+
     logger.info(f"사용자 조회 시작: {email}")
     member_dao = MemberDAO(db)
-    member = member_dao.get_member_by_email(email)
+    member = await member_dao.get_member_by_email(email)
     if member is None:
         logger.warning(f"사용자 조회 실패: {email} 존재하지 않음")
         raise credentials_exception
     
+    member_info = to_member_info(member)
+    member_cache.set(email, member_info)
     logger.info(f"사용자 인증 성공: {email}")    
-    return member
\ No newline at end of file
+    return member_info
+
+async def get_current_admin(
+    current_member: MemberInfoDTO = Depends(get_current_member)
+) -> MemberInfoDTO:
+    """관리자(ADMIN)만 허용합니다. 운영 지표 등 내부용 엔드포인트에 사용합니다."""
+    if current_member.role != MemberRole.ADMIN.value:
+        logger.warning(f"관리자 권한 없음: {current_member.email} ({current_member.role})")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 권한이 필요합니다",
+        )
+    return current_member
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, EmailStr
 from typing import Optional
 from datetime import datetime
+import uuid
 
 class Token(BaseModel):
     access_token: str
@@ -27,7 +28,7 @@ class MemberResponse(BaseModel):
         from_attributes = True
 
 class MemberInfoDTO(BaseModel):
-    id: str
+    id: uuid.UUID
     email: str
     nickname: str
     role: str
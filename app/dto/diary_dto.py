@@ -1,5 +1,7 @@
 from pydantic import BaseModel
 import uuid
+from datetime import datetime
+from typing import Optional
 
 class SaveDiaryRequestDTO(BaseModel):
     yyyymmdd: str
@@ -16,3 +18,11 @@ class GetDiaryResponseDTO(BaseModel):
     yyyymmdd: str
     content: str
     image_ids: list[uuid.UUID]
+
+class ExportDiaryDTO(BaseModel):
+    id: uuid.UUID
+    yyyymmdd: str
+    content: str
+    image_ids: list[uuid.UUID]
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
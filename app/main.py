@@ -1,12 +1,22 @@
+import asyncio
 import os
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from controller.diary.diary import router as diary_router
 from controller.auth.auth_controller import router as auth_router
 from controller.auth.verify_controller import router as verify_router
-from config.database import init_database, create_tables
+from controller.monitor.monitor_controller import router as monitor_router
+from config.database import init_database, create_tables, async_engine, session_leak_detector
 from config.logger import get_logger, setup_logger
+from util.file_io import file_io_executor
+from util.hash_util import HashUtil, hash_executor
+from service.member.token_revocation import token_revocation
+from service.email.email_template import email_template_renderer
+from service.email.mail_client import mail_client
+from service.email.outbox_worker import OUTBOX_WORKER_ENABLED, outbox_worker
+from service.email.verification_purge import VERIFICATION_PURGE_ENABLED, verification_purge
 import logging
 
 # 환경 변수 먼저 로드
@@ -39,7 +49,41 @@ def check_env_file():
 
 check_env_file()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    background_tasks = []
+    logger.info(f"║ 🔐 bcrypt cost: {HashUtil.rounds}")
+    await mail_client.start()
+    logger.info(f"║ 📧 SMTP 클라이언트 준비 완료 (커넥션 풀: {mail_client.pool_size})")
+    email_template_renderer.load()
+    logger.info(f"║ 📝 이메일 템플릿 로드 완료 (자동 갱신: {email_template_renderer.auto_reload})")
+
+    # 폐기 알림 구독 후 필터를 불러오며, 그 전까지 폐기 여부는 DB에서 직접 확인
+    background_tasks.append(asyncio.create_task(token_revocation.watch()))
+
+    if OUTBOX_WORKER_ENABLED:
+        background_tasks.append(asyncio.create_task(outbox_worker.run()))
+        logger.info(f"║ 📮 메일 발송 워커 시작 (배치: {outbox_worker.batch_size})")
+
+    if VERIFICATION_PURGE_ENABLED:
+        background_tasks.append(asyncio.create_task(verification_purge.run()))
+        logger.info(f"║ 🧹 인증 레코드 정리 작업 시작 (배치: {verification_purge.batch_size})")
+
+    if session_leak_detector:
+        background_tasks.append(asyncio.create_task(session_leak_detector.watch()))
+        logger.info(f"║ 🔎 세션 누수 감지 활성화 (임계값: {session_leak_detector.threshold_seconds}s)")
+
+    yield
+
+    for task in background_tasks:
+        task.cancel()
+    hash_executor.shutdown()
+    file_io_executor.shutdown()
+    await mail_client.close()
+    await async_engine.dispose()
+
 app = FastAPI(
+    lifespan=lifespan,
     title="Sudays API",
     description="Sudays 일기 서비스 API",
     version="1.0.0",
@@ -99,5 +143,8 @@ logger.info("║ ✅ CORS 미들웨어 설정 완료")
 app.include_router(diary_router)
 app.include_router(auth_router, tags=["auth"])
 app.include_router(verify_router, prefix="/auth", tags=["auth"])
+if os.getenv("ENABLE_MONITOR_API", "false").lower() == "true":
+    app.include_router(monitor_router, tags=["monitor"])
+    logger.info("║ 📈 모니터링 API 활성화")
 logger.info("║ 🚀 FastAPI 서버 시작 완료")
 logger.info("╚════════════════════════════════════════════════════════╝")
@@ -1,23 +1,30 @@
-from sqlalchemy import Column, String, Text, DateTime, UUID, ARRAY, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, String, Text, Date, DateTime, UUID, ARRAY, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime, UTC
 import uuid
 from config.database import Base
 
+def _diary_date_from_yyyymmdd(context):
+    """INSERT 시 yyyymmdd 문자열로부터 diary_date(DATE)를 채웁니다."""
+    return datetime.strptime(context.get_current_parameters()["yyyymmdd"], "%Y%m%d").date()
+
 class Diary(Base):
     __tablename__ = "diary"
     
     id = Column(UUID, primary_key=True, default=uuid.uuid4)
     yyyymmdd = Column(String, nullable=False)
+    diary_date = Column(Date, nullable=False, default=_diary_date_from_yyyymmdd)
     member_id = Column(UUID, ForeignKey('member.id'), nullable=False)
     content = Column(Text, nullable=False)
     image_ids = Column(ARRAY(UUID), nullable=True)
-    created_at = Column(DateTime, default=lambda: datetime.now(UTC))
-    updated_at = Column(DateTime, default=lambda: datetime.now(UTC), onupdate=lambda: datetime.now(UTC))
+    # TIMESTAMP WITHOUT TIME ZONE 컬럼이므로 UTC 기준 naive datetime 저장 (asyncpg는 aware 값을 거부)
+    created_at = Column(DateTime, default=lambda: datetime.now(UTC).replace(tzinfo=None))
+    updated_at = Column(DateTime, default=lambda: datetime.now(UTC).replace(tzinfo=None), onupdate=lambda: datetime.now(UTC).replace(tzinfo=None))
     
     member = relationship("Member", back_populates="diaries")
     images = relationship("DiaryImage", back_populates="diary")
     
     __table_args__ = (
         UniqueConstraint('yyyymmdd', 'member_id', name='uix_diary_date_member'),
+        Index('ix_diary_member_date', 'member_id', 'diary_date'),
     )
\ No newline at end of file
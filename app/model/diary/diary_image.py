@@ -8,12 +8,13 @@ class DiaryImage(Base):
     __tablename__ = "diary_image"
     
     id = Column(UUID, primary_key=True, default=uuid.uuid4)
-    diary_id = Column(UUID, ForeignKey('diary.id'), nullable=False)
+    diary_id = Column(UUID, ForeignKey('diary.id'), nullable=False, index=True)
     file_name = Column(String(255), nullable=False)
     extension = Column(String(255), nullable=False)
     base_path = Column(String(255), nullable=False)
-    created_at = Column(DateTime, default=lambda: datetime.now(UTC))
-    updated_at = Column(DateTime, default=lambda: datetime.now(UTC), onupdate=lambda: datetime.now(UTC))
+    # TIMESTAMP WITHOUT TIME ZONE 컬럼이므로 UTC 기준 naive datetime 저장 (asyncpg는 aware 값을 거부)
+    created_at = Column(DateTime, default=lambda: datetime.now(UTC).replace(tzinfo=None))
+    updated_at = Column(DateTime, default=lambda: datetime.now(UTC).replace(tzinfo=None), onupdate=lambda: datetime.now(UTC).replace(tzinfo=None))
 
     # 관계 설정
     diary = relationship("Diary", back_populates="images")
\ No newline at end of file
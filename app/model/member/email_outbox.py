@@ -0,0 +1,39 @@
+from sqlalchemy import Column, String, Text, Integer, DateTime, Enum, UUID, Index, text
+from sqlalchemy.sql import func
+import enum
+import uuid
+from config.database import Base
+
+class OutboxStatus(enum.Enum):
+    PENDING = "PENDING"
+    SENT = "SENT"
+    DEAD = "DEAD"
+
+class EmailOutbox(Base):
+    """
+    발송 대기 메일
+    요청 트랜잭션 안에서 기록하고, 별도 워커가 꺼내 발송합니다.
+    """
+    __tablename__ = 'email_outbox'
+
+    id = Column(UUID, primary_key=True, default=uuid.uuid4)
+    recipient = Column(String(255), nullable=False)
+    subject = Column(String(255), nullable=False)
+    body = Column(Text, nullable=False)
+    status = Column(Enum(OutboxStatus), nullable=False, default=OutboxStatus.PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    # 다음 발송 시각 - 발송 중에는 임대 만료 시각, 실패 후에는 재시도 시각
+    next_attempt_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # 워커의 발송 대상 조회 - 발송 완료/실패 처리된 행은 인덱스에 포함하지 않음
+        Index('ix_email_outbox_pending', 'next_attempt_at', postgresql_where=text("status = 'PENDING'")),
+        # 정리 작업의 발송 완료 메일 배치 삭제
+        Index('ix_email_outbox_sent_at', 'sent_at', postgresql_where=text("status = 'SENT'")),
+    )
+
+    def __repr__(self):
+        return f"<EmailOutbox(id={self.id}, recipient={self.recipient}, status={self.status})>"
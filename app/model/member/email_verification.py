@@ -1,28 +1,39 @@
-from sqlalchemy import Column, String, DateTime, Boolean, UUID, ForeignKey
+from sqlalchemy import Column, String, DateTime, Boolean, UUID, ForeignKey, Index, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from config.database import Base
 
 class EmailVerification(Base):
     __tablename__ = 'email_verification'
 
     id = Column(UUID, primary_key=True, default=uuid.uuid4)
-    email = Column(String(255), nullable=False, index=True)
+    email = Column(String(255), nullable=False)
     verification_code = Column(String(6), nullable=False)  # 6자리 인증코드
     is_verified = Column(Boolean, default=False)
     expires_at = Column(DateTime(timezone=True), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     verified_at = Column(DateTime(timezone=True), nullable=True)
 
+    # flush 시 RETURNING으로 created_at을 함께 받아 별도 refresh 조회를 생략
+    __mapper_args__ = {"eager_defaults": True}
+
+    __table_args__ = (
+        # 이메일별 최근 인증 레코드 조회 (역방향 인덱스 스캔으로 created_at DESC LIMIT 1 처리)
+        Index('ix_email_verification_email_created_at', 'email', 'created_at'),
+        # 정리 작업의 배치 삭제 대상 조회 - 미인증 레코드는 만료 시각, 인증 레코드는 인증 시각 기준
+        Index('ix_email_verification_pending_expires_at', 'expires_at', postgresql_where=text("is_verified = false")),
+        Index('ix_email_verification_verified_at', 'verified_at', postgresql_where=text("is_verified = true")),
+    )
+
     def __repr__(self):
         return f"<EmailVerification(id={self.id}, email={self.email}, is_verified={self.is_verified})>"
 
     @property
     def is_expired(self) -> bool:
         """인증코드가 만료되었는지 확인"""
-        return datetime.utcnow() > self.expires_at
+        return datetime.now(timezone.utc) > self.expires_at
 
     @property
     def is_valid(self) -> bool:
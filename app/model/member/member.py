@@ -20,7 +20,7 @@ class Member(Base):
     id = Column(UUID, primary_key=True, default=uuid.uuid4)
     email = Column(String(255), unique=True, nullable=False)
     password = Column(String(255), nullable=False)
-    nickname = Column(String(50), nullable=False)
+    nickname = Column(String(50), unique=True, nullable=False)  # 회원가입 시 중복 확인
     role = Column(Enum(MemberRole), nullable=False, default=MemberRole.USER)
     grade = Column(Enum(MemberGrade), nullable=False, default=MemberGrade.NON_MEMBER)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -28,6 +28,9 @@ class Member(Base):
     
     diaries = relationship("Diary", back_populates="member")
 
+    # flush 시 RETURNING으로 서버 기본값(created_at, updated_at)을 함께 받아 별도 refresh 조회를 생략
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self):
         return f"<Member(id={self.id}, email={self.email}, nickname={self.nickname})>"
 
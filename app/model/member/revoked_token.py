@@ -0,0 +1,14 @@
+from sqlalchemy import Column, String, DateTime
+from sqlalchemy.sql import func
+from config.database import Base
+
+class RevokedToken(Base):
+    __tablename__ = 'revoked_token'
+
+    jti = Column(String(36), primary_key=True)
+    # 토큰 자체의 만료 시각 - 이후에는 폐기 기록도 필요 없으므로 정리 대상
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    revoked_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<RevokedToken(jti={self.jti}, expires_at={self.expires_at})>"
@@ -1,25 +1,30 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from dao.diary.diary_dao import DiaryDAO
 from dao.diary.diary_image_dao import DiaryImageDAO
+from dao.unit_of_work import UnitOfWork
 from model.diary.diary import Diary
 from model.diary.diary_image import DiaryImage
-from datetime import datetime, timezone
+from dto.diary_dto import ExportDiaryDTO
+from datetime import datetime
 import os
 import uuid
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List
 from config.logger import get_logger
+from service.diary.image_store import read_image, remove_files, save_upload
 from fastapi import UploadFile, HTTPException
 from fastapi import status
 
 logger = get_logger(__name__)
 
 class DiaryService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.diary_dao = DiaryDAO(db)
         self.diary_image_dao = DiaryImageDAO(db)
         self.ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif"}
         self.MAX_IMAGE_SIZE = 5 * 1024 * 1024  # 5MB
+        self.MAX_RANGE_DAYS = 366  # 기간 조회 최대 일수
+        self.EXPORT_BATCH_SIZE = 500  # 내보내기 시 한 번에 가져오는 행 수
 
     def validate_date_format(self, yyyymmdd: str) -> bool:
         try:
@@ -28,11 +33,38 @@ class DiaryService:
         except ValueError:
             return False
 
-    def get_diary(self, yyyymmdd: str, member_id: uuid.UUID) -> Optional[Diary]:
+    async def get_diary(self, yyyymmdd: str, member_id: uuid.UUID) -> Optional[Diary]:
         if not self.validate_date_format(yyyymmdd):
             raise ValueError("올바른 날짜 형식이 아닙니다. (YYYYMMDD)")
 
-        return self.diary_dao.find_by_yyyymmdd(member_id, yyyymmdd)
+        return await self.diary_dao.find_by_yyyymmdd(member_id, yyyymmdd)
+
+    async def get_diaries(self, from_yyyymmdd: str, to_yyyymmdd: str, member_id: uuid.UUID) -> List[Diary]:
+        if not self.validate_date_format(from_yyyymmdd) or not self.validate_date_format(to_yyyymmdd):
+            raise ValueError("올바른 날짜 형식이 아닙니다. (YYYYMMDD)")
+
+        start_date = datetime.strptime(from_yyyymmdd, "%Y%m%d").date()
+        end_date = datetime.strptime(to_yyyymmdd, "%Y%m%d").date()
+        if start_date > end_date:
+            raise ValueError("조회 시작일은 종료일보다 늦을 수 없습니다.")
+        if (end_date - start_date).days >= self.MAX_RANGE_DAYS:
+            raise ValueError(f"최대 {self.MAX_RANGE_DAYS}일까지만 조회할 수 있습니다.")
+
+        return await self.diary_dao.find_by_date_range(member_id, start_date, end_date)
+
+    async def export_diaries(self, member_id: uuid.UUID) -> AsyncIterator[bytes]:
+        """회원의 전체 일기를 한 줄에 하나씩 NDJSON으로 내보냅니다."""
+        async for diary in self.diary_dao.stream_by_member(member_id, self.EXPORT_BATCH_SIZE):
+            yield ExportDiaryDTO(
+                id=diary.id,
+                yyyymmdd=diary.yyyymmdd,
+                content=diary.content,
+                image_ids=diary.image_ids or [],
+                created_at=diary.created_at,
+                updated_at=diary.updated_at,
+            ).model_dump_json().encode() + b"\n"
+            # 이미 내보낸 행은 세션에서 분리해 identity map에 쌓이지 않게 함
+            self.db.expunge(diary)
 
     async def upsert_diary(self, yyyymmdd: str, content: str, images: List[UploadFile] = None, member_id: uuid.UUID = None) -> Diary:
         try:
@@ -47,15 +79,16 @@ class DiaryService:
             if not content.strip():
                 raise ValueError("일기 내용은 비어있을 수 없습니다.")
 
+            if images and len(images) > 5:
+                raise ValueError("최대 5개의 이미지만 업로드할 수 있습니다.")
+
             # 이미지 업로드 및 메타데이터 저장 처리
             image_ids = []
             diary_images = []
+            stored_paths = []
 
-            if images:
-                if len(images) > 5:
-                    raise ValueError("최대 5개의 이미지만 업로드할 수 있습니다.")
-
-                for image in images:
+            try:
+                for image in images or []:
                     file_extension = os.path.splitext(image.filename)[1].lower()
                     
                     if file_extension not in self.ALLOWED_EXTENSIONS:
@@ -63,18 +96,13 @@ class DiaryService:
                         raise ValueError(f"지원하지 않는 이미지 형식입니다. 허용된 형식: {', '.join(self.ALLOWED_EXTENSIONS)}")
 
                     try:
-                        # 이미지 크기 확인
-                        image_content = await image.read()
-                        if len(image_content) > self.MAX_IMAGE_SIZE:
-                            raise ValueError(f"이미지 크기가 너무 큽니다. 최대 {self.MAX_IMAGE_SIZE/1024/1024}MB까지 허용됩니다.")
-                        
                         image_id = uuid.uuid4()
                         file_name = str(image_id)
                         file_path = os.path.join(os.getenv("IMAGE_DIR"), f"{file_name}{file_extension}")
 
-                        # 파일 저장
-                        with open(file_path, "wb") as buffer:
-                            buffer.write(image_content)
+                        # 파일 저장 - 고정 크기 단위로 임시 파일에 쓰면서 크기 제한을 확인한 뒤 원자적으로 이동
+                        await save_upload(image, file_path, self.MAX_IMAGE_SIZE)
+                        stored_paths.append(file_path)
 
                         # 이미지 메타데이터 저장
                         diary_image = DiaryImage(
@@ -91,31 +119,29 @@ class DiaryService:
                         logger.error(f"이미지 처리 중 오류 발생: {str(e)}")
                         raise ValueError(f"이미지 처리 중 오류가 발생했습니다: {str(e)}")
 
-            # 기존 일기 확인
-            existing_diary = self.diary_dao.find_by_yyyymmdd(member_id, yyyymmdd)
-            
-            if existing_diary:
-                # 기존 일기 업데이트
-                existing_diary.content = content
-                existing_diary.image_ids = image_ids
-                existing_diary.updated_at = datetime.now(timezone.utc)
-                saved_diary = self.diary_dao.save(existing_diary)
-                logger.info(f"일기 업데이트 완료 (ID: {saved_diary.id})")
-            else:
-                # 새로운 일기 저장
-                diary = Diary(
-                    member_id=member_id, 
-                    yyyymmdd=yyyymmdd, 
-                    content=content,
-                    image_ids=image_ids
-                )
-                saved_diary = self.diary_dao.save(diary)
-                logger.info(f"일기 저장 완료 (ID: {saved_diary.id})")
-
-            # 이미지 메타데이터에 일기 ID 설정 및 저장
-            for diary_image in diary_images:
-                diary_image.diary_id = saved_diary.id
-                self.diary_image_dao.save(diary_image)
+                # 일기와 이미지 메타데이터를 하나의 트랜잭션으로 저장
+                async with UnitOfWork(self.db):
+                    # 일기 저장 (있으면 수정) - 단일 INSERT ... ON CONFLICT 문으로 처리
+                    saved_diary = await self.diary_dao.upsert(member_id, yyyymmdd, content, image_ids)
+
+                    # 수정이면 이전 이미지 메타데이터를 같은 트랜잭션에서 지움 (파일은 커밋 후 삭제)
+                    replaced_images = await self.diary_image_dao.delete_by_diary_id(saved_diary.id)
+
+                    # 이미지 메타데이터에 일기 ID 설정 후 일괄 저장
+                    for diary_image in diary_images:
+                        diary_image.diary_id = saved_diary.id
+                    await self.diary_image_dao.save_all(diary_images)
+            except BaseException:
+                # 일기가 저장되지 않았으므로 이번 요청에서 저장한 이미지 파일을 지움
+                await remove_files(stored_paths)
+                raise
+
+            # 롤백되면 기존 일기가 이전 파일을 그대로 참조하므로 커밋된 뒤에만 지움
+            await remove_files(
+                os.path.join(image.base_path, f"{image.file_name}{image.extension}") for image in replaced_images
+            )
+
+            logger.info(f"일기 저장 완료 (ID: {saved_diary.id})")
 
             return saved_diary
 
@@ -129,23 +155,23 @@ class DiaryService:
                 detail="일기 저장 중 오류가 발생했습니다."
             )
 
-    def get_diary_image(self, diary_image_id: str, member_id: uuid.UUID) -> tuple[bytes, str]:
+    async def get_diary_image(self, diary_image_id: str, member_id: uuid.UUID) -> tuple[bytes, str]:
         try:
             image_uuid = uuid.UUID(diary_image_id)
             
-            diary_image = self.diary_image_dao.find_by_id(image_uuid)
+            diary_image = await self.diary_image_dao.find_by_id(image_uuid)
             if diary_image is None:
                 raise ValueError("이미지를 찾을 수 없습니다.")
 
-            diary = self.diary_dao.find_by_id(diary_image.diary_id)
+            diary = await self.diary_dao.find_by_id(diary_image.diary_id)
             if diary is None or diary.member_id != member_id:
                 raise ValueError("이미지에 접근할 권한이 없습니다.")
 
             file_path = os.path.join(diary_image.base_path, f"{diary_image.file_name}{diary_image.extension}")
             
             try:
-                with open(file_path, "rb") as f:
-                    image_data = f.read()
+                # 느린 디스크가 이벤트 루프를 막지 않도록 파일 I/O 스레드 풀에서 읽음
+                image_data = await read_image(file_path)
             except FileNotFoundError:
                 raise ValueError("이미지 파일을 찾을 수 없습니다.")
             except Exception as e:
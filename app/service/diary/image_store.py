@@ -0,0 +1,63 @@
+import os
+import uuid
+from typing import Iterable
+
+from fastapi import UploadFile
+
+from config.logger import get_logger
+from util.file_io import file_io_executor
+
+logger = get_logger(__name__)
+
+# 업로드 파일을 읽고 쓰는 단위 - 업로드 1건이 메모리에 올리는 최대 크기
+IMAGE_UPLOAD_CHUNK_SIZE = int(os.getenv("IMAGE_UPLOAD_CHUNK_SIZE", 64 * 1024))
+
+
+def _too_large(max_size: int) -> ValueError:
+    return ValueError(f"이미지 크기가 너무 큽니다. 최대 {max_size/1024/1024}MB까지 허용됩니다.")
+
+
+async def save_upload(upload: UploadFile, target_path: str, max_size: int, chunk_size: int = IMAGE_UPLOAD_CHUNK_SIZE) -> int:
+    """
+    업로드 파일을 chunk_size씩 읽어 같은 디렉토리의 임시 파일에 쓰고, 끝까지 쓴 뒤 target_path로 원자적으로 이동합니다.
+    - 누적 크기가 max_size를 넘는 순간 중단하고 임시 파일을 지웁니다.
+    - target_path에는 완성된 파일만 나타나며, 실패하면 아무것도 남지 않습니다.
+    저장한 바이트 수를 반환합니다.
+    """
+    # 멀티파트 파서가 기록한 크기로 먼저 거르고, 크기를 모르면 쓰면서 확인
+    if upload.size is not None and upload.size > max_size:
+        raise _too_large(max_size)
+
+    temp_path = os.path.join(os.path.dirname(target_path), f".{uuid.uuid4()}.part")
+    size = 0
+    try:
+        buffer = await file_io_executor.run("open", open, temp_path, "xb")
+        try:
+            while chunk := await upload.read(chunk_size):
+                size += len(chunk)
+                if size > max_size:
+                    raise _too_large(max_size)
+                await file_io_executor.write(buffer, chunk)
+        finally:
+            await file_io_executor.run("close", buffer.close)
+        await file_io_executor.run("replace", os.replace, temp_path, target_path)
+    except BaseException:
+        await remove_files([temp_path])
+        raise
+    return size
+
+
+async def read_image(path: str) -> bytes:
+    """저장된 이미지 파일 전체를 파일 I/O 스레드 풀에서 읽습니다."""
+    return await file_io_executor.read_file(path)
+
+
+async def remove_files(paths: Iterable[str]) -> None:
+    """파일을 지웁니다. 이미 없거나 지우지 못한 파일은 로그만 남깁니다."""
+    for path in paths:
+        try:
+            await file_io_executor.run("unlink", os.unlink, path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"이미지 파일 삭제 실패: {path}, 오류: {str(e)}")
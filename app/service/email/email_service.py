@@ -1,61 +1,39 @@
 import random
 import string
-from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
-from fastapi_mail import FastMail, MessageSchema, ConnectionConfig
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 
+from dao.member.email_outbox_dao import EmailOutboxDAO
+from dao.unit_of_work import UnitOfWork
 from model.member.email_verification import EmailVerification
 from config.logger import get_logger
 from config.email_config import EmailConfig
+from service.email.email_template import email_template_renderer
+from service.email.mail_client import MailClient, mail_client
+from service.email.verified_email_cache import verified_email_cache
 
 logger = get_logger(__name__)
 
 class EmailService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession, mail: MailClient = mail_client):
         self.db = db
-        
-        # 설정 검증
-        EmailConfig.validate_config()
-        
-        self.fastmail = FastMail(
-            ConnectionConfig(
-                MAIL_USERNAME=EmailConfig.MAIL_USERNAME,
-                MAIL_PASSWORD=EmailConfig.MAIL_PASSWORD,
-                MAIL_FROM=EmailConfig.MAIL_FROM,
-                MAIL_PORT=EmailConfig.MAIL_PORT,
-                MAIL_SERVER=EmailConfig.MAIL_SERVER,
-                MAIL_STARTTLS=True,
-                MAIL_SSL_TLS=False,
-                USE_CREDENTIALS=True
-            )
-        )
+        # 설정 검증과 SMTP 연결은 서버 시작 시 공유 클라이언트에서 한 번만 수행
+        self.mail = mail
 
     def generate_verification_code(self) -> str:
         """인증코드 생성"""
         return ''.join(random.choices(string.digits, k=EmailConfig.VERIFICATION_CODE_LENGTH))
 
-    def create_verification_record(self, email: str) -> EmailVerification:
-        """이메일 인증 레코드 생성"""
-        
-        # Rate Limiting 체크
-        if EmailConfig.ENABLE_RATE_LIMITING:
-            recent_attempts = self.db.query(EmailVerification).filter(
-                EmailVerification.email == email,
-                EmailVerification.created_at >= datetime.utcnow() - timedelta(minutes=EmailConfig.RATE_LIMIT_MINUTES)
-            ).count()
-            
-            if recent_attempts >= EmailConfig.MAX_VERIFICATION_ATTEMPTS:
-                raise ValueError(EmailConfig.get_rate_limit_message())
-        
-        # 기존 미인증 레코드 삭제
-        self.db.query(EmailVerification).filter(
-            EmailVerification.email == email,
-            EmailVerification.is_verified == False
-        ).delete()
-        
+    async def create_verification_record(self, email: str) -> EmailVerification:
+        """
+        이메일 인증 레코드 생성
+        인증 메일은 같은 트랜잭션에서 발송 대기열(email_outbox)에 기록되며, 커밋 이후 outbox 워커가 발송합니다.
+        발송 횟수 제한은 호출 전에 check_verification_send로 확인합니다.
+        """
         verification_code = self.generate_verification_code()
-        expires_at = datetime.utcnow() + timedelta(minutes=EmailConfig.VERIFICATION_CODE_EXPIRE_MINUTES)
+        expires_at = datetime.now(timezone.utc) + timedelta(minutes=EmailConfig.VERIFICATION_CODE_EXPIRE_MINUTES)
         
         verification = EmailVerification(
             email=email,
@@ -63,45 +41,34 @@ class EmailService:
             expires_at=expires_at
         )
         
-        self.db.add(verification)
-        self.db.commit()
-        self.db.refresh(verification)
+        async with UnitOfWork(self.db):
+            # 기존 미인증 레코드 삭제
+            await self.db.execute(
+                delete(EmailVerification).filter(
+                    EmailVerification.email == email,
+                    EmailVerification.is_verified == False
+                )
+            )
+            self.db.add(verification)
+            await self.db.flush()
+            await EmailOutboxDAO(self.db).enqueue(
+                email, EmailConfig.EMAIL_SUBJECT, self.render_verification_email(verification_code)
+            )
         
         if EmailConfig.LOG_VERIFICATION_ATTEMPTS:
             logger.info(f"인증코드 생성 - 이메일: {email}, 코드: {verification_code}")
         
         return verification
 
+    def render_verification_email(self, verification_code: str) -> str:
+        """인증코드 이메일 본문(HTML) 생성 - 미리 렌더링된 템플릿에 인증코드만 채움"""
+        return email_template_renderer.render_verification(verification_code)
+
     async def send_verification_email(self, email: str, verification_code: str) -> bool:
-        """인증코드 이메일 발송"""
+        """인증코드 이메일 즉시 발송 (발송 대기열을 거치지 않음)"""
         try:
-            html_content = f"""
-            <html>
-            <body>
-                <h2>{EmailConfig.EMAIL_TEMPLATE_TITLE}</h2>
-                <p>{EmailConfig.EMAIL_TEMPLATE_GREETING}</p>
-                <p>{EmailConfig.EMAIL_TEMPLATE_INSTRUCTION}</p>
-                <h1 style="color: #007bff; font-size: 32px; text-align: center; padding: 20px; background-color: #f8f9fa; border-radius: 8px;">
-                    {verification_code}
-                </h1>
-                <p><strong>{EmailConfig.get_expiry_message()}</strong></p>
-                <p>{EmailConfig.EMAIL_TEMPLATE_SECURITY_NOTICE}</p>
-                <hr>
-                <p style="color: #6c757d; font-size: 12px;">
-                    {EmailConfig.EMAIL_TEMPLATE_FOOTER}
-                </p>
-            </body>
-            </html>
-            """
-            
-            message = MessageSchema(
-                subject=EmailConfig.EMAIL_SUBJECT,
-                recipients=[email],
-                body=html_content,
-                subtype="html"
-            )
-            
-            await self.fastmail.send_message(message)
+            html_content = self.render_verification_email(verification_code)
+            await self.mail.send(email, EmailConfig.EMAIL_SUBJECT, html_content)
             
             if EmailConfig.LOG_EMAIL_SEND_RESULTS:
                 logger.info(f"인증코드 이메일 발송 성공: {email}")
@@ -112,15 +79,18 @@ class EmailService:
                 logger.error(f"인증코드 이메일 발송 실패: {email}, 오류: {str(e)}")
             return False
 
-    def get_verification_by_email(self, email: str) -> Optional[EmailVerification]:
-        """이메일로 인증 레코드 조회"""
-        return self.db.query(EmailVerification).filter(
-            EmailVerification.email == email
-        ).first()
+    async def get_verification_by_email(self, email: str, use_replica: bool = False) -> Optional[EmailVerification]:
+        """이메일의 가장 최근 인증 레코드 조회 - (email, created_at) 인덱스를 역순으로 읽어 한 행만 가져옴"""
+        result = await self.db.execute(
+            select(EmailVerification).filter(
+                EmailVerification.email == email
+            ).order_by(EmailVerification.created_at.desc()).limit(1).execution_options(use_replica=use_replica)
+        )
+        return result.scalars().first()
 
-    def verify_code(self, email: str, verification_code: str) -> bool:
+    async def verify_code(self, email: str, verification_code: str) -> bool:
         """인증코드 검증"""
-        verification = self.get_verification_by_email(email)
+        verification = await self.get_verification_by_email(email)
         
         if not verification:
             logger.warning(f"인증 레코드 없음: {email}")
@@ -134,23 +104,87 @@ class EmailService:
             logger.warning(f"인증코드 불일치: {email}")
             return False
         
-        # 인증 성공
-        verification.is_verified = True
-        verification.verified_at = datetime.utcnow()
-        self.db.commit()
-        
-        # 인증 완료 후 해당 이메일의 모든 미인증 레코드 삭제
-        if EmailConfig.ENABLE_AUTO_CLEANUP:
-            self.db.query(EmailVerification).filter(
-                EmailVerification.email == email,
-                EmailVerification.is_verified == False
-            ).delete()
-            self.db.commit()
+        verified_at = datetime.now(timezone.utc)
+        async with UnitOfWork(self.db):
+            # 인증 성공
+            verification.is_verified = True
+            verification.verified_at = verified_at
+            await self.db.flush()
+            
+            # 인증 완료 후 해당 이메일의 모든 미인증 레코드 삭제
+            if EmailConfig.ENABLE_AUTO_CLEANUP:
+                await self.db.execute(
+                    delete(EmailVerification).filter(
+                        EmailVerification.email == email,
+                        EmailVerification.is_verified == False
+                    )
+                )
         
+        verified_email_cache.set(email, verified_at)
         logger.info(f"이메일 인증 성공: {email}")
         return True
 
-    def is_email_verified(self, email: str) -> bool:
-        """이메일이 인증되었는지 확인"""
-        verification = self.get_verification_by_email(email)
-        return verification and verification.is_verified 
\ No newline at end of file
+    async def is_email_verified(self, email: str) -> bool:
+        """
+        이메일이 인증되었는지 확인
+        최근 레코드가 아니라 인증된 레코드가 있는지를 확인합니다. (인증 후 인증코드를 다시 요청해도 인증 상태 유지, 회원가입 확인과 동일)
+        """
+        # 보관 기간이 지난 인증 레코드는 다른 프로세스의 정리 작업이 이미 지웠을 수 있으므로 캐시를 믿지 않음
+        retained_since = datetime.now(timezone.utc) - timedelta(hours=EmailConfig.VERIFICATION_VERIFIED_RETENTION_HOURS)
+        cached_verified_at = verified_email_cache.get(email)
+        if cached_verified_at is not None and cached_verified_at >= retained_since:
+            return True
+
+        verified = (await self.db.execute(
+            select(EmailVerification.verified_at).
+            filter(
+                EmailVerification.email == email,
+                EmailVerification.is_verified.is_(True)
+            ).
+            order_by(EmailVerification.verified_at.desc().nulls_last()).
+            limit(1).
+            execution_options(use_replica=True)
+        )).first()
+        if verified is None:
+            return False
+        # 인증 시각이 없는 레코드는 정리 대상이 아니지만 캐시 만료 판단을 할 수 없으므로 저장하지 않음
+        if verified.verified_at is not None:
+            verified_email_cache.set(email, verified.verified_at)
+        return True
+
+    async def purge_expired_verifications(self, now: datetime, batch_size: int) -> int:
+        """만료된 미인증 레코드를 최대 batch_size건 삭제하고 삭제한 건수를 반환합니다."""
+        batch = (
+            select(EmailVerification.id).
+            filter(EmailVerification.is_verified == False, EmailVerification.expires_at < now).
+            limit(batch_size).
+            with_for_update(skip_locked=True)
+        )
+        result = await self.db.execute(
+            delete(EmailVerification).
+            filter(EmailVerification.id.in_(batch)).
+            execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    async def purge_verified_verifications(self, before: datetime, batch_size: int) -> int:
+        """
+        before 이전에 인증 완료된 레코드를 최대 batch_size건 삭제하고 삭제한 건수를 반환합니다.
+        삭제한 이메일은 이 프로세스의 인증 완료 캐시에서도 지웁니다.
+        """
+        batch = (
+            select(EmailVerification.id).
+            filter(EmailVerification.is_verified == True, EmailVerification.verified_at < before).
+            limit(batch_size).
+            with_for_update(skip_locked=True)
+        )
+        result = await self.db.execute(
+            delete(EmailVerification).
+            filter(EmailVerification.id.in_(batch)).
+            returning(EmailVerification.email).
+            execution_options(synchronize_session=False)
+        )
+        emails = result.scalars().all()
+        for email in set(emails):
+            verified_email_cache.invalidate(email)
+        return len(emails)
@@ -0,0 +1,96 @@
+import os
+import uuid
+from typing import Callable, Optional
+
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
+from markupsafe import escape
+
+from config.email_config import EmailConfig
+from config.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "templates")
+
+# 이메일 템플릿 설정
+EMAIL_TEMPLATE_DIR = os.getenv("EMAIL_TEMPLATE_DIR")  # 같은 이름의 파일이 있으면 기본 템플릿 대신 사용
+# 템플릿 파일 변경 감지 - 발송마다 파일 수정 시각을 확인하므로 개발 환경(mode=dev/local)에서만 기본 활성화
+EMAIL_TEMPLATE_AUTO_RELOAD = os.getenv(
+    "EMAIL_TEMPLATE_AUTO_RELOAD", str(os.getenv("mode") in ("dev", "local"))
+).lower() == "true"
+
+VERIFICATION_TEMPLATE = "email/verification.html"
+
+
+def verification_context() -> dict:
+    """인증 메일에서 발송마다 바뀌지 않는 값"""
+    return {
+        "title": EmailConfig.EMAIL_TEMPLATE_TITLE,
+        "greeting": EmailConfig.EMAIL_TEMPLATE_GREETING,
+        "instruction": EmailConfig.EMAIL_TEMPLATE_INSTRUCTION,
+        "expiry_notice": EmailConfig.get_expiry_message(),
+        "security_notice": EmailConfig.EMAIL_TEMPLATE_SECURITY_NOTICE,
+        "footer": EmailConfig.EMAIL_TEMPLATE_FOOTER,
+    }
+
+
+class _PrerenderedTemplate:
+    def __init__(self, template: Template, context: dict, parts: Optional[list[str]]):
+        self.template = template
+        self.context = context
+        # code 자리를 기준으로 나눈 본문 조각. None이면 발송마다 전체를 렌더링
+        self.parts = parts
+
+
+class EmailTemplateRenderer:
+    """
+    이메일 본문 렌더러
+    - 템플릿은 한 번만 컴파일하고, 고정 문구까지 채운 결과를 code 자리 기준으로 잘라 캐시합니다.
+    - 발송마다 code만 이스케이프해 조각 사이에 끼워 넣으므로 템플릿 엔진을 거치지 않습니다.
+    - template_dir에 같은 이름의 템플릿이 있으면 기본 템플릿(app/templates) 대신 사용합니다.
+    - code에 필터를 거는 등 잘라 쓸 수 없는 템플릿은 발송마다 전체를 렌더링합니다.
+    """
+
+    def __init__(self, template_dir: Optional[str] = EMAIL_TEMPLATE_DIR, auto_reload: bool = EMAIL_TEMPLATE_AUTO_RELOAD):
+        search_path = [template_dir, DEFAULT_TEMPLATE_DIR] if template_dir else [DEFAULT_TEMPLATE_DIR]
+        self.auto_reload = auto_reload
+        self.environment = Environment(
+            loader=FileSystemLoader(search_path),
+            autoescape=select_autoescape(["html"]),
+            auto_reload=auto_reload,
+        )
+        self._prerendered: dict[str, _PrerenderedTemplate] = {}
+        self.builds = 0
+
+    def _build(self, name: str, context: dict) -> _PrerenderedTemplate:
+        template = self.environment.get_template(name)
+        slot = f"__code_{uuid.uuid4().hex}__"
+        parts = template.render(**context, code=slot).split(slot)
+        if len(parts) < 2:
+            logger.warning(f"이메일 템플릿의 code 자리를 찾지 못해 발송마다 렌더링합니다 - 템플릿: {template.filename}")
+            parts = None
+        self.builds += 1
+        return _PrerenderedTemplate(template, context, parts)
+
+    def _get(self, name: str, context_factory: Callable[[], dict]) -> _PrerenderedTemplate:
+        prerendered = self._prerendered.get(name)
+        if prerendered is None or (self.auto_reload and not prerendered.template.is_up_to_date):
+            prerendered = self._prerendered[name] = self._build(name, context_factory())
+        return prerendered
+
+    def render(self, name: str, context_factory: Callable[[], dict], code: str) -> str:
+        prerendered = self._get(name, context_factory)
+        if prerendered.parts is None:
+            return prerendered.template.render(**prerendered.context, code=code)
+        return str(escape(code)).join(prerendered.parts)
+
+    def render_verification(self, code: str) -> str:
+        """인증코드 메일 본문(HTML) 생성"""
+        return self.render(VERIFICATION_TEMPLATE, verification_context, code)
+
+    def load(self) -> None:
+        """서버 시작 시 템플릿을 미리 컴파일합니다. 템플릿이 없거나 문법 오류가 있으면 예외가 발생합니다."""
+        self._get(VERIFICATION_TEMPLATE, verification_context)
+
+
+email_template_renderer = EmailTemplateRenderer()
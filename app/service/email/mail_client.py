@@ -0,0 +1,186 @@
+import asyncio
+import os
+import time
+from email.message import EmailMessage
+from typing import Optional
+
+import aiosmtplib
+
+from config.email_config import EmailConfig
+from config.logger import get_logger
+from util.metrics import Histogram
+
+logger = get_logger(__name__)
+
+# SMTP 커넥션 풀 설정
+MAIL_POOL_SIZE = int(os.getenv("MAIL_POOL_SIZE", 4))
+MAIL_POOL_MAX_IDLE_SECONDS = float(os.getenv("MAIL_POOL_MAX_IDLE_SECONDS", 60))
+MAIL_TIMEOUT_SECONDS = float(os.getenv("MAIL_TIMEOUT_SECONDS", 30))
+
+
+class _PooledConnection:
+    def __init__(self, smtp: aiosmtplib.SMTP):
+        self.smtp = smtp
+        self.last_used = time.monotonic()
+
+
+class MailClient:
+    """
+    프로세스 전체에서 공유하는 SMTP 발송 클라이언트
+    - 로그인(및 STARTTLS 또는 암묵적 TLS)까지 마친 SMTP 커넥션을 최대 pool_size개 유지하며 발송마다 재사용합니다.
+    - 사용 가능한 커넥션이 없으면 반납될 때까지 기다립니다.
+    - max_idle_seconds 이상 쉬던 커넥션은 서버가 끊었을 수 있으므로 새로 연결합니다.
+    - 발송 중 연결이 끊기면 한 번 다시 연결해 재시도합니다.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: Optional[str],
+        password: Optional[str],
+        sender: str,
+        start_tls: bool = True,
+        use_tls: bool = False,
+        pool_size: int = MAIL_POOL_SIZE,
+        max_idle_seconds: float = MAIL_POOL_MAX_IDLE_SECONDS,
+        timeout: float = MAIL_TIMEOUT_SECONDS,
+    ):
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.sender = sender
+        self.start_tls = start_tls
+        self.use_tls = use_tls
+        self.pool_size = pool_size
+        self.max_idle_seconds = max_idle_seconds
+        self.timeout = timeout
+        self._idle: list[_PooledConnection] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.connections_opened = 0
+        self.reconnects = 0
+        self.sent = 0
+        self.failed = 0
+        self.send_duration = Histogram("mail_send_seconds")
+
+    @classmethod
+    def from_config(cls) -> "MailClient":
+        return cls(
+            hostname=EmailConfig.MAIL_SERVER,
+            port=EmailConfig.MAIL_PORT,
+            username=EmailConfig.MAIL_USERNAME if EmailConfig.MAIL_USE_CREDENTIALS else None,
+            password=EmailConfig.MAIL_PASSWORD if EmailConfig.MAIL_USE_CREDENTIALS else None,
+            sender=EmailConfig.MAIL_FROM,
+            start_tls=EmailConfig.MAIL_STARTTLS,
+            use_tls=EmailConfig.MAIL_SSL_TLS,
+        )
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.pool_size)
+        return self._slots
+
+    async def _connect(self) -> _PooledConnection:
+        smtp = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            start_tls=self.start_tls,
+            use_tls=self.use_tls,
+            timeout=self.timeout,
+        )
+        try:
+            await smtp.connect()
+        except BaseException:
+            # TLS 협상이나 로그인에서 실패해도 소켓은 열려 있으므로 닫음
+            smtp.close()
+            raise
+        self.connections_opened += 1
+        return _PooledConnection(smtp)
+
+    async def _discard(self, connection: _PooledConnection) -> None:
+        try:
+            await connection.smtp.quit()
+        except Exception:
+            connection.smtp.close()
+
+    async def _checkout(self) -> _PooledConnection:
+        while self._idle:
+            connection = self._idle.pop()
+            if connection.smtp.is_connected and time.monotonic() - connection.last_used < self.max_idle_seconds:
+                return connection
+            await self._discard(connection)
+        return await self._connect()
+
+    def _build_message(self, recipient: str, subject: str, html: str) -> EmailMessage:
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = recipient
+        message["Subject"] = subject
+        message.set_content(html, subtype="html")
+        return message
+
+    async def send(self, recipient: str, subject: str, html: str) -> None:
+        """HTML 메일 1건을 발송합니다. 실패하면 예외가 발생합니다."""
+        message = self._build_message(recipient, subject, html)
+        started = time.perf_counter()
+        async with self._get_slots():
+            connection = None
+            try:
+                # 연결/로그인 실패도 발송 실패로 셈
+                connection = await self._checkout()
+                try:
+                    await connection.smtp.send_message(message)
+                except (aiosmtplib.SMTPServerDisconnected, ConnectionError):
+                    # 서버가 유휴 커넥션을 끊은 경우 새 커넥션으로 한 번 재시도
+                    self.reconnects += 1
+                    connection.smtp.close()
+                    connection = None
+                    connection = await self._connect()
+                    await connection.smtp.send_message(message)
+            except asyncio.CancelledError:
+                # 시간 초과 등으로 취소되면 응답을 기다리던 커넥션은 상태를 알 수 없으므로 재사용하지 않고 닫음
+                self.failed += 1
+                if connection is not None:
+                    connection.smtp.close()
+                raise
+            except Exception:
+                self.failed += 1
+                if connection is not None:
+                    await self._discard(connection)
+                raise
+            finally:
+                self.send_duration.observe(time.perf_counter() - started)
+
+            connection.last_used = time.monotonic()
+            self._idle.append(connection)
+            self.sent += 1
+
+    async def start(self) -> None:
+        """설정을 검증하고 커넥션 하나를 미리 연결합니다. 연결 실패는 첫 발송 때 다시 시도합니다."""
+        EmailConfig.validate_config()
+        try:
+            self._idle.append(await self._connect())
+        except Exception as e:
+            logger.warning(f"SMTP 사전 연결 실패 - 서버: {self.hostname}:{self.port}, 오류: {str(e)}")
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            await self._discard(connection)
+
+    def snapshot(self) -> dict:
+        return {
+            "pool_size": self.pool_size,
+            "idle": len(self._idle),
+            "connections_opened": self.connections_opened,
+            "reconnects": self.reconnects,
+            "sent": self.sent,
+            "failed": self.failed,
+            "send_duration": self.send_duration.snapshot(),
+        }
+
+
+mail_client = MailClient.from_config()
@@ -0,0 +1,190 @@
+import asyncio
+import os
+from typing import Optional
+
+from config.database import AsyncSessionLocal
+from config.logger import get_logger
+from dao.member.email_outbox_dao import EmailOutboxDAO
+from dao.unit_of_work import UnitOfWork
+from service.email.mail_client import MailClient, mail_client
+
+logger = get_logger(__name__)
+
+# 발송 대기열 워커 설정
+# 웹 프로세스마다 워커를 띄우지 않도록 기본값은 false - 전용 프로세스 하나로 실행 (bin/run.sh)
+OUTBOX_WORKER_ENABLED = os.getenv("OUTBOX_WORKER_ENABLED", "false").lower() == "true"
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", 50))
+OUTBOX_POLL_SECONDS = float(os.getenv("OUTBOX_POLL_SECONDS", 1))
+OUTBOX_LEASE_SECONDS = float(os.getenv("OUTBOX_LEASE_SECONDS", 60))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", 5))
+OUTBOX_BACKOFF_BASE_SECONDS = float(os.getenv("OUTBOX_BACKOFF_BASE_SECONDS", 5))
+OUTBOX_BACKOFF_MAX_SECONDS = float(os.getenv("OUTBOX_BACKOFF_MAX_SECONDS", 600))
+
+
+class OutboxWorker:
+    """
+    email_outbox 발송 워커
+    - 발송 대상을 임대(claim)하고 트랜잭션을 끝낸 뒤 SMTP 커넥션 풀 크기만큼 동시에 발송합니다.
+    - 발송은 임대 시간의 절반 안에 끝나야 하며, 남은 절반은 결과 기록에 씁니다.
+      SMTP가 느리거나 죽어 있어도 임대가 끝나기 전에 결과를 기록하므로, 다른 워커가 발송 중인 메일을 다시 가져가지 않습니다.
+    - 한 번에 임대하는 건수는 최근 평균 발송 시간으로 그 안에 보낼 수 있는 만큼(최대 batch_size)으로 정합니다.
+    - 발송을 시작했다가 시간을 넘기면 실패로 기록하고, 커넥션 차례가 오지 않아 시도하지 못한 메일은 시도 횟수를 늘리지 않고 반납합니다.
+    - 실패한 메일은 base * 2^(시도 횟수 - 1)초(최대 backoff_max) 뒤 재시도하고, max_attempts를 넘으면 DEAD로 남깁니다.
+    - 여러 프로세스에서 동시에 실행해도 SKIP LOCKED로 같은 메일을 나눠 갖지 않습니다.
+    - 발송 도중 프로세스가 죽으면 임대 시간이 지난 뒤 다시 발송되므로, 드물게 중복 발송될 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        mail: MailClient,
+        session_factory=AsyncSessionLocal,
+        batch_size: int = OUTBOX_BATCH_SIZE,
+        poll_seconds: float = OUTBOX_POLL_SECONDS,
+        lease_seconds: float = OUTBOX_LEASE_SECONDS,
+        max_attempts: int = OUTBOX_MAX_ATTEMPTS,
+        backoff_base_seconds: float = OUTBOX_BACKOFF_BASE_SECONDS,
+        backoff_max_seconds: float = OUTBOX_BACKOFF_MAX_SECONDS,
+    ):
+        self.mail = mail
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self._wakeup: Optional[asyncio.Event] = None
+        self._last_claim_size = batch_size
+        self.sent = 0
+        self.released = 0
+        self.retried = 0
+        self.dead = 0
+
+    def _get_wakeup(self) -> asyncio.Event:
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        return self._wakeup
+
+    def notify(self) -> None:
+        """새 메일이 커밋되었음을 알려 다음 폴링을 기다리지 않고 발송합니다."""
+        self._get_wakeup().set()
+
+    def backoff_seconds(self, attempts: int) -> float:
+        return min(self.backoff_base_seconds * 2 ** (attempts - 1), self.backoff_max_seconds)
+
+    def expected_send_seconds(self) -> float:
+        """최근 평균 발송 시간 - 아직 발송 기록이 없으면 SMTP 타임아웃으로 보수적으로 가정"""
+        duration = self.mail.send_duration.snapshot()
+        return max(duration["avg"] if duration["count"] else self.mail.timeout, 0.001)
+
+    def claim_size(self, send_budget: float, expected_seconds: float) -> int:
+        """커넥션 풀이 send_budget초 안에 보낼 수 있는 건수 (최소 풀 크기, 최대 batch_size)"""
+        waves = max(int(send_budget // expected_seconds), 1)
+        return min(self.mail.pool_size * waves, self.batch_size)
+
+    async def _send(self, row, timeout: float) -> None:
+        try:
+            await asyncio.wait_for(self.mail.send(row.recipient, row.subject, row.body), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"메일 발송 시간 초과 (임대 시간 {self.lease_seconds}s)") from None
+
+    async def drain_once(self) -> int:
+        """발송 대상 한 묶음을 처리하고 임대한 건수를 반환합니다."""
+        loop = asyncio.get_running_loop()
+        send_budget = self.lease_seconds / 2
+        expected_seconds = self.expected_send_seconds()
+        self._last_claim_size = self.claim_size(send_budget, expected_seconds)
+        # 임대는 claim 시점부터 시작되므로 claim 전에 마감 시각을 정함
+        deadline = loop.time() + send_budget
+        async with self.session_factory() as db:
+            async with UnitOfWork(db):
+                rows = await EmailOutboxDAO(db).claim_batch(self._last_claim_size, self.lease_seconds)
+        if not rows:
+            return 0
+
+        slots = asyncio.Semaphore(self.mail.pool_size)
+        started = 0
+
+        async def send(row):
+            nonlocal started
+            async with slots:
+                remaining = deadline - loop.time()
+                # 첫 묶음(풀 크기만큼)은 바로 시작하고, 이후에는 예상 발송 시간이 남아 있을 때만 시작
+                if remaining <= 0 or (started >= self.mail.pool_size and remaining < expected_seconds):
+                    return False
+                started += 1
+                await self._send(row, remaining)
+                return True
+
+        results = await asyncio.gather(*(send(row) for row in rows), return_exceptions=True)
+
+        async with self.session_factory() as db:
+            async with UnitOfWork(db):
+                dao = EmailOutboxDAO(db)
+                sent_ids = [row.id for row, result in zip(rows, results) if result is True]
+                if sent_ids:
+                    await dao.mark_sent(sent_ids)
+                released_ids = [row.id for row, result in zip(rows, results) if result is False]
+                if released_ids:
+                    await dao.release(released_ids)
+                for row, result in zip(rows, results):
+                    if not isinstance(result, BaseException):
+                        continue
+                    if row.attempts >= self.max_attempts:
+                        await dao.mark_failed(row.id, str(result), None)
+                        self.dead += 1
+                        logger.error(f"메일 발송 최종 실패 - 수신: {row.recipient}, 시도: {row.attempts}, 오류: {str(result)}")
+                    else:
+                        await dao.mark_failed(row.id, str(result), self.backoff_seconds(row.attempts))
+                        self.retried += 1
+                        logger.warning(f"메일 발송 실패, 재시도 예정 - 수신: {row.recipient}, 시도: {row.attempts}, 오류: {str(result)}")
+
+        self.sent += len(sent_ids)
+        self.released += len(released_ids)
+        return len(rows)
+
+    async def run(self) -> None:
+        """발송 대기열을 계속 비웁니다. lifespan의 백그라운드 작업이나 별도 프로세스로 실행합니다."""
+        wakeup = self._get_wakeup()
+        while True:
+            try:
+                processed = await self.drain_once()
+            except Exception as e:
+                logger.error(f"메일 발송 대기열 처리 실패: {str(e)}")
+                processed = 0
+
+            # 한 묶음을 가득 채웠으면 남은 메일이 있을 수 있으므로 바로 다음 묶음 처리
+            if processed < self._last_claim_size:
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=self.poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                wakeup.clear()
+
+    def snapshot(self) -> dict:
+        return {
+            "enabled": OUTBOX_WORKER_ENABLED,
+            "batch_size": self.batch_size,
+            "last_claim_size": self._last_claim_size,
+            "sent": self.sent,
+            "released": self.released,
+            "retried": self.retried,
+            "dead": self.dead,
+        }
+
+
+outbox_worker = OutboxWorker(mail_client)
+
+
+async def _main() -> None:
+    await mail_client.start()
+    logger.info("메일 발송 워커 시작")
+    try:
+        await outbox_worker.run()
+    finally:
+        await mail_client.close()
+
+
+if __name__ == "__main__":
+    # 웹 프로세스와 분리해 실행: cd app && python -m service.email.outbox_worker
+    asyncio.run(_main())
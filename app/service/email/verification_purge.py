@@ -0,0 +1,106 @@
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from config.database import AsyncSessionLocal
+from config.email_config import EmailConfig
+from config.logger import get_logger
+from dao.member.email_outbox_dao import EmailOutboxDAO
+from dao.unit_of_work import UnitOfWork
+from service.email.email_service import EmailService
+
+logger = get_logger(__name__)
+
+# 인증/발송 대기열 정리 작업 설정
+VERIFICATION_PURGE_ENABLED = os.getenv("VERIFICATION_PURGE_ENABLED", "true").lower() == "true"
+VERIFICATION_PURGE_INTERVAL_SECONDS = float(os.getenv("VERIFICATION_PURGE_INTERVAL_SECONDS", 300))
+VERIFICATION_PURGE_BATCH_SIZE = int(os.getenv("VERIFICATION_PURGE_BATCH_SIZE", 1000))
+VERIFICATION_PURGE_BATCH_PAUSE_SECONDS = float(os.getenv("VERIFICATION_PURGE_BATCH_PAUSE_SECONDS", 0.05))
+OUTBOX_SENT_RETENTION_HOURS = float(os.getenv("OUTBOX_SENT_RETENTION_HOURS", 24))
+
+
+class VerificationPurgeJob:
+    """
+    email_verification / email_outbox 정리 작업
+    - 만료된 미인증 레코드, 보관 기간이 지난 인증 레코드와 발송 완료 메일을 삭제합니다.
+    - batch_size건씩 나눠 삭제하고 배치마다 커밋하므로 긴 트랜잭션이나 잠금을 만들지 않습니다.
+    - 다른 트랜잭션이 잠근 행은 건너뛰고 다음 실행에서 삭제합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory=AsyncSessionLocal,
+        batch_size: int = VERIFICATION_PURGE_BATCH_SIZE,
+        batch_pause_seconds: float = VERIFICATION_PURGE_BATCH_PAUSE_SECONDS,
+        verified_retention: timedelta = timedelta(hours=EmailConfig.VERIFICATION_VERIFIED_RETENTION_HOURS),
+        sent_retention: timedelta = timedelta(hours=OUTBOX_SENT_RETENTION_HOURS),
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.batch_pause_seconds = batch_pause_seconds
+        self.verified_retention = verified_retention
+        self.sent_retention = sent_retention
+        self.runs = 0
+        self.batches = 0
+        self.purged = {"expired": 0, "verified": 0, "outbox_sent": 0}
+        self.last_run_at: Optional[datetime] = None
+        self.last_run_seconds: Optional[float] = None
+
+    async def _purge(self, kind: str, delete_batch) -> int:
+        total = 0
+        while True:
+            async with self.session_factory() as db:
+                async with UnitOfWork(db):
+                    deleted = await delete_batch(db)
+            self.batches += 1
+            self.purged[kind] += deleted
+            total += deleted
+            if deleted < self.batch_size:
+                return total
+            await asyncio.sleep(self.batch_pause_seconds)
+
+    async def purge_once(self) -> dict:
+        """정리 대상을 모두 삭제하고 종류별 삭제 건수를 반환합니다."""
+        started = time.perf_counter()
+        now = datetime.now(timezone.utc)
+        purged = {
+            "expired": await self._purge(
+                "expired", lambda db: EmailService(db).purge_expired_verifications(now, self.batch_size)
+            ),
+            "verified": await self._purge(
+                "verified", lambda db: EmailService(db).purge_verified_verifications(now - self.verified_retention, self.batch_size)
+            ),
+            "outbox_sent": await self._purge(
+                "outbox_sent", lambda db: EmailOutboxDAO(db).delete_sent(now - self.sent_retention, self.batch_size)
+            ),
+        }
+        self.runs += 1
+        self.last_run_at = now
+        self.last_run_seconds = time.perf_counter() - started
+        if any(purged.values()):
+            logger.info(f"인증 레코드 정리 완료 - {purged}, 소요: {self.last_run_seconds:.2f}s")
+        return purged
+
+    async def run(self, interval_seconds: float = VERIFICATION_PURGE_INTERVAL_SECONDS) -> None:
+        while True:
+            try:
+                await self.purge_once()
+            except Exception as e:
+                logger.error(f"인증 레코드 정리 실패: {str(e)}")
+            await asyncio.sleep(interval_seconds)
+
+    def snapshot(self) -> dict:
+        return {
+            "enabled": VERIFICATION_PURGE_ENABLED,
+            "batch_size": self.batch_size,
+            "runs": self.runs,
+            "batches": self.batches,
+            "purged": dict(self.purged),
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "last_run_seconds": self.last_run_seconds,
+        }
+
+
+verification_purge = VerificationPurgeJob()
@@ -0,0 +1,23 @@
+import os
+
+from config.email_config import EmailConfig
+from util.rate_limiter import SlidingWindowLimiter
+
+# 인증코드 발송 제한 설정 - 한도와 기간은 EmailConfig(MAX_VERIFICATION_ATTEMPTS, RATE_LIMIT_MINUTES)를 따름
+VERIFICATION_RATE_LIMIT_MAX_KEYS = int(os.getenv("VERIFICATION_RATE_LIMIT_MAX_KEYS", 100000))
+
+# 프로세스(워커)마다 별도로 유지되므로, 실제 한도는 워커 수만큼 늘어납니다.
+verification_limiter = SlidingWindowLimiter(
+    "verification_email",
+    EmailConfig.MAX_VERIFICATION_ATTEMPTS if EmailConfig.ENABLE_RATE_LIMITING else 0,
+    EmailConfig.RATE_LIMIT_MINUTES * 60,
+    VERIFICATION_RATE_LIMIT_MAX_KEYS,
+)
+
+
+def check_verification_send(email: str) -> float:
+    """
+    인증 레코드를 만들기 전에 이메일별 발송 횟수를 확인합니다.
+    허용되면 0을, 한도를 넘으면 다시 요청할 수 있을 때까지의 초를 반환합니다.
+    """
+    return verification_limiter.acquire(email.strip().lower())
@@ -0,0 +1,13 @@
+import os
+
+from util.cache import TTLCache
+
+# 인증 완료 이메일 캐시 설정 (TTL 0이면 비활성화)
+VERIFIED_EMAIL_CACHE_MAX_SIZE = int(os.getenv("VERIFIED_EMAIL_CACHE_MAX_SIZE", 10000))
+VERIFIED_EMAIL_CACHE_TTL_SECONDS = float(os.getenv("VERIFIED_EMAIL_CACHE_TTL_SECONDS", 600))
+
+# 이메일 -> 인증 시각(verified_at)
+# 인증된 경우만 저장합니다. (미인증 결과는 곧 바뀔 수 있어 저장하지 않음)
+# 프로세스(워커)마다 별도로 유지되므로, 다른 프로세스의 정리 작업이 지웠을 수 있는 보관 기간이 지난 인증 시각은
+# 조회하는 쪽(EmailService.is_email_verified)에서 무시합니다.
+verified_email_cache = TTLCache("verified_email", VERIFIED_EMAIL_CACHE_MAX_SIZE, VERIFIED_EMAIL_CACHE_TTL_SECONDS)
@@ -0,0 +1,30 @@
+import os
+from typing import Optional
+
+from util.rate_limiter import SlidingWindowLimiter
+
+# 로그인 시도 제한 설정 (한도 0이면 비활성화)
+LOGIN_RATE_LIMIT_WINDOW_SECONDS = float(os.getenv("LOGIN_RATE_LIMIT_WINDOW_SECONDS", 60))
+LOGIN_RATE_LIMIT_PER_EMAIL = int(os.getenv("LOGIN_RATE_LIMIT_PER_EMAIL", 10))
+LOGIN_RATE_LIMIT_PER_IP = int(os.getenv("LOGIN_RATE_LIMIT_PER_IP", 30))
+LOGIN_RATE_LIMIT_MAX_KEYS = int(os.getenv("LOGIN_RATE_LIMIT_MAX_KEYS", 100000))
+
+# 프로세스(워커)마다 별도로 유지되므로, 실제 한도는 워커 수만큼 늘어납니다.
+login_limiter_by_email = SlidingWindowLimiter(
+    "login_email", LOGIN_RATE_LIMIT_PER_EMAIL, LOGIN_RATE_LIMIT_WINDOW_SECONDS, LOGIN_RATE_LIMIT_MAX_KEYS
+)
+login_limiter_by_ip = SlidingWindowLimiter(
+    "login_ip", LOGIN_RATE_LIMIT_PER_IP, LOGIN_RATE_LIMIT_WINDOW_SECONDS, LOGIN_RATE_LIMIT_MAX_KEYS
+)
+
+
+def check_login_attempt(email: str, client_ip: Optional[str]) -> float:
+    """
+    DB 조회와 bcrypt 검증 전에 로그인 시도 횟수를 확인합니다.
+    허용되면 0을, 한도를 넘으면 다시 시도할 수 있을 때까지의 초를 반환합니다.
+    """
+    if client_ip:
+        retry_after = login_limiter_by_ip.acquire(client_ip)
+        if retry_after:
+            return retry_after
+    return login_limiter_by_email.acquire(email.strip().lower())
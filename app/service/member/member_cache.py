@@ -0,0 +1,25 @@
+import os
+
+from dto.auth_dto import MemberInfoDTO
+from model.member.member import Member
+from util.cache import TTLCache
+
+# 인증된 회원 정보 캐시 설정 (TTL 0이면 비활성화)
+MEMBER_CACHE_MAX_SIZE = int(os.getenv("MEMBER_CACHE_MAX_SIZE", 10000))
+MEMBER_CACHE_TTL_SECONDS = float(os.getenv("MEMBER_CACHE_TTL_SECONDS", 60))
+
+# 토큰 subject(이메일) -> MemberInfoDTO
+# 프로세스(워커)마다 별도로 유지되므로, 다른 워커의 변경은 TTL이 지나야 반영됩니다.
+member_cache = TTLCache("member", MEMBER_CACHE_MAX_SIZE, MEMBER_CACHE_TTL_SECONDS)
+
+
+def to_member_info(member: Member) -> MemberInfoDTO:
+    """세션과 분리된 캐시용 회원 정보로 변환합니다."""
+    return MemberInfoDTO(
+        id=member.id,
+        email=member.email,
+        nickname=member.nickname,
+        role=member.role.value,
+        created_at=member.created_at,
+        updated_at=member.updated_at,
+    )
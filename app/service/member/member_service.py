@@ -1,18 +1,31 @@
 from typing import Optional, List
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
 from dao.member.member_dao import MemberDAO
+from dao.unit_of_work import UnitOfWork
 from model.member.member import Member, MemberRole, MemberGrade
-from sqlalchemy.orm import Session
-from util.hash_util import HashUtil
+from sqlalchemy.ext.asyncio import AsyncSession
+from util.hash_util import HashUtil, HashingSaturatedError
+from service.member.member_cache import member_cache
 from config.logger import get_logger
 
 logger = get_logger(__name__)
 
 class MemberService:
-    def __init__(self, session: Session):
+    def __init__(self, session: AsyncSession):
+        self.session = session
         self.member_dao = MemberDAO(session)
         self.hash_util = HashUtil()
 
-    def register_member(self, email: str, password: str, nickname: str) -> Optional[Member]:
+    async def _release_connection(self) -> None:
+        """
+        해싱 전에 읽기 트랜잭션을 끝내 커넥션을 풀에 반납합니다.
+        해싱 대기 중에 커넥션을 쥐고 있으면 로그인이 몰릴 때 다른 요청이 풀 대기에 걸립니다.
+        """
+        if not self.session.info.get("uow_depth") and self.session.in_transaction():
+            await self.session.commit()
+
+    async def register_member(self, email: str, password: str, nickname: str) -> Optional[Member]:
         """
         새로운 회원을 등록합니다.
         """
@@ -21,102 +34,148 @@ class MemberService:
             if not Member.validate_password(password):
                 raise ValueError("비밀번호는 최소 8자 이상이며, 대문자, 소문자, 숫자, 특수문자 중 3가지 이상을 포함해야 합니다")
 
-            # 이메일 중복 체크
-            existing_member = self.member_dao.get_member_by_email(email)
-            if existing_member:
-                logger.warning(f"이미 존재하는 이메일로 회원가입 시도: {email}")
-                return None
-
             # 비밀번호 해싱
-            hashed_password = self.hash_util.hash_password(password)
+            await self._release_connection()
+            hashed_password = await self.hash_util.hash_password_async(password)
             
-            # 회원 생성
-            return self.member_dao.create_member(email, hashed_password, nickname)
+            # 회원 생성 - 이메일/닉네임 중복은 미리 조회하지 않고 유니크 제약으로 판정
+            async with UnitOfWork(self.session):
+                return await self.member_dao.create_member(email, hashed_password, nickname)
+        except IntegrityError as e:
+            logger.warning(f"중복된 회원 정보로 회원가입 시도: {email}")
+            if "nickname" in str(e.orig):
+                raise ValueError("이미 사용 중인 닉네임입니다")
+            raise ValueError("이미 가입된 이메일입니다")
+        except (HashingSaturatedError, ValueError):
+            raise
         except Exception as e:
             logger.error(f"회원가입 중 오류 발생: {str(e)}")
             return None
 
-    def login(self, email: str, password: str) -> Optional[Member]:
+    async def check_signup(self, email: str, nickname: str) -> Row:
+        """
+        이메일/닉네임 중복 여부와 이메일 인증 여부를 한 번에 확인합니다.
+        """
+        return await self.member_dao.check_signup(email, nickname)
+
+    async def login(self, email: str, password: str) -> Optional[Member]:
         """
         회원 로그인을 처리합니다.
         """
         try:
-            member = self.member_dao.get_member_by_email(email)
+            # 가입 직후 로그인이나 비밀번호 변경 직후에도 최신 해시로 검증하도록 primary에서 조회
+            member = await self.member_dao.get_member_by_email(email, use_replica=False)
             if not member:
                 logger.warning(f"존재하지 않는 이메일로 로그인 시도: {email}")
                 return None
 
             # 비밀번호 검증
-            if not self.hash_util.verify_password(password, member.password):
+            await self._release_connection()
+            if not await self.hash_util.verify_password_async(password, member.password):
                 return None
 
+            if self.hash_util.needs_rehash(member.password):
+                await self._rehash_password(member, password)
+
             return member
+        except HashingSaturatedError:
+            raise
         except Exception as e:
             logger.error(f"로그인 중 오류 발생: {str(e)}")
             return None
 
-    def get_member(self, member_id: int) -> Optional[Member]:
+    async def _rehash_password(self, member: Member, password: str) -> None:
+        """
+        저장된 해시의 cost가 현재 설정과 다르면 로그인한 평문 비밀번호로 다시 해싱해 저장합니다.
+        실패해도 로그인은 그대로 진행하며, 다음 로그인에서 다시 시도합니다.
+        """
+        # 갱신 실패 시 롤백으로 회원 객체가 만료되지 않도록 세션에서 분리
+        self.session.expunge(member)
+        try:
+            hashed_password = await self.hash_util.hash_password_async(password)
+            async with UnitOfWork(self.session):
+                await self.member_dao.update_password(member.id, hashed_password)
+            member.password = hashed_password
+            logger.info(f"비밀번호 재해싱 완료 - 이메일: {member.email}, cost: {self.hash_util.rounds}")
+        except Exception as e:
+            logger.warning(f"비밀번호 재해싱 실패 - 이메일: {member.email}, 오류: {str(e)}")
+
+    async def get_member(self, member_id: int) -> Optional[Member]:
         """
         회원 ID로 회원 정보를 조회합니다.
         """
-        return self.member_dao.get_member_by_id(member_id)
+        return await self.member_dao.get_member_by_id(member_id)
 
-    def get_member_by_email(self, email: str) -> Optional[Member]:
+    async def get_member_by_email(self, email: str) -> Optional[Member]:
         """
         이메일로 회원 정보를 조회합니다.
         """
-        return self.member_dao.find_by_email(email)
+        return await self.member_dao.find_by_email(email)
 
-    def get_member_by_nickname(self, nickname: str) -> Optional[Member]:
+    async def get_member_by_nickname(self, nickname: str) -> Optional[Member]:
         """
         닉네임으로 회원 조회
         """
-        return self.member_dao.find_by_nickname(nickname)
+        return await self.member_dao.find_by_nickname(nickname)
 
-    def get_members_by_role(self, role: MemberRole) -> List[Member]:
+    async def get_members_by_role(self, role: MemberRole) -> List[Member]:
         """
         역할별로 회원 목록을 조회합니다.
         """
-        return self.member_dao.find_by_role(role)
+        return await self.member_dao.get_members_by_role(role)
 
-    def get_members_by_grade(self, grade: MemberGrade) -> List[Member]:
+    async def get_members_by_grade(self, grade: MemberGrade) -> List[Member]:
         """
         등급별로 회원 목록을 조회합니다.
         """
-        return self.member_dao.get_members_by_grade(grade)
+        return await self.member_dao.get_members_by_grade(grade)
 
-    def update_member(self, member_id: int, **kwargs) -> Optional[Member]:
+    async def update_member(self, member_id: int, **kwargs) -> Optional[Member]:
         """
         회원 정보를 업데이트합니다.
         """
         try:
             # 회원 존재 여부 확인
-            member = self.member_dao.get_member_by_id(member_id)
+            member = await self.member_dao.get_member_by_id(member_id)
             if not member:
                 logger.warning(f"존재하지 않는 회원 정보 업데이트 시도: {member_id}")
                 return None
 
             # 비밀번호가 포함된 경우 해싱
             if 'password' in kwargs:
-                kwargs['password'] = self.hash_util.hash_password(kwargs['password'])
-
-            return self.member_dao.update_member(member_id, **kwargs)
+                await self._release_connection()
+                kwargs['password'] = await self.hash_util.hash_password_async(kwargs['password'])
+
+            email = member.email
+            async with UnitOfWork(self.session):
+                updated_member = await self.member_dao.update_member(member_id, **kwargs)
+
+            # 커밋 이후 캐시 무효화 (다음 인증 요청에서 변경된 정보를 다시 읽음)
+            member_cache.invalidate(email)
+            return updated_member
+        except HashingSaturatedError:
+            raise
         except Exception as e:
             logger.error(f"회원 정보 업데이트 중 오류 발생: {str(e)}")
             return None
 
-    def delete_member(self, member_id: int) -> bool:
+    async def delete_member(self, member_id: int) -> bool:
         """
         회원을 삭제합니다.
         """
         try:
             # 회원 존재 여부 확인
-            member = self.member_dao.get_member_by_id(member_id)
+            member = await self.member_dao.get_member_by_id(member_id)
             if not member:
                 logger.warning(f"존재하지 않는 회원 삭제 시도: {member_id}")
                 return False
 
-            return self.member_dao.delete_member(member_id)
+            email = member.email
+            async with UnitOfWork(self.session):
+                deleted = await self.member_dao.delete_member(member_id)
+
+            member_cache.invalidate(email)
+            return deleted
         except Exception as e:
             logger.error(f"회원 삭제 중 오류 발생: {str(e)}")
             return False 
\ No newline at end of file
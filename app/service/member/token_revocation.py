@@ -0,0 +1,158 @@
+import asyncio
+import os
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from config.database import AsyncSessionLocal, async_engine
+from config.logger import get_logger
+from dao.member.revoked_token_dao import REVOCATION_CHANNEL, RevokedTokenDAO
+from dao.unit_of_work import UnitOfWork
+from util.bloom_filter import BloomFilter
+
+logger = get_logger(__name__)
+
+# 폐기 목록 설정
+REVOCATION_BLOOM_CAPACITY = int(os.getenv("REVOCATION_BLOOM_CAPACITY", 100000))
+REVOCATION_BLOOM_ERROR_RATE = float(os.getenv("REVOCATION_BLOOM_ERROR_RATE", 0.001))
+REVOCATION_RELOAD_SECONDS = float(os.getenv("REVOCATION_RELOAD_SECONDS", 10))
+
+
+class TokenRevocationStore:
+    """
+    jti 기반 토큰 폐기 목록
+    - revoked_token 테이블이 원본이며, 프로세스마다 블룸 필터 사본을 유지합니다.
+    - 폐기되지 않은 토큰(대부분의 요청)은 블룸 필터만 확인하고 DB를 조회하지 않습니다.
+    - 필터에 걸린 경우에만 테이블에서 실제 폐기 여부를 확인합니다.
+    - 폐기는 커밋과 함께 REVOCATION_CHANNEL로 알려지고, 각 프로세스의 watch()가 이를 받아 즉시 필터에 추가합니다.
+    - 필터를 아직 불러오지 못했거나 알림 구독이 끊긴 동안에는 필터를 믿지 않고 매번 테이블을 확인합니다.
+      (DB도 실패하면 예외가 그대로 올라가 요청이 거부됨)
+    - 주기적으로 만료된 기록을 삭제하고 필터를 다시 만듭니다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._filter = BloomFilter(capacity, error_rate)
+        self._pending: Optional[set[str]] = None
+        self._loaded = False
+        self._listening = False
+        self.checks = 0
+        self.db_checks = 0
+        self.notifications = 0
+        self.filter_hits = 0
+        self.false_positives = 0
+        self.pruned = 0
+        self.last_reload_at: Optional[datetime] = None
+
+    @property
+    def is_live(self) -> bool:
+        """필터가 테이블과 같은 상태로 유지되고 있는지 - 불러온 뒤 알림 구독 중일 때만 참"""
+        return self._loaded and self._listening
+
+    def _add(self, jti: str) -> None:
+        self._filter.add(jti)
+        # 필터 재구성 중이면 새 필터에도 반영되도록 기록
+        if self._pending is not None:
+            self._pending.add(jti)
+
+    def _on_notification(self, connection, pid, channel, payload: str) -> None:
+        self.notifications += 1
+        self._add(payload)
+
+    def _on_termination(self, connection) -> None:
+        self._listening = False
+
+    async def is_revoked(self, db: AsyncSession, jti: str) -> bool:
+        self.checks += 1
+        if not self.is_live:
+            self.db_checks += 1
+            return await RevokedTokenDAO(db).exists(jti)
+
+        if jti not in self._filter:
+            return False
+
+        self.filter_hits += 1
+        revoked = await RevokedTokenDAO(db).exists(jti)
+        if not revoked:
+            self.false_positives += 1
+        return revoked
+
+    async def revoke(self, db: AsyncSession, jti: str, expires_at: datetime) -> None:
+        async with UnitOfWork(db):
+            dao = RevokedTokenDAO(db)
+            await dao.revoke(jti, expires_at)
+            await dao.notify(jti)
+
+        self._add(jti)
+
+    async def reload(self, session_factory=AsyncSessionLocal) -> None:
+        """만료 기록을 정리하고 테이블 기준으로 필터를 다시 만듭니다."""
+        self._pending = set()
+        try:
+            now = datetime.now(timezone.utc)
+            async with session_factory() as db:
+                async with UnitOfWork(db):
+                    pruned = await RevokedTokenDAO(db).delete_expired(now)
+                jtis = await RevokedTokenDAO(db).find_active_jtis(now)
+
+            # 폐기 건수가 설정 용량을 넘으면 오탐률 유지를 위해 필터를 키움
+            bloom_filter = BloomFilter(max(self.capacity, len(jtis) * 2), self.error_rate)
+            for jti in jtis:
+                bloom_filter.add(jti)
+            for jti in self._pending:
+                bloom_filter.add(jti)
+
+            self._filter = bloom_filter
+            self._loaded = True
+            self.pruned += pruned
+            self.last_reload_at = now
+        finally:
+            self._pending = None
+
+    async def watch(self, interval_seconds: float = REVOCATION_RELOAD_SECONDS, engine: AsyncEngine = async_engine, session_factory=AsyncSessionLocal) -> None:
+        """
+        폐기 알림을 구독하고 주기적으로 필터를 다시 만듭니다. lifespan의 백그라운드 작업으로 실행합니다.
+        구독을 시작한 뒤 필터를 다시 만들므로 구독 전에 커밋된 폐기도 빠지지 않으며, 연결이 끊기면 다시 연결합니다.
+        """
+        while True:
+            try:
+                async with engine.connect() as conn:
+                    listener = (await conn.get_raw_connection()).driver_connection
+                    await listener.add_listener(REVOCATION_CHANNEL, self._on_notification)
+                    listener.add_termination_listener(self._on_termination)
+                    self._listening = True
+                    try:
+                        while not listener.is_closed():
+                            await self.reload(session_factory)
+                            await asyncio.sleep(interval_seconds)
+                    finally:
+                        self._listening = False
+                        if not listener.is_closed():
+                            await listener.remove_listener(REVOCATION_CHANNEL, self._on_notification)
+                        listener.remove_termination_listener(self._on_termination)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"토큰 폐기 목록 갱신 실패: {str(e)}")
+            await asyncio.sleep(interval_seconds)
+
+    def snapshot(self) -> dict:
+        return {
+            "entries": len(self._filter),
+            "filter_capacity": self._filter.capacity,
+            "filter_bytes": self._filter.nbytes,
+            "loaded": self._loaded,
+            "listening": self._listening,
+            "checks": self.checks,
+            "db_checks": self.db_checks,
+            "notifications": self.notifications,
+            "filter_hits": self.filter_hits,
+            "false_positives": self.false_positives,
+            "pruned": self.pruned,
+            "last_reload_at": self.last_reload_at.isoformat() if self.last_reload_at else None,
+        }
+
+
+token_revocation = TokenRevocationStore(REVOCATION_BLOOM_CAPACITY, REVOCATION_BLOOM_ERROR_RATE)
@@ -0,0 +1,42 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    고정 크기 블룸 필터
+    - 포함되지 않은 항목은 항상 False (false negative 없음)
+    - 포함된 항목은 True, 포함되지 않은 항목도 error_rate 확률로 True가 될 수 있음
+    - 항목 삭제는 지원하지 않으므로 만료 항목은 필터를 다시 만들어 제거합니다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(capacity, 1)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size_bits = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.size_bits + 7) // 8)
+        self._count = 0
+
+    def _positions(self, item: str):
+        # 더블 해싱: 128비트 다이제스트 하나로 hash_count개의 위치를 만듦
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size_bits for i in range(self.hash_count))
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
@@ -0,0 +1,105 @@
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from util.metrics import Histogram
+
+# 파일 I/O 전용 스레드 수 / 동시에 스레드 풀에 넘기는 최대 작업 수 (초과분은 이벤트 루프에서 대기)
+FILE_IO_MAX_WORKERS = int(os.getenv("FILE_IO_MAX_WORKERS", 4))
+FILE_IO_MAX_QUEUE = int(os.getenv("FILE_IO_MAX_QUEUE", 64))
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+class FileIOExecutor:
+    """
+    이미지 저장소용 파일 I/O 전용 제한 스레드 풀
+    - open/read/write/rename 같은 블로킹 호출을 별도 스레드에서 실행해 느린 디스크(네트워크 볼륨 등)가 이벤트 루프를 막지 않게 합니다.
+    - 스레드 풀에 넘긴 작업이 max_workers + max_queue에 이르면 새 작업은 자리가 날 때까지 이벤트 루프에서 기다립니다.
+    - 작업 종류별 실행 시간, 대기 시간, 읽고 쓴 바이트 수를 수집합니다.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._in_flight = 0
+        self.operations: dict[str, int] = {}
+        self.errors = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.wait = Histogram("file_io_queue_wait_seconds")
+        self.durations: dict[str, Histogram] = {}
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="file-io")
+        return self._executor
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_workers + self.max_queue)
+        return self._slots
+
+    def _timed(self, submitted_at: float, operation: str, func, *args):
+        started = time.perf_counter()
+        self.wait.observe(started - submitted_at)
+        try:
+            return func(*args)
+        finally:
+            duration = self.durations.get(operation)
+            if duration is None:
+                duration = self.durations.setdefault(operation, Histogram(f"file_io_{operation}_seconds"))
+            duration.observe(time.perf_counter() - started)
+
+    async def run(self, operation: str, func, *args):
+        """func(*args)를 파일 I/O 스레드에서 실행합니다. operation은 지표 구분용 이름입니다."""
+        submitted_at = time.perf_counter()
+        async with self._get_slots():
+            # 카운터는 이벤트 루프 스레드에서만 변경되므로 별도 락이 필요 없음
+            self._in_flight += 1
+            self.operations[operation] = self.operations.get(operation, 0) + 1
+            try:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._get_executor(), self._timed, submitted_at, operation, func, *args)
+            except Exception:
+                self.errors += 1
+                raise
+            finally:
+                self._in_flight -= 1
+
+    async def read_file(self, path: str) -> bytes:
+        data = await self.run("read", _read_file, path)
+        self.bytes_read += len(data)
+        return data
+
+    async def write(self, file, data: bytes) -> None:
+        await self.run("write", file.write, data)
+        self.bytes_written += len(data)
+
+    def snapshot(self) -> dict:
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": self._in_flight,
+            "operations": dict(self.operations),
+            "errors": self.errors,
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+            "queue_wait": self.wait.snapshot(),
+            "duration": {operation: histogram.snapshot() for operation, histogram in list(self.durations.items())},
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+file_io_executor = FileIOExecutor(FILE_IO_MAX_WORKERS, FILE_IO_MAX_QUEUE)
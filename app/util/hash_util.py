@@ -1,12 +1,144 @@
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
 import bcrypt
 
+from config.logger import get_logger
+from util.metrics import Histogram
+
+logger = get_logger(__name__)
+
+# 해싱 전용 스레드 수 / 실행 대기 허용 건수 (bcrypt는 해싱 중 GIL을 해제하므로 스레드로 병렬 처리 가능)
+BCRYPT_MAX_WORKERS = int(os.getenv("BCRYPT_MAX_WORKERS", min(4, os.cpu_count() or 1)))
+BCRYPT_MAX_QUEUE = int(os.getenv("BCRYPT_MAX_QUEUE", 32))
+
+# bcrypt cost(work factor) 설정
+# 배포 환경마다 한 번 측정(python -m util.hash_util --target-ms 250)해 모든 인스턴스에 같은 값으로 고정
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+BCRYPT_MIN_ROUNDS = int(os.getenv("BCRYPT_MIN_ROUNDS", 10))
+BCRYPT_MAX_ROUNDS = int(os.getenv("BCRYPT_MAX_ROUNDS", 16))
+
+
+class HashingSaturatedError(Exception):
+    """해싱 대기열이 가득 차 요청을 거부할 때 발생합니다."""
+
+
+class HashExecutor:
+    """
+    bcrypt 전용 제한 스레드 풀
+    - 이벤트 루프를 막지 않도록 해싱을 별도 스레드에서 실행합니다.
+    - 실행 중 + 대기 중인 작업이 max_workers + max_queue를 넘으면 즉시 거부합니다.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = None
+        self._in_flight = 0
+        self.rejected = 0
+        self.wait = Histogram("hash_queue_wait_seconds")
+        self.duration = Histogram("hash_duration_seconds")
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="bcrypt")
+        return self._executor
+
+    def _timed(self, submitted_at: float, func, *args):
+        started = time.perf_counter()
+        self.wait.observe(started - submitted_at)
+        try:
+            return func(*args)
+        finally:
+            self.duration.observe(time.perf_counter() - started)
+
+    async def run(self, func, *args):
+        # 카운터는 이벤트 루프 스레드에서만 변경되므로 별도 락이 필요 없음
+        if self._in_flight >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            raise HashingSaturatedError("비밀번호 처리 요청이 많습니다. 잠시 후 다시 시도해주세요")
+
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), self._timed, time.perf_counter(), func, *args)
+        finally:
+            self._in_flight -= 1
+
+    def snapshot(self) -> dict:
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": self._in_flight,
+            "rejected": self.rejected,
+            "queue_wait": self.wait.snapshot(),
+            "duration": self.duration.snapshot(),
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+hash_executor = HashExecutor(BCRYPT_MAX_WORKERS, BCRYPT_MAX_QUEUE)
+
+
+def calibrate_bcrypt_rounds(
+    target_ms: float,
+    min_rounds: int = BCRYPT_MIN_ROUNDS,
+    max_rounds: int = BCRYPT_MAX_ROUNDS,
+    probe_rounds: int = 8,
+) -> int:
+    """
+    해시 1회가 target_ms를 넘지 않는 가장 큰 cost를 구합니다.
+    cost가 1 오를 때마다 소요 시간이 2배가 되므로, 낮은 cost로 몇 번 측정한 뒤 외삽합니다.
+    결과는 [min_rounds, max_rounds] 범위로 제한합니다.
+    """
+    salt = bcrypt.gensalt(rounds=probe_rounds)
+    probe_ms = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        bcrypt.hashpw(b"calibration", salt)
+        probe_ms = min(probe_ms, (time.perf_counter() - started) * 1000)
+
+    rounds = min_rounds
+    for candidate in range(min_rounds, max_rounds + 1):
+        if probe_ms * 2 ** (candidate - probe_rounds) <= target_ms:
+            rounds = candidate
+    return rounds
+
+
+def get_hash_rounds(hashed_password: str) -> Optional[int]:
+    """bcrypt 해시 문자열($2b$12$...)에서 cost를 읽습니다."""
+    try:
+        return int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return None
+
+
 class HashUtil:
+    # 새로 만드는 해시의 cost
+    rounds = BCRYPT_ROUNDS
+
+    @staticmethod
+    def needs_rehash(hashed_password: str) -> bool:
+        """
+        저장된 해시의 cost가 현재 설정보다 낮으면 True
+        cost를 낮추는 재해싱은 하지 않으므로, 설정이 다른 인스턴스가 섞여도 같은 회원을 번갈아 재해싱하지 않습니다.
+        """
+        stored_rounds = get_hash_rounds(hashed_password)
+        return stored_rounds is not None and stored_rounds < HashUtil.rounds
+
     @staticmethod
     def hash_password(password: str) -> str:
         """
         비밀번호를 해시화합니다.
         """
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=HashUtil.rounds)
         hashed_password = bcrypt.hashpw(password.encode('utf-8'), salt)
         return hashed_password.decode('utf-8')
 
@@ -19,4 +151,32 @@ class HashUtil:
         return bcrypt.checkpw(
             password.encode('utf-8'),
             hashed_password.encode('utf-8')
-        ) 
\ No newline at end of file
+        )
+
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        """
+        해싱 전용 스레드 풀에서 비밀번호를 해시화합니다.
+        대기열이 가득 차면 HashingSaturatedError가 발생합니다.
+        """
+        return await hash_executor.run(HashUtil.hash_password, password)
+
+    @staticmethod
+    async def verify_password_async(password: str, hashed_password: str) -> bool:
+        """
+        해싱 전용 스레드 풀에서 비밀번호를 검증합니다.
+        대기열이 가득 차면 HashingSaturatedError가 발생합니다.
+        """
+        return await hash_executor.run(HashUtil.verify_password, password, hashed_password)
+
+
+if __name__ == "__main__":
+    # 배포 환경의 인스턴스에서 한 번 실행해 출력된 값을 환경 변수로 고정: cd app && python -m util.hash_util --target-ms 250
+    import argparse
+
+    parser = argparse.ArgumentParser(description="해시 1회가 목표 시간을 넘지 않는 가장 큰 bcrypt cost를 측정합니다.")
+    parser.add_argument("--target-ms", type=float, required=True)
+    parser.add_argument("--min-rounds", type=int, default=BCRYPT_MIN_ROUNDS)
+    parser.add_argument("--max-rounds", type=int, default=BCRYPT_MAX_ROUNDS)
+    args = parser.parse_args()
+    print(f"BCRYPT_ROUNDS={calibrate_bcrypt_rounds(args.target_ms, args.min_rounds, args.max_rounds)}")
@@ -0,0 +1,103 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable
+
+
+class SlidingWindowLimiter:
+    """
+    키별 요청 수를 제한하는 프로세스 내 sliding window 카운터
+    - 직전 고정 윈도우와 현재 윈도우의 카운트를 경과 비율로 가중 합산해 최근 window_seconds 동안의 요청 수를 추정합니다.
+    - 키마다 정수 3개만 보관하며, max_keys를 넘으면 가장 오래 요청이 없던 키부터 제거합니다.
+    - 두 윈도우 이상 요청이 없던 키는 카운트가 0이므로 요청 처리 시 자동으로 정리됩니다.
+    """
+
+    def __init__(self, name: str, limit: int, window_seconds: float, max_keys: int):
+        self.name = name
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        # key -> [윈도우 번호, 현재 윈도우 카운트, 직전 윈도우 카운트]
+        self._entries: "OrderedDict[Hashable, list[int]]" = OrderedDict()
+        self.allowed = 0
+        self.rejected = 0
+        self.evictions = 0
+
+    def acquire(self, key: Hashable) -> float:
+        """
+        요청 1건을 기록합니다.
+        허용되면 0을, 한도를 넘으면 기록하지 않고 다시 시도할 수 있을 때까지의 초를 반환합니다.
+        """
+        if self.limit <= 0:
+            return 0.0
+
+        now = time.monotonic()
+        window = int(now // self.window_seconds)
+        elapsed = now / self.window_seconds - window
+
+        with self._lock:
+            self._expire(window)
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = [window, 0, 0]
+            elif entry[0] != window:
+                entry[2] = entry[1] if entry[0] == window - 1 else 0
+                entry[0], entry[1] = window, 0
+            self._entries.move_to_end(key)
+
+            _, current, previous = entry
+            if previous * (1 - elapsed) + current + 1 > self.limit:
+                self.rejected += 1
+                return self._retry_after(current, previous, elapsed)
+
+            entry[1] += 1
+            self.allowed += 1
+            while len(self._entries) > self.max_keys:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return 0.0
+
+    def _expire(self, window: int) -> None:
+        # 최근 사용 순서로 정렬되어 있으므로 앞쪽부터 두 윈도우 이상 지난 키를 제거
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if entry[0] >= window - 1:
+                break
+            del self._entries[key]
+
+    def _retry_after(self, current: int, previous: int, elapsed: float) -> float:
+        # 가중 합산 값이 limit - 1 이하로 내려가는 시점까지 남은 시간
+        if current + 1 <= self.limit:
+            needed = 1 - (self.limit - 1 - current) / previous
+            return max((needed - elapsed) * self.window_seconds, 0.001)
+        needed = max(0.0, 1 - (self.limit - 1) / current) if current else 0.0
+        return (1 - elapsed + needed) * self.window_seconds
+
+    def reset(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.allowed = self.rejected = self.evictions = 0
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "name": self.name,
+                "limit": self.limit,
+                "window_seconds": self.window_seconds,
+                "keys": len(self._entries),
+                "max_keys": self.max_keys,
+                "allowed": self.allowed,
+                "rejected": self.rejected,
+                "evictions": self.evictions,
+            }
+
+
+def retry_after_header(seconds: float) -> dict:
+    """Retry-After 응답 헤더 (정수 초, 올림)"""
+    return {"Retry-After": str(max(1, math.ceil(seconds)))}
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+GET /diary/{yyyymmdd} 동시 처리량 벤치마크
+
+기존 경로(async 핸들러 안에서 동기 Session 사용)와
+신규 경로(AsyncSession + 비동기 DAO)의 처리량을 비교합니다.
+
+사용법:
+    DATABASE_URL=postgresql://... JWT_SECRET_KEY=... \\
+        python bench/bench_diary_read.py --requests 2000 --concurrency 50 --db-latency-ms 5
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+import httpx
+from fastapi import Depends, FastAPI
+
+from config.database import Base, SessionLocal, engine
+from config.jwt_config import create_access_token, verify_token
+from controller.diary.diary import router as diary_router
+from dependencies.auth_dependencies import oauth2_scheme
+from model.diary.diary import Diary
+from model.member.member import Member
+
+BENCH_EMAIL = "bench-diary-read@sudays.local"
+BENCH_DATE = "20240101"
+
+
+def seed() -> None:
+    """벤치마크용 회원/일기 데이터 생성"""
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        member = db.query(Member).filter(Member.email == BENCH_EMAIL).first()
+        if member is None:
+            member = Member(email=BENCH_EMAIL, password="-", nickname=f"bench-{uuid.uuid4().hex[:8]}")
+            db.add(member)
+            db.commit()
+            db.refresh(member)
+        diary = db.query(Diary).filter(Diary.member_id == member.id, Diary.yyyymmdd == BENCH_DATE).first()
+        if diary is None:
+            db.add(Diary(member_id=member.id, yyyymmdd=BENCH_DATE, content="bench", image_ids=[]))
+            db.commit()
+    finally:
+        db.close()
+
+
+def build_app(db_latency_ms: int) -> FastAPI:
+    app = FastAPI()
+
+    if db_latency_ms:
+        # 느린 쿼리를 흉내내기 위해 모든 커넥션 체크아웃마다 pg_sleep 실행
+        from sqlalchemy import event
+        from config.database import async_engine
+
+        def _slow(dbapi_connection, connection_record, connection_proxy):
+            cursor = dbapi_connection.cursor()
+            cursor.execute(f"SELECT pg_sleep({db_latency_ms / 1000})")
+            cursor.close()
+
+        event.listen(engine, "checkout", _slow)
+        event.listen(async_engine.sync_engine, "checkout", _slow)
+
+    @app.get("/old/diary/{yyyymmdd}")
+    async def old_get_diary(yyyymmdd: str, token: str = Depends(oauth2_scheme)):
+        """기준 커밋과 동일한 방식: async 핸들러에서 동기 쿼리 실행"""
+        db = SessionLocal()
+        try:
+            email = verify_token(token)["sub"]
+            member = db.query(Member).filter(Member.email == email).first()
+            diary = db.query(Diary).filter(Diary.member_id == member.id, Diary.yyyymmdd == yyyymmdd).first()
+            return {"id": str(diary.id), "content": diary.content}
+        finally:
+            db.close()
+
+    app.include_router(diary_router)
+    return app
+
+
+async def run(app: FastAPI, path: str, token: str, total: int, concurrency: int) -> tuple[float, list[float]]:
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Authorization": f"Bearer {token}"}
+    latencies: list[float] = []
+    queue: asyncio.Queue = asyncio.Queue()
+    for _ in range(total):
+        queue.put_nowait(None)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker():
+            while True:
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                started = time.perf_counter()
+                response = await client.get(path, headers=headers)
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return elapsed, sorted(latencies)
+
+
+def report(name: str, total: int, elapsed: float, latencies: list[float]) -> None:
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    print(f"{name:<6} {total / elapsed:10.1f} req/s   p50 {p50:8.2f} ms   p99 {p99:8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--db-latency-ms", type=int, default=0, help="커넥션마다 추가할 인위적 DB 지연")
+    args = parser.parse_args()
+
+    seed()
+    token = create_access_token({"sub": BENCH_EMAIL, "jti": str(uuid.uuid4())})
+    app = build_app(args.db_latency_ms)
+
+    print(f"requests={args.requests} concurrency={args.concurrency} db_latency_ms={args.db_latency_ms}")
+    for name, path in (("old", f"/old/diary/{BENCH_DATE}"), ("new", f"/diary/{BENCH_DATE}")):
+        elapsed, latencies = asyncio.run(run(app, path, token, args.requests, args.concurrency))
+        report(name, args.requests, elapsed, latencies)
+
+
+if __name__ == "__main__":
+    main()
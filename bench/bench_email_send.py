@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+인증 메일 발송 경로 처리량 벤치마크
+
+로컬 SMTP 수신 서버(bench/smtp_sink.py)를 띄우고 EmailService.send_verification_email을
+지정한 동시성으로 호출해 메일 경로(본문 렌더링 + 메시지 생성 + SMTP 커넥션 풀 발송) 전체를 측정합니다.
+실제 SMTP 서버와 DB 없이 실행되므로 메일 경로 변경 전후를 오프라인에서 비교할 수 있습니다.
+
+출력 항목:
+- msg/s: 초당 발송 건수
+- connections: 수신 서버가 받은 연결 수 / 동시에 열려 있던 최대 연결 수
+- p50/p90/p99/max: 발송 1건의 지연 시간 분포 (풀 대기 시간 포함)
+
+사용법:
+    python bench/bench_email_send.py --messages 1000 --concurrency 50 --pool-sizes 1,4,8 \\
+        --connect-latency-ms 50 --reply-latency-ms 5
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+os.environ.setdefault("LOG_DIR", tempfile.gettempdir())
+os.environ.setdefault("LOG_EMAIL_SEND_RESULTS", "false")
+
+from service.email.email_service import EmailService
+from service.email.mail_client import MailClient
+from smtp_sink import SMTPSink
+
+SENDER = "bench@sudays.com"
+
+
+def percentile(sorted_values: list[float], ratio: float) -> float:
+    return sorted_values[min(int(len(sorted_values) * ratio), len(sorted_values) - 1)]
+
+
+async def run(service: EmailService, messages: int, concurrency: int) -> tuple[float, list[float], int]:
+    latencies: list[float] = []
+    failures = 0
+    queue: asyncio.Queue = asyncio.Queue()
+    for i in range(messages):
+        queue.put_nowait(f"bench-{i}@sudays.com")
+
+    async def worker():
+        nonlocal failures
+        while True:
+            try:
+                recipient = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            started = time.perf_counter()
+            if not await service.send_verification_email(recipient, "123456"):
+                failures += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started, sorted(latencies), failures
+
+
+async def run_all(args) -> None:
+    for pool_size in args.pool_sizes:
+        sink = SMTPSink(args.connect_latency_ms / 1000, args.reply_latency_ms / 1000)
+        port = await sink.start()
+        client = MailClient("127.0.0.1", port, "bench", "bench", SENDER, start_tls=False, pool_size=pool_size)
+        # send_verification_email은 DB를 사용하지 않음
+        service = EmailService(None, mail=client)
+        try:
+            elapsed, latencies, failures = await run(service, args.messages, args.concurrency)
+            stats = sink.snapshot()
+            print(
+                f"pool={pool_size:<3} {args.messages / elapsed:8.1f} msg/s   "
+                f"connections={stats['connections']}/{stats['max_active_connections']:<4} "
+                f"p50 {percentile(latencies, 0.5) * 1000:8.2f} ms   p90 {percentile(latencies, 0.9) * 1000:8.2f} ms   "
+                f"p99 {percentile(latencies, 0.99) * 1000:8.2f} ms   max {latencies[-1] * 1000:8.2f} ms   "
+                f"failed={failures}"
+            )
+        finally:
+            await client.close()
+            await sink.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--pool-sizes", type=lambda value: [int(size) for size in value.split(",")], default=[1, 4, 8])
+    parser.add_argument("--connect-latency-ms", type=float, default=50.0, help="연결(TCP/TLS 핸드셰이크) 지연")
+    parser.add_argument("--reply-latency-ms", type=float, default=5.0, help="SMTP 응답마다 왕복 지연")
+    args = parser.parse_args()
+
+    print(
+        f"messages={args.messages} concurrency={args.concurrency} "
+        f"connect_latency={args.connect_latency_ms}ms reply_latency={args.reply_latency_ms}ms"
+    )
+    asyncio.run(run_all(args))
+
+
+if __name__ == "__main__":
+    main()
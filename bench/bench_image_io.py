@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+느린 디스크에서 일기 이미지 저장/조회 시 이벤트 루프 응답성 벤치마크
+
+open/read/write 호출마다 --disk-latency-ms 만큼 블로킹되는 디스크를 흉내 내고,
+이미지 저장(save_upload)과 조회(read_image)를 지정한 동시성으로 실행하는 동안
+1ms 주기 ticker 코루틴이 얼마나 늦게 깨어나는지(이벤트 루프 지연)를 측정합니다.
+
+비교 대상:
+- loop: 파일 I/O를 이벤트 루프에서 직접 실행 (변경 전 방식)
+- file-io: 파일 I/O 스레드 풀(util.file_io.file_io_executor)에서 실행
+
+출력 항목:
+- img/s: 초당 저장+조회 처리 건수
+- lag p50/p99/max: ticker가 예정 시각보다 늦게 깨어난 시간 분포 (다른 요청이 체감하는 지연)
+
+사용법:
+    python bench/bench_image_io.py --images 200 --concurrency 20 --disk-latency-ms 5 --image-kb 256
+"""
+
+import argparse
+import asyncio
+import io
+import os
+import sys
+import tempfile
+import time
+import uuid
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+os.environ.setdefault("LOG_DIR", tempfile.gettempdir())
+
+from fastapi import UploadFile
+
+import util.file_io
+from service.diary import image_store
+from service.diary.image_store import IMAGE_UPLOAD_CHUNK_SIZE, read_image, save_upload
+from util.file_io import file_io_executor
+
+TICK_SECONDS = 0.001
+
+
+class SlowFile:
+    """read/write 호출마다 디스크 지연만큼 블로킹되는 파일"""
+
+    def __init__(self, file, latency: float):
+        self._file = file
+        self._latency = latency
+
+    def read(self, *args):
+        time.sleep(self._latency)
+        return self._file.read(*args)
+
+    def write(self, data):
+        time.sleep(self._latency)
+        return self._file.write(data)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def slow_open_factory(latency: float):
+    def slow_open(path, mode="r"):
+        time.sleep(latency)
+        return SlowFile(open(path, mode), latency)
+    return slow_open
+
+
+async def save_on_loop(upload: UploadFile, target_path: str, slow_open) -> None:
+    """변경 전 방식 - 청크 단위로 읽되 파일 I/O는 이벤트 루프에서 직접 실행"""
+    temp_path = os.path.join(os.path.dirname(target_path), f".{uuid.uuid4()}.part")
+    with slow_open(temp_path, "xb") as buffer:
+        while chunk := await upload.read(IMAGE_UPLOAD_CHUNK_SIZE):
+            buffer.write(chunk)
+    os.replace(temp_path, target_path)
+
+
+async def read_on_loop(path: str, slow_open) -> bytes:
+    with slow_open(path, "rb") as f:
+        return f.read()
+
+
+def percentile(sorted_values: list[float], ratio: float) -> float:
+    return sorted_values[min(int(len(sorted_values) * ratio), len(sorted_values) - 1)]
+
+
+async def ticker(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        expected = time.perf_counter() + TICK_SECONDS
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append(max(time.perf_counter() - expected, 0.0))
+
+
+async def run(mode: str, args, image_dir: str, slow_open) -> tuple[float, list[float]]:
+    data = os.urandom(args.image_kb * 1024)
+    queue: asyncio.Queue = asyncio.Queue()
+    for i in range(args.images):
+        queue.put_nowait(os.path.join(image_dir, f"{mode}-{i}.png"))
+
+    async def worker():
+        while True:
+            try:
+                path = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            upload = UploadFile(file=io.BytesIO(data), filename="image.png")
+            if mode == "loop":
+                await save_on_loop(upload, path, slow_open)
+                await read_on_loop(path, slow_open)
+            else:
+                await save_upload(upload, path, max_size=len(data))
+                await read_image(path)
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    ticker_task = asyncio.create_task(ticker(lags, stop))
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await ticker_task
+    return elapsed, sorted(lags)
+
+
+async def run_all(args) -> None:
+    slow_open = slow_open_factory(args.disk_latency_ms / 1000)
+    with tempfile.TemporaryDirectory() as image_dir, \
+            mock.patch.object(image_store, "open", slow_open, create=True), \
+            mock.patch.object(util.file_io, "open", slow_open, create=True):
+        for mode in ("loop", "file-io"):
+            elapsed, lags = await run(mode, args, image_dir, slow_open)
+            print(
+                f"{mode:<8} {args.images / elapsed:8.1f} img/s   "
+                f"lag p50 {percentile(lags, 0.5) * 1000:8.2f} ms   p99 {percentile(lags, 0.99) * 1000:8.2f} ms   "
+                f"max {lags[-1] * 1000:8.2f} ms"
+            )
+    snapshot = file_io_executor.snapshot()
+    print(f"file-io operations={snapshot['operations']} queue_wait={snapshot['queue_wait']}")
+    file_io_executor.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--images", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--disk-latency-ms", type=float, default=5.0, help="open/read/write 호출마다 블로킹되는 시간")
+    parser.add_argument("--image-kb", type=int, default=256)
+    args = parser.parse_args()
+
+    print(
+        f"images={args.images} concurrency={args.concurrency} disk_latency={args.disk_latency_ms}ms "
+        f"image={args.image_kb}KB chunk={IMAGE_UPLOAD_CHUNK_SIZE // 1024}KB workers={file_io_executor.max_workers}"
+    )
+    asyncio.run(run_all(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+로그인 폭주 중 다른 엔드포인트 지연 시간 벤치마크
+
+로그인 요청이 몰리는 동안 관련 없는 엔드포인트(GET /auth/protected)의 p50/p99 지연을 측정합니다.
+- old: 기준 커밋과 동일하게 async 핸들러 안에서 bcrypt.checkpw를 직접 호출 (이벤트 루프 점유)
+- new: POST /auth/login - 해싱 전용 스레드 풀에서 검증 (로그인 시도 제한 비활성화)
+- throttled: POST /auth/login - 로그인 시도 제한 적용 (한도를 넘은 요청은 bcrypt 없이 429)
+
+사용법:
+    DATABASE_URL=postgresql://... JWT_SECRET_KEY=... \\
+        python bench/bench_login_storm.py --logins 200 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+import httpx
+from fastapi import Depends, FastAPI, Form, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config.database import Base, SessionLocal, async_engine, engine, get_db
+from config.jwt_config import create_access_token
+from controller.auth.auth_controller import router as auth_router
+from dao.member.member_dao import MemberDAO
+from model.diary.diary import Diary  # noqa: F401 - 관계 매핑에 필요
+from model.diary.diary_image import DiaryImage  # noqa: F401 - 관계 매핑에 필요
+from model.member.member import Member
+from service.member.login_throttle import login_limiter_by_email, login_limiter_by_ip
+from util.hash_util import HashUtil, hash_executor
+
+BENCH_EMAIL = "bench-login-storm@sudays.com"
+BENCH_PASSWORD = "Bench-Password-1"
+
+
+def seed() -> None:
+    """벤치마크용 회원 생성"""
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        if db.query(Member).filter(Member.email == BENCH_EMAIL).first() is None:
+            db.add(Member(email=BENCH_EMAIL, password=HashUtil.hash_password(BENCH_PASSWORD), nickname=f"bench-{uuid.uuid4().hex[:8]}"))
+            db.commit()
+    finally:
+        db.close()
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/old/auth/login")
+    async def old_login(email: str = Form(...), password: str = Form(...), db: AsyncSession = Depends(get_db)):
+        """기준 커밋과 동일한 방식: async 핸들러에서 동기 bcrypt 검증"""
+        member = await MemberDAO(db).get_member_by_email(email)
+        if member is None or not HashUtil.verify_password(password, member.password):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+        return {"message": "로그인 성공"}
+
+    app.include_router(auth_router)
+    return app
+
+
+async def run(app: FastAPI, login_path: str, token: str, logins: int, concurrency: int) -> tuple[float, list[float], dict]:
+    transport = httpx.ASGITransport(app=app)
+    probe_latencies: list[float] = []
+    statuses: dict[int, int] = {}
+    queue: asyncio.Queue = asyncio.Queue()
+    for _ in range(logins):
+        queue.put_nowait(None)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def login_worker():
+            while True:
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                response = await client.post(login_path, data={"email": BENCH_EMAIL, "password": BENCH_PASSWORD})
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        async def probe(done: asyncio.Event):
+            headers = {"Authorization": f"Bearer {token}"}
+            while not done.is_set():
+                started = time.perf_counter()
+                response = await client.get("/auth/protected", headers=headers)
+                response.raise_for_status()
+                probe_latencies.append(time.perf_counter() - started)
+                await asyncio.sleep(0.005)
+
+        done = asyncio.Event()
+        probe_task = asyncio.create_task(probe(done))
+        started = time.perf_counter()
+        await asyncio.gather(*(login_worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await probe_task
+
+    return elapsed, sorted(probe_latencies), statuses
+
+
+def report(name: str, logins: int, elapsed: float, latencies: list[float], statuses: dict, hashes: int) -> None:
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[max(int(len(latencies) * 0.99) - 1, 0)] * 1000
+    print(
+        f"{name:<9} login {logins / elapsed:7.1f} req/s {dict(sorted(statuses.items()))} bcrypt(pool)={hashes:<4} "
+        f"probe n={len(latencies):<5} p50 {p50:8.2f} ms   p99 {p99:8.2f} ms"
+    )
+
+
+async def run_all(app: FastAPI, token: str, logins: int, concurrency: int) -> None:
+    # 비동기 엔진 풀은 이벤트 루프에 묶이므로 모든 경로를 같은 루프에서 측정
+    limits = (login_limiter_by_email.limit, login_limiter_by_ip.limit)
+    for name, path, throttled in (
+        ("old", "/old/auth/login", False),
+        ("new", "/auth/login", False),
+        ("throttled", "/auth/login", True),
+    ):
+        login_limiter_by_email.clear()
+        login_limiter_by_ip.clear()
+        login_limiter_by_email.limit, login_limiter_by_ip.limit = limits if throttled else (0, 0)
+        hashes_before = hash_executor.duration.snapshot()["count"]
+        elapsed, latencies, statuses = await run(app, path, token, logins, concurrency)
+        report(name, logins, elapsed, latencies, statuses, hash_executor.duration.snapshot()["count"] - hashes_before)
+    await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    seed()
+    token = create_access_token({"sub": BENCH_EMAIL, "jti": str(uuid.uuid4())})
+    app = build_app()
+
+    print(
+        f"logins={args.logins} concurrency={args.concurrency} bcrypt_workers={hash_executor.max_workers} "
+        f"bcrypt_queue={hash_executor.max_queue} login_limit(email/ip)={login_limiter_by_email.limit}/{login_limiter_by_ip.limit}"
+    )
+    asyncio.run(run_all(app, token, args.logins, args.concurrency))
+    print(f"rejected={hash_executor.rejected}")
+    hash_executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+SMTP 커넥션 풀 발송 처리량 벤치마크
+
+로컬 SMTP 수신 서버(bench/smtp_sink.py)에 지연을 주고, 메일 발송 방식별 처리량과 지연을 비교합니다.
+- old: 메일마다 새로 연결 + 로그인 + 발송 + QUIT (기존 FastMail 방식)
+- new: MailClient - 로그인된 커넥션을 풀에 유지하며 재사용
+
+사용법:
+    python bench/bench_smtp_pool.py --messages 200 --concurrency 20 --pool-size 4 \\
+        --connect-latency-ms 50 --reply-latency-ms 5
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+import aiosmtplib
+
+from service.email.mail_client import MailClient
+from smtp_sink import SMTPSink
+
+SENDER = "bench@sudays.com"
+SUBJECT = "[Sudays] 이메일 인증코드"
+HTML = "<html><body><h1>123456</h1></body></html>"
+
+
+async def send_per_connection(port: int, recipient: str) -> None:
+    """기존 방식: 발송마다 새 SMTP 세션"""
+    message = MailClient("127.0.0.1", port, None, None, SENDER)._build_message(recipient, SUBJECT, HTML)
+    smtp = aiosmtplib.SMTP(hostname="127.0.0.1", port=port, username="bench", password="bench", start_tls=False)
+    await smtp.connect()
+    try:
+        await smtp.send_message(message)
+    finally:
+        await smtp.quit()
+
+
+async def run(send, messages: int, concurrency: int) -> tuple[float, list[float]]:
+    latencies: list[float] = []
+    queue: asyncio.Queue = asyncio.Queue()
+    for i in range(messages):
+        queue.put_nowait(f"bench-{i}@sudays.com")
+
+    async def worker():
+        while True:
+            try:
+                recipient = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            started = time.perf_counter()
+            await send(recipient)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started, sorted(latencies)
+
+
+def report(name: str, messages: int, elapsed: float, latencies: list[float], connections: int) -> None:
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[max(int(len(latencies) * 0.99) - 1, 0)] * 1000
+    print(
+        f"{name:<4} {messages / elapsed:8.1f} msg/s   connections={connections:<5} "
+        f"p50 {p50:8.2f} ms   p99 {p99:8.2f} ms"
+    )
+
+
+async def run_all(args) -> None:
+    for name in ("old", "new"):
+        sink = SMTPSink(args.connect_latency_ms / 1000, args.reply_latency_ms / 1000)
+        port = await sink.start()
+        client = MailClient("127.0.0.1", port, "bench", "bench", SENDER, start_tls=False, pool_size=args.pool_size)
+        try:
+            if name == "old":
+                send = lambda recipient: send_per_connection(port, recipient)
+            else:
+                send = lambda recipient: client.send(recipient, SUBJECT, HTML)
+            elapsed, latencies = await run(send, args.messages, args.concurrency)
+            assert sink.messages == args.messages, (sink.messages, args.messages)
+            report(name, args.messages, elapsed, latencies, sink.connections)
+        finally:
+            await client.close()
+            await sink.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--pool-size", type=int, default=4)
+    parser.add_argument("--connect-latency-ms", type=float, default=50.0, help="연결(TCP/TLS 핸드셰이크) 지연")
+    parser.add_argument("--reply-latency-ms", type=float, default=5.0, help="SMTP 응답마다 왕복 지연")
+    args = parser.parse_args()
+
+    print(
+        f"messages={args.messages} concurrency={args.concurrency} pool_size={args.pool_size} "
+        f"connect_latency={args.connect_latency_ms}ms reply_latency={args.reply_latency_ms}ms"
+    )
+    asyncio.run(run_all(args))
+
+
+if __name__ == "__main__":
+    main()
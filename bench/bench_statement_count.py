@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+요청 단위 SQL 문장/커밋 수 측정
+
+주요 쓰기 흐름(일기 + 이미지 5장 저장, 회원가입, 이메일 인증)을 실제 서비스 코드로
+실행하고, 각 흐름에서 DB로 전송된 SQL 문장 수와 커밋 수를 출력합니다.
+
+사용법:
+    DATABASE_URL=postgresql://... python bench/bench_statement_count.py
+"""
+
+import asyncio
+import io
+import os
+import sys
+import tempfile
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+# 메일은 실제로 발송하지 않으므로 검증용 더미 설정만 채움
+os.environ.setdefault("MAIL_USERNAME", "bench")
+os.environ.setdefault("MAIL_PASSWORD", "bench")
+os.environ.setdefault("MAIL_FROM", "bench@sudays.com")
+os.environ.setdefault("IMAGE_DIR", tempfile.mkdtemp(prefix="sudays-bench-"))
+
+from fastapi import UploadFile
+
+from config.database import AsyncSessionLocal, Base, engine
+from config.db_monitor import count_statements
+from model.diary.diary import Diary  # noqa: F401 - 테이블 생성에 필요
+from model.diary.diary_image import DiaryImage  # noqa: F401
+from model.member.email_verification import EmailVerification
+from model.member.member import Member  # noqa: F401
+from service.diary.diary_service import DiaryService
+from service.email.email_service import EmailService
+from service.member.member_service import MemberService
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 1024
+
+
+async def measure(name: str, operation) -> None:
+    async with AsyncSessionLocal() as session:
+        with count_statements() as counter:
+            await operation(session)
+    print(f"{name:<32} statements={counter.statements:<4} commits={counter.commits}")
+
+
+async def main():
+    Base.metadata.create_all(bind=engine)
+    suffix = uuid.uuid4().hex[:8]
+    email = f"bench-{suffix}@sudays.com"
+
+    async def verification(session):
+        service = EmailService(session)
+        record = await service.create_verification_record(email)
+        await service.verify_code(email, record.verification_code)
+
+    async def signup(session):
+        await MemberService(session).register_member(email, "Bench-Passw0rd!", f"bench-{suffix}")
+
+    async def diary_with_images(session):
+        member = await MemberService(session).get_member_by_email(email)
+        images = [UploadFile(file=io.BytesIO(PNG_BYTES), filename=f"{index}.png") for index in range(5)]
+        await DiaryService(session).upsert_diary("20240101", "bench", images, member.id)
+
+    await measure("email verification (send+verify)", verification)
+    await measure("signup (register_member)", signup)
+    await measure("upsert_diary with 5 images", diary_with_images)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+로컬 SMTP 수신 서버 (벤치마크/테스트용)
+
+받은 메일을 저장하지 않고 연결 수, 메일 건수, 받은 바이트 수만 세는 최소한의 SMTP 서버입니다.
+EHLO/HELO, AUTH(PLAIN/LOGIN, 항상 성공), MAIL, RCPT, DATA, RSET, NOOP, QUIT만 지원하며 TLS는 지원하지 않습니다.
+원격 SMTP 서버를 흉내 내도록 연결 시 지연(TCP/TLS 핸드셰이크)과 응답마다 지연(왕복 시간)을 줄 수 있습니다.
+
+사용법:
+    python bench/smtp_sink.py --port 2525 --connect-latency-ms 50 --reply-latency-ms 10
+
+    # 앱에서 사용 시
+    MAIL_SERVER=127.0.0.1 MAIL_PORT=2525 MAIL_STARTTLS=false ...
+"""
+
+import argparse
+import asyncio
+from typing import Optional
+
+
+class SMTPSink:
+    def __init__(self, connect_latency: float = 0.0, reply_latency: float = 0.0):
+        self.connect_latency = connect_latency
+        self.reply_latency = reply_latency
+        self.connections = 0
+        self.active_connections = 0
+        self.max_active_connections = 0
+        self.messages = 0
+        self.bytes_received = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._writers: set[asyncio.StreamWriter] = set()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """서버를 시작하고 실제로 바인드된 포트를 반환합니다."""
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def reset_stats(self) -> None:
+        """누적 통계를 초기화합니다. (열린 연결 수는 유지)"""
+        self.connections = 0
+        self.max_active_connections = self.active_connections
+        self.messages = 0
+        self.bytes_received = 0
+
+    def snapshot(self) -> dict:
+        return {
+            "connections": self.connections,
+            "active_connections": self.active_connections,
+            "max_active_connections": self.max_active_connections,
+            "messages": self.messages,
+            "bytes_received": self.bytes_received,
+        }
+
+    def drop_connections(self) -> None:
+        """열린 연결을 모두 서버 쪽에서 끊습니다. (유휴 연결 타임아웃 재현용)"""
+        for writer in list(self._writers):
+            writer.close()
+
+    async def _reply(self, writer: asyncio.StreamWriter, line: str) -> None:
+        if self.reply_latency:
+            await asyncio.sleep(self.reply_latency)
+        writer.write(line.encode() + b"\r\n")
+        await writer.drain()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        self.active_connections += 1
+        self.max_active_connections = max(self.max_active_connections, self.active_connections)
+        self._writers.add(writer)
+        try:
+            if self.connect_latency:
+                await asyncio.sleep(self.connect_latency)
+            await self._reply(writer, "220 sink ESMTP")
+            while True:
+                line = await reader.readline()
+                if not line:
+                    return
+                command = line.decode(errors="replace").strip()
+                verb = command.split(" ", 1)[0].upper()
+
+                if verb == "EHLO":
+                    await self._reply(writer, "250-sink\r\n250-AUTH PLAIN LOGIN\r\n250 8BITMIME")
+                elif verb == "HELO":
+                    await self._reply(writer, "250 sink")
+                elif verb == "AUTH":
+                    await self._auth(reader, writer, command)
+                elif verb == "DATA":
+                    await self._reply(writer, "354 End data with <CR><LF>.<CR><LF>")
+                    while (data := await reader.readline()) not in (b".\r\n", b".\n", b""):
+                        self.bytes_received += len(data)
+                    self.messages += 1
+                    await self._reply(writer, "250 OK: queued")
+                elif verb == "QUIT":
+                    await self._reply(writer, "221 Bye")
+                    return
+                elif verb in ("MAIL", "RCPT", "RSET", "NOOP"):
+                    await self._reply(writer, "250 OK")
+                else:
+                    await self._reply(writer, "502 Command not implemented")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.active_connections -= 1
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _auth(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, command: str) -> None:
+        parts = command.split()
+        mechanism = parts[1].upper() if len(parts) > 1 else ""
+        if mechanism == "PLAIN" and len(parts) < 3:
+            await self._reply(writer, "334 ")
+            await reader.readline()
+        elif mechanism == "LOGIN":
+            # 사용자 이름(초기 응답이 없을 때)과 비밀번호를 차례로 받음
+            if len(parts) < 3:
+                await self._reply(writer, "334 VXNlcm5hbWU6")
+                await reader.readline()
+            await self._reply(writer, "334 UGFzc3dvcmQ6")
+            await reader.readline()
+        await self._reply(writer, "235 Authentication successful")
+
+
+async def serve(host: str, port: int, connect_latency: float, reply_latency: float) -> None:
+    sink = SMTPSink(connect_latency, reply_latency)
+    port = await sink.start(host, port)
+    print(f"SMTP sink listening on {host}:{port}")
+    try:
+        while True:
+            await asyncio.sleep(5)
+            print(" ".join(f"{key}={value}" for key, value in sink.snapshot().items()))
+    finally:
+        await sink.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=2525)
+    parser.add_argument("--connect-latency-ms", type=float, default=0.0)
+    parser.add_argument("--reply-latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.connect_latency_ms / 1000, args.reply_latency_ms / 1000))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
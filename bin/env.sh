@@ -28,6 +28,7 @@ fi
 export VENV_DIR="$APP_DIR/.venv"
 export PID_DIR="$APP_DIR/pid"
 export PID_FILE="$PID_DIR/uvicorn.pid"
+export OUTBOX_PID_FILE="$PID_DIR/outbox_worker.pid"
 export BIN_DIR="$APP_DIR/bin"
 
 
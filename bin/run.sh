@@ -139,6 +139,16 @@ for PID_FILE in "${PID_PATHS[@]}"; do
     fi
 done
 
+# 인증 메일 발송 워커 - 웹 프로세스와 분리해 하나만 실행
+if [ -f "$OUTBOX_PID_FILE" ] && kill -0 "$(cat "$OUTBOX_PID_FILE")" 2>/dev/null; then
+    echo "메일 발송 워커가 이미 실행 중입니다 (PID: $(cat "$OUTBOX_PID_FILE"))"
+else
+    python -m service.email.outbox_worker > "$LOG_DIR/outbox_worker.log" 2>&1 &
+    OUTBOX_PID=$!
+    echo "$OUTBOX_PID" > "$OUTBOX_PID_FILE"
+    echo "메일 발송 워커 기동: $OUTBOX_PID"
+fi
+
 echo "서비스 기동완료"
 echo "PID=$UVICORN_PID"
 echo "=========================================="
@@ -57,6 +57,16 @@ else
     echo "PID 파일 없음"
 fi
 
+# 메일 발송 워커 중지 - 발송 중인 메일은 임대 시간이 지나면 다시 발송됨
+if [ -f "$OUTBOX_PID_FILE" ]; then
+    OUTBOX_PID=$(cat "$OUTBOX_PID_FILE")
+    if kill -0 "$OUTBOX_PID" 2>/dev/null; then
+        echo "메일 발송 워커 종료 중... (PID: $OUTBOX_PID)"
+        kill -TERM "$OUTBOX_PID"
+    fi
+    rm -f "$OUTBOX_PID_FILE"
+fi
+
 
 
 echo "=========================================="
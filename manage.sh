@@ -57,6 +57,7 @@ show_help() {
     echo "   ${CYAN}docker-down${NC}       # Docker 중지"
     echo "   ${CYAN}docker-restart${NC}    # Docker 재시작"
     echo "   ${CYAN}docker-logs${NC}       # Docker 로그"
+    echo "   ${CYAN}db-migrate${NC}        # DB 마이그레이션 (migration/*.sql)"
     echo "   ${CYAN}log${NC}               # 로그 확인"
     echo "   ${CYAN}log-error${NC}         # 에러 로그 확인"
     echo "   ${CYAN}log-access${NC}        # 접근 로그 확인"
@@ -133,6 +134,23 @@ docker_logs() {
 }
 
 
+# 데이터베이스 관련 함수들
+db_migrate() {
+    log_header "DB 마이그레이션을 실행합니다..."
+    cd "$BIN_DIR"
+    source ./env.sh
+    cd "$APP_DIR"
+
+    # 마이그레이션 파일은 여러 번 실행해도 안전하도록(IF NOT EXISTS) 작성되어 있음
+    for migration in "$APP_DIR"/migration/*.sql; do
+        log_info "적용: $(basename "$migration")"
+        if ! docker-compose exec -T postgres psql -v ON_ERROR_STOP=1 -U "$POSTGRES_USER" -d "$POSTGRES_DB" < "$migration"; then
+            log_error "마이그레이션 실패: $(basename "$migration")"
+            exit 1
+        fi
+    done
+    log_success "DB 마이그레이션 완료"
+}
 
 # 로그 관련 함수들
 show_log() {
@@ -229,6 +247,9 @@ case "$1" in
     "docker-logs")
         docker_logs
         ;;
+    "db-migrate")
+        db_migrate
+        ;;
     "stop")
         stop_service
         ;;
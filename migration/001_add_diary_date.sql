@@ -0,0 +1,10 @@
+-- diary.yyyymmdd(문자열)와 함께 실제 DATE 컬럼을 추가하고 기간 조회용 복합 인덱스를 생성합니다.
+-- CREATE INDEX CONCURRENTLY는 트랜잭션 블록 안에서 실행할 수 없으므로 psql -f로 그대로 실행하세요.
+
+ALTER TABLE diary ADD COLUMN IF NOT EXISTS diary_date DATE;
+
+UPDATE diary SET diary_date = to_date(yyyymmdd, 'YYYYMMDD') WHERE diary_date IS NULL;
+
+ALTER TABLE diary ALTER COLUMN diary_date SET NOT NULL;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_diary_member_date ON diary (member_id, diary_date);
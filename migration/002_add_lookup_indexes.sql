@@ -0,0 +1,12 @@
+-- 쿼리 실행 계획 감사(test/test_query_plans.py)에서 순차 스캔/과도한 Filter가 확인된 조회에 인덱스를 추가합니다.
+-- CREATE/DROP INDEX CONCURRENTLY는 트랜잭션 블록 안에서 실행할 수 없으므로 psql -f로 그대로 실행하세요.
+
+-- 회원가입 시 닉네임 중복 확인 (MemberDAO.find_by_nickname)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_member_nickname ON member (nickname);
+
+-- 이미지 목록 조회 및 일기 삭제 시 연관 이미지 조회 (DiaryImageDAO.find_by_diary_id)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_diary_image_diary_id ON diary_image (diary_id);
+
+-- 발송 횟수 제한 COUNT(email, created_at 범위) - 이메일 단독 인덱스를 대체
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_email_verification_email_created_at ON email_verification (email, created_at);
+DROP INDEX CONCURRENTLY IF EXISTS ix_email_verification_email;
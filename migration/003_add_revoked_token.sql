@@ -0,0 +1,9 @@
+-- 로그아웃 등으로 폐기된 토큰(jti) 목록. 토큰 만료 이후 기록은 서버가 주기적으로 삭제합니다.
+
+CREATE TABLE IF NOT EXISTS revoked_token (
+    jti VARCHAR(36) PRIMARY KEY,
+    expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    revoked_at TIMESTAMP WITH TIME ZONE DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS ix_revoked_token_expires_at ON revoked_token (expires_at);
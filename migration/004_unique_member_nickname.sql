@@ -0,0 +1,18 @@
+-- 회원가입 시 중복 확인 후 INSERT하는 대신 유니크 제약으로 닉네임 중복을 막습니다.
+-- CREATE/DROP INDEX CONCURRENTLY는 트랜잭션 블록 안에서 실행할 수 없으므로 psql -f로 그대로 실행하세요.
+--
+-- 중복 닉네임이 있으면 인덱스 생성이 실패하고 INVALID 인덱스가 남습니다. 적용 전에 아래 쿼리로 확인하고 정리하세요.
+--   SELECT nickname, count(*) FROM member GROUP BY nickname HAVING count(*) > 1;
+-- 실패한 경우: DROP INDEX CONCURRENTLY IF EXISTS member_nickname_key;
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS member_nickname_key ON member (nickname);
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'member_nickname_key') THEN
+        ALTER TABLE member ADD CONSTRAINT member_nickname_key UNIQUE USING INDEX member_nickname_key;
+    END IF;
+END $$;
+
+-- 유니크 인덱스가 닉네임 조회(MemberDAO.find_by_nickname)도 처리하므로 기존 인덱스 제거
+DROP INDEX CONCURRENTLY IF EXISTS ix_member_nickname;
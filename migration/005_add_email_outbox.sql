@@ -0,0 +1,23 @@
+-- 인증 메일 발송 대기열. 인증 레코드와 같은 트랜잭션에서 기록하고 워커가 발송합니다.
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_type WHERE typname = 'outboxstatus') THEN
+        CREATE TYPE outboxstatus AS ENUM ('PENDING', 'SENT', 'DEAD');
+    END IF;
+END $$;
+
+CREATE TABLE IF NOT EXISTS email_outbox (
+    id UUID PRIMARY KEY,
+    recipient VARCHAR(255) NOT NULL,
+    subject VARCHAR(255) NOT NULL,
+    body TEXT NOT NULL,
+    status outboxstatus NOT NULL,
+    attempts INTEGER NOT NULL,
+    next_attempt_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+    last_error TEXT,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+    sent_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE INDEX IF NOT EXISTS ix_email_outbox_pending ON email_outbox (next_attempt_at) WHERE status = 'PENDING';
@@ -0,0 +1,12 @@
+-- 인증/발송 대기열 정리 작업(service/email/verification_purge.py)의 배치 삭제용 부분 인덱스
+-- CREATE INDEX CONCURRENTLY는 트랜잭션 블록 안에서 실행할 수 없으므로 psql -f로 그대로 실행하세요.
+-- 실패한 경우 INVALID 인덱스를 DROP INDEX CONCURRENTLY로 제거한 뒤 다시 실행하세요.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_email_verification_pending_expires_at
+    ON email_verification (expires_at) WHERE is_verified = false;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_email_verification_verified_at
+    ON email_verification (verified_at) WHERE is_verified = true;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_email_outbox_sent_at
+    ON email_outbox (sent_at) WHERE status = 'SENT';
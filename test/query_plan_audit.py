@@ -0,0 +1,121 @@
+"""
+쿼리 실행 계획 감사 도구 (테스트 전용)
+
+세션에 연결된 커넥션에서 실행되는 SELECT/UPDATE/DELETE 문을 가로채
+실행 직전에 EXPLAIN (ANALYZE, FORMAT JSON)으로 실행 계획을 수집합니다.
+EXPLAIN ANALYZE는 세이브포인트 안에서 실행 후 롤백하므로 실제 데이터에는 영향이 없습니다.
+
+다음 경우를 위반으로 보고합니다.
+- 행 수가 임계값 이상인 테이블에 대한 Seq Scan
+- 인덱스/순차 스캔 후 Filter로 버린 행 수가 임계값 이상인 경우 (인덱스가 조건을 다 덮지 못함)
+"""
+import json
+from dataclasses import dataclass, field
+from typing import Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection
+
+AUDITED_STATEMENT_PREFIXES = ("SELECT", "UPDATE", "DELETE", "WITH")
+SAVEPOINT_NAME = "query_plan_audit"
+
+@dataclass
+class PlanViolation:
+    relation: str
+    node_type: str
+    reason: str
+    statement: str
+    scenario: Optional[str] = None
+
+    def __str__(self) -> str:
+        return f"[{self.scenario}] {self.node_type} on {self.relation}: {self.reason}\n    {' '.join(self.statement.split())}"
+
+@dataclass
+class AuditedStatement:
+    statement: str
+    plan: dict
+    scenario: Optional[str] = None
+    violations: list[PlanViolation] = field(default_factory=list)
+
+class QueryPlanAuditor:
+    def __init__(self, table_rows: dict[str, int], seq_scan_row_threshold: int = 1000, filter_removed_row_threshold: int = 1000):
+        self.table_rows = table_rows
+        self.seq_scan_row_threshold = seq_scan_row_threshold
+        self.filter_removed_row_threshold = filter_removed_row_threshold
+        self.statements: list[AuditedStatement] = []
+        self._explaining = False
+
+    @staticmethod
+    def load_table_rows(connection: Connection) -> dict[str, int]:
+        """ANALYZE 이후 pg_class의 추정 행 수를 테이블별로 반환합니다."""
+        rows = connection.execute(text(
+            "SELECT c.relname, c.reltuples::bigint FROM pg_class c "
+            "JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE c.relkind = 'r' AND n.nspname = current_schema()"
+        ))
+        return {relname: max(reltuples, 0) for relname, reltuples in rows}
+
+    def attach(self, connection: Connection) -> None:
+        event.listen(connection, "before_cursor_execute", self._before_cursor_execute)
+
+    def detach(self, connection: Connection) -> None:
+        event.remove(connection, "before_cursor_execute", self._before_cursor_execute)
+
+    def label_pending(self, scenario: str) -> None:
+        """아직 시나리오가 지정되지 않은 수집 결과에 시나리오 이름을 붙입니다."""
+        for audited in self.statements:
+            if audited.scenario is None:
+                audited.scenario = scenario
+                for violation in audited.violations:
+                    violation.scenario = scenario
+
+    @property
+    def violations(self) -> list[PlanViolation]:
+        return [violation for audited in self.statements for violation in audited.violations]
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        # 일괄 INSERT 등 executemany와 감사용 EXPLAIN 자체는 대상에서 제외
+        if self._explaining or executemany:
+            return
+        if not statement.lstrip().upper().startswith(AUDITED_STATEMENT_PREFIXES):
+            return
+
+        self._explaining = True
+        try:
+            # 서버 사이드 커서 문장도 있으므로 별도의 일반 커서로 실행
+            audit_cursor = conn.connection.cursor()
+            audit_cursor.execute(f"SAVEPOINT {SAVEPOINT_NAME}")
+            try:
+                audit_cursor.execute(f"EXPLAIN (ANALYZE, FORMAT JSON) {statement}", parameters)
+                plan = audit_cursor.fetchone()[0]
+            finally:
+                audit_cursor.execute(f"ROLLBACK TO SAVEPOINT {SAVEPOINT_NAME}")
+                audit_cursor.close()
+        finally:
+            self._explaining = False
+
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        root = plan[0]["Plan"]
+        audited = AuditedStatement(statement, root)
+        self._inspect(root, audited)
+        self.statements.append(audited)
+
+    def _inspect(self, node: dict, audited: AuditedStatement) -> None:
+        relation = node.get("Relation Name")
+        if relation is not None:
+            node_type = node["Node Type"]
+            table_rows = self.table_rows.get(relation, 0)
+            removed = node.get("Rows Removed by Filter", 0) * node.get("Actual Loops", 1)
+
+            if node_type == "Seq Scan" and table_rows >= self.seq_scan_row_threshold:
+                audited.violations.append(PlanViolation(
+                    relation, node_type, f"테이블 행 수 {table_rows}건에 대한 순차 스캔", audited.statement,
+                ))
+            elif removed >= self.filter_removed_row_threshold:
+                audited.violations.append(PlanViolation(
+                    relation, node_type, f"Filter로 {removed}건을 읽고 버림 (인덱스가 조건을 덮지 못함)", audited.statement,
+                ))
+
+        for child in node.get("Plans", []):
+            self._inspect(child, audited)
@@ -0,0 +1,50 @@
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+os.environ.setdefault("LOG_DIR", tempfile.gettempdir())
+
+from config.db_monitor import SessionLeakDetector
+from util.metrics import Histogram
+
+class TestHistogram(unittest.TestCase):
+    def test_observe_cumulative_buckets(self):
+        histogram = Histogram("test", buckets=(0.01, 0.1, 1.0))
+
+        for value in (0.005, 0.05, 0.5, 5.0):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot["count"], 4)
+        self.assertEqual(snapshot["max"], 5.0)
+        self.assertEqual(snapshot["buckets"], {"le_0.01": 1, "le_0.1": 2, "le_1.0": 3, "le_inf": 4})
+
+class TestSessionLeakDetector(unittest.TestCase):
+    def test_long_held_session_is_logged_on_release(self):
+        detector = SessionLeakDetector(threshold_seconds=0.01)
+        token = detector.acquire("GET /diary/{yyyymmdd}")
+        time.sleep(0.02)
+
+        with self.assertLogs("config.db_monitor", level="WARNING") as logs:
+            detector.release(token)
+
+        self.assertIn("GET /diary/{yyyymmdd}", logs.output[0])
+        self.assertEqual(detector.snapshot(), [])
+
+    def test_unreturned_session_is_reported_once(self):
+        detector = SessionLeakDetector(threshold_seconds=0.01)
+        detector.acquire("POST /diary/")
+        time.sleep(0.02)
+
+        with self.assertLogs("config.db_monitor", level="WARNING") as logs:
+            detector.scan()
+            detector.scan()
+
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("POST /diary/", logs.output[0])
+
+if __name__ == '__main__':
+    unittest.main()
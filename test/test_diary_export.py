@@ -0,0 +1,74 @@
+import json
+import unittest
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from unittest import mock
+
+from db_case import DBTestCase
+
+from starlette.requests import Request
+
+from config import database
+from config.db_monitor import SessionLeakDetector
+from controller.diary.diary import export_diaries
+from dao.unit_of_work import UnitOfWork
+from dto.auth_dto import MemberInfoDTO
+from model.diary.diary_image import DiaryImage  # noqa: F401 - 테이블 생성에 필요
+from model.member.member import Member
+from service.diary.diary_service import DiaryService
+
+class TestDiaryExport(DBTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+
+        async with self.session_factory() as session:
+            member = Member(email=f"export-{uuid.uuid4().hex}@sudays.com", password="-", nickname=uuid.uuid4().hex[:12])
+            session.add(member)
+            await session.commit()
+            self.member_id = member.id
+
+            service = DiaryService(session)
+            async with UnitOfWork(session):
+                for offset in range(1200):
+                    yyyymmdd = (date(2020, 1, 1) + timedelta(days=offset)).strftime("%Y%m%d")
+                    await service.diary_dao.upsert(self.member_id, yyyymmdd, f"content-{yyyymmdd}", [])
+
+    async def test_streams_every_diary_as_ndjson_in_date_order(self):
+        async with self.session_factory() as session:
+            service = DiaryService(session)
+            service.EXPORT_BATCH_SIZE = 100
+            lines = [line async for line in service.export_diaries(self.member_id)]
+
+            # 내보낸 행은 세션에 남지 않아야 함
+            self.assertEqual(len(session.identity_map), 0)
+
+        self.assertEqual(len(lines), 1200)
+        self.assertTrue(all(line.endswith(b"\n") for line in lines))
+
+        rows = [json.loads(line) for line in lines]
+        self.assertEqual(rows[0]["yyyymmdd"], "20200101")
+        self.assertEqual(rows[-1]["yyyymmdd"], (date(2020, 1, 1) + timedelta(days=1199)).strftime("%Y%m%d"))
+        self.assertEqual([row["yyyymmdd"] for row in rows], sorted(row["yyyymmdd"] for row in rows))
+        self.assertEqual(rows[0]["image_ids"], [])
+
+    async def test_streaming_session_is_tracked_by_leak_detector(self):
+        detector = SessionLeakDetector(threshold_seconds=60)
+        request = Request({
+            "type": "http", "method": "GET", "path": "/diary/export", "headers": [], "query_string": b"",
+            "route": mock.Mock(path="/diary/export"),
+        })
+        member = MemberInfoDTO(id=self.member_id, email="export@sudays.com", nickname="export", role="USER", created_at=datetime.now(timezone.utc))
+
+        with mock.patch.multiple(database, AsyncSessionLocal=self.session_factory, session_leak_detector=detector):
+            response = await export_diaries(request, member)
+            body = response.body_iterator
+            await anext(body)
+            # 응답을 보내는 동안 세션이 열린 것으로 보임
+            self.assertEqual([session["route"] for session in detector.snapshot()], ["GET /diary/export"])
+            lines = 1 + len([line async for line in body])
+
+        self.assertEqual(lines, 1200)
+        self.assertEqual(detector.snapshot(), [])
+
+if __name__ == '__main__':
+    unittest.main()
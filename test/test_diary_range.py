@@ -0,0 +1,47 @@
+import unittest
+import uuid
+from datetime import date, timedelta
+
+from db_case import DBTestCase
+
+from dao.unit_of_work import UnitOfWork
+from model.diary.diary_image import DiaryImage  # noqa: F401 - 테이블 생성에 필요
+from model.member.member import Member
+from service.diary.diary_service import DiaryService
+
+class TestDiaryRangeValidation(unittest.IsolatedAsyncioTestCase):
+    async def test_invalid_ranges_are_rejected(self):
+        service = DiaryService(None)
+
+        for from_yyyymmdd, to_yyyymmdd in (("2024-01-01", "20240131"), ("20240201", "20240101"), ("20240101", "20250101")):
+            with self.assertRaises(ValueError):
+                await service.get_diaries(from_yyyymmdd, to_yyyymmdd, uuid.uuid4())
+
+class TestDiaryRangeQuery(DBTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+
+        async with self.session_factory() as session:
+            member = Member(email=f"range-{uuid.uuid4().hex}@sudays.com", password="-", nickname=uuid.uuid4().hex[:12])
+            session.add(member)
+            await session.commit()
+            self.member_id = member.id
+
+            service = DiaryService(session)
+            async with UnitOfWork(session):
+                for offset in range(60):
+                    yyyymmdd = (date(2024, 1, 1) + timedelta(days=offset)).strftime("%Y%m%d")
+                    await service.diary_dao.upsert(self.member_id, yyyymmdd, f"content-{yyyymmdd}", [])
+
+    async def test_returns_entries_in_range_ordered_by_date(self):
+        async with self.session_factory() as session:
+            diaries = await DiaryService(session).get_diaries("20240125", "20240205", self.member_id)
+
+        self.assertEqual(
+            [diary.yyyymmdd for diary in diaries],
+            [(date(2024, 1, 25) + timedelta(days=offset)).strftime("%Y%m%d") for offset in range(12)],
+        )
+        self.assertEqual(diaries[0].diary_date, date(2024, 1, 25))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import asyncio
+import io
+import os
+import tempfile
+import unittest
+import uuid
+from unittest import mock
+
+from db_case import DBTestCase
+
+from fastapi import UploadFile
+from sqlalchemy import func, select
+
+from dao.diary.diary_image_dao import DiaryImageDAO
+from model.diary.diary import Diary
+from model.diary.diary_image import DiaryImage
+from model.member.member import Member
+from service.diary.diary_service import DiaryService
+
+class TestDiaryUpsertConcurrency(DBTestCase):
+    PARALLEL_REQUESTS = 20
+    engine_options = {"pool_size": PARALLEL_REQUESTS}
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        async with self.session_factory() as session:
+            member = Member(email=f"upsert-{uuid.uuid4().hex}@sudays.com", password="-", nickname=uuid.uuid4().hex[:12])
+            session.add(member)
+            await session.commit()
+            self.member_id = member.id
+
+    async def _save(self, content: str) -> Diary:
+        async with self.session_factory() as session:
+            return await DiaryService(session).upsert_diary("20240101", content, None, self.member_id)
+
+    async def test_parallel_saves_for_same_date(self):
+        contents = [f"content-{index}" for index in range(self.PARALLEL_REQUESTS)]
+
+        results = await asyncio.gather(*(self._save(content) for content in contents), return_exceptions=True)
+
+        errors = [result for result in results if isinstance(result, Exception)]
+        self.assertEqual(errors, [])
+        self.assertEqual(len({diary.id for diary in results}), 1)
+
+        async with self.session_factory() as session:
+            rows = await session.scalar(
+                select(func.count()).select_from(Diary).filter(Diary.member_id == self.member_id)
+            )
+            saved = (await session.execute(select(Diary).filter(Diary.member_id == self.member_id))).scalars().one()
+        self.assertEqual(rows, 1)
+        self.assertIn(saved.content, contents)
+
+    async def test_upsert_updates_existing_diary(self):
+        first = await self._save("first")
+        second = await self._save("second")
+
+        self.assertEqual(first.id, second.id)
+        self.assertEqual(second.content, "second")
+
+class TestDiaryUpsertReplacesImages(DBTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.image_dir = tempfile.TemporaryDirectory()
+        self.env = mock.patch.dict(os.environ, {"IMAGE_DIR": self.image_dir.name})
+        self.env.start()
+        async with self.session_factory() as session:
+            member = Member(email=f"images-{uuid.uuid4().hex}@sudays.com", password="-", nickname=uuid.uuid4().hex[:12])
+            session.add(member)
+            await session.commit()
+            self.member_id = member.id
+
+    async def asyncTearDown(self):
+        self.env.stop()
+        self.image_dir.cleanup()
+        await super().asyncTearDown()
+
+    async def _save(self, content: str) -> Diary:
+        async with self.session_factory() as session:
+            return await DiaryService(session).upsert_diary("20240101", content, [UploadFile(file=io.BytesIO(b"png"), filename="image.png")], self.member_id)
+
+    async def _images(self, diary_id: uuid.UUID) -> list[DiaryImage]:
+        async with self.session_factory() as session:
+            return (await session.scalars(select(DiaryImage).filter(DiaryImage.diary_id == diary_id))).all()
+
+    async def test_update_deletes_previous_images_and_files(self):
+        first = await self._save("first")
+        second = await self._save("second")
+
+        [image] = await self._images(second.id)
+        self.assertEqual(second.image_ids, [image.id])
+        self.assertNotIn(first.image_ids[0], second.image_ids)
+        self.assertEqual(sorted(os.listdir(self.image_dir.name)), [f"{image.file_name}{image.extension}"])
+
+    async def test_failed_update_keeps_previous_images_and_files(self):
+        first = await self._save("first")
+        [previous] = await self._images(first.id)
+
+        with mock.patch.object(DiaryImageDAO, "save_all", side_effect=RuntimeError("db down")):
+            with self.assertRaises(Exception):
+                await self._save("second")
+
+        self.assertEqual([image.id for image in await self._images(first.id)], [previous.id])
+        self.assertEqual(os.listdir(self.image_dir.name), [f"{previous.file_name}{previous.extension}"])
+
+if __name__ == '__main__':
+    unittest.main()
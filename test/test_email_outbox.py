@@ -0,0 +1,192 @@
+import asyncio
+import os
+import sys
+import unittest
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "bench"))
+
+from db_case import DBTestCase
+
+from sqlalchemy import delete, select
+
+from dao.member.email_outbox_dao import EmailOutboxDAO
+from dao.unit_of_work import UnitOfWork
+from model.member.email_outbox import EmailOutbox, OutboxStatus
+from service.email.email_service import EmailService
+from service.email.mail_client import MailClient
+from service.email.outbox_worker import OutboxWorker
+from smtp_sink import SMTPSink
+from util.metrics import Histogram
+
+class SlowMailClient:
+    """느린 SMTP - 발송 1건이 delay초 걸리며, timeout은 워커가 발송 기록이 없을 때 가정하는 발송 시간"""
+
+    def __init__(self, delay: float, pool_size: int = 1, timeout: float = 5):
+        self.delay = delay
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.send_duration = Histogram("slow_mail_send_seconds")
+        self.calls = 0
+
+    async def send(self, recipient: str, subject: str, html: str) -> None:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+
+class TestEmailOutbox(DBTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        # 이전 실행에서 남은 발송 대상이 워커에 섞이지 않도록 비움
+        async with self.session_factory() as session:
+            await session.execute(delete(EmailOutbox))
+            await session.commit()
+
+        self.sink = SMTPSink()
+        port = await self.sink.start()
+        self.mail = MailClient("127.0.0.1", port, "test", "test", "test@sudays.com", start_tls=False, pool_size=2)
+        self.email = f"outbox-{uuid.uuid4().hex}@sudays.com"
+
+    async def asyncTearDown(self):
+        await self.mail.close()
+        await self.sink.stop()
+        await super().asyncTearDown()
+
+    def _worker(self, mail: MailClient, **kwargs) -> OutboxWorker:
+        return OutboxWorker(mail, session_factory=self.session_factory, **kwargs)
+
+    async def _outbox_rows(self) -> list[EmailOutbox]:
+        async with self.session_factory() as session:
+            return (await session.scalars(select(EmailOutbox).filter(EmailOutbox.recipient == self.email))).all()
+
+    async def test_verification_and_outbox_row_commit_together(self):
+        async with self.session_factory() as session:
+            with self.assertRaises(RuntimeError):
+                async with UnitOfWork(session):
+                    await EmailService(session, mail=self.mail).create_verification_record(self.email)
+                    raise RuntimeError("rollback")
+
+        self.assertEqual(await self._outbox_rows(), [])
+
+        async with self.session_factory() as session:
+            verification = await EmailService(session, mail=self.mail).create_verification_record(self.email)
+
+        rows = await self._outbox_rows()
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0].status, OutboxStatus.PENDING)
+        self.assertIn(verification.verification_code, rows[0].body)
+
+    async def test_drain_sends_and_marks_sent(self):
+        async with self.session_factory() as session:
+            await EmailService(session, mail=self.mail).create_verification_record(self.email)
+
+        processed = await self._worker(self.mail).drain_once()
+
+        self.assertEqual(processed, 1)
+        self.assertEqual(self.sink.messages, 1)
+        [row] = await self._outbox_rows()
+        self.assertEqual(row.status, OutboxStatus.SENT)
+        self.assertEqual(row.attempts, 1)
+        self.assertIsNotNone(row.sent_at)
+        self.assertEqual(await self._worker(self.mail).drain_once(), 0)
+
+    async def test_failed_send_backs_off_then_goes_dead(self):
+        async with self.session_factory() as session:
+            async with UnitOfWork(session):
+                await EmailOutboxDAO(session).enqueue(self.email, "subject", "<p>body</p>")
+
+        # 닫힌 포트로 발송 -> 연결 실패
+        await self.sink.stop()
+        broken = MailClient("127.0.0.1", self.mail.port, None, None, "test@sudays.com", start_tls=False, timeout=1)
+        worker = self._worker(broken, max_attempts=2, backoff_base_seconds=0)
+
+        self.assertEqual(await worker.drain_once(), 1)
+        [row] = await self._outbox_rows()
+        self.assertEqual((row.status, row.attempts), (OutboxStatus.PENDING, 1))
+        self.assertIsNotNone(row.last_error)
+
+        self.assertEqual(await worker.drain_once(), 1)
+        [row] = await self._outbox_rows()
+        self.assertEqual((row.status, row.attempts), (OutboxStatus.DEAD, 2))
+        self.assertEqual((worker.retried, worker.dead), (1, 1))
+        self.assertEqual(await worker.drain_once(), 0)
+
+    async def test_backoff_grows_exponentially_up_to_max(self):
+        worker = self._worker(self.mail, backoff_base_seconds=5, backoff_max_seconds=30)
+
+        self.assertEqual([worker.backoff_seconds(attempts) for attempts in range(1, 6)], [5, 10, 20, 30, 30])
+
+    async def test_concurrent_workers_do_not_claim_same_rows(self):
+        async with self.session_factory() as session:
+            async with UnitOfWork(session):
+                dao = EmailOutboxDAO(session)
+                for _ in range(20):
+                    await dao.enqueue(self.email, "subject", "<p>body</p>")
+
+        workers = [self._worker(self.mail, batch_size=10) for _ in range(2)]
+
+        async def drain(worker: OutboxWorker) -> None:
+            while await worker.drain_once():
+                pass
+
+        await asyncio.gather(*(drain(worker) for worker in workers))
+
+        # 마감 전에 시작하지 못해 반납된 행은 다시 임대될 수 있으므로 임대 건수 대신 발송 건수를 셈
+        self.assertEqual(sum(worker.sent for worker in workers), 20)
+        self.assertEqual(self.sink.messages, 20)
+        rows = await self._outbox_rows()
+        self.assertTrue(all(row.status == OutboxStatus.SENT and row.attempts == 1 for row in rows))
+
+    async def test_slow_send_is_timed_out_before_lease_expires(self):
+        async with self.session_factory() as session:
+            async with UnitOfWork(session):
+                await EmailOutboxDAO(session).enqueue(self.email, "subject", "<p>body</p>")
+
+        slow = SlowMailClient(delay=5)
+        workers = [self._worker(slow, lease_seconds=1, backoff_base_seconds=60) for _ in range(2)]
+
+        async def keep_draining(worker: OutboxWorker):
+            # 첫 워커의 임대가 끝난 뒤에도 계속 대기열을 확인
+            for _ in range(15):
+                await worker.drain_once()
+                await asyncio.sleep(0.1)
+
+        await asyncio.gather(*(keep_draining(worker) for worker in workers))
+
+        # 임대 안에 시간 초과로 실패가 기록되어 다른 워커가 다시 가져가지 않음
+        self.assertEqual(slow.calls, 1)
+        [row] = await self._outbox_rows()
+        self.assertEqual((row.status, row.attempts), (OutboxStatus.PENDING, 1))
+        self.assertIn("시간 초과", row.last_error)
+        self.assertEqual(sum(worker.retried for worker in workers), 1)
+
+    async def test_claim_is_sized_to_what_the_pool_can_send(self):
+        worker = self._worker(SlowMailClient(delay=0, pool_size=4), batch_size=50, lease_seconds=60)
+
+        # 발송 기록이 없으면 타임아웃(5초)으로 가정 -> 30초 동안 풀 4개로 6번씩
+        self.assertEqual(worker.claim_size(30, worker.expected_send_seconds()), 24)
+        self.assertEqual(worker.claim_size(30, 0.1), 50)
+        # 한 건도 마감 안에 못 보낼 만큼 느려도 풀 크기만큼은 시도
+        self.assertEqual(worker.claim_size(30, 60), 4)
+
+    async def test_rows_never_tried_are_released_without_an_attempt(self):
+        async with self.session_factory() as session:
+            async with UnitOfWork(session):
+                dao = EmailOutboxDAO(session)
+                for _ in range(10):
+                    await dao.enqueue(self.email, "subject", "<p>body</p>")
+
+        # 발송 시간을 0.04초로 가정해 10건을 임대했지만 실제로는 0.3초씩 걸림 - 마감(0.5초) 안에 2건만 시작
+        slow = SlowMailClient(delay=0.3, pool_size=1, timeout=0.04)
+        worker = self._worker(slow, batch_size=10, lease_seconds=1, backoff_base_seconds=60)
+
+        self.assertEqual(await worker.drain_once(), 10)
+
+        rows = await self._outbox_rows()
+        self.assertEqual(slow.calls, 2)
+        self.assertEqual((worker.sent, worker.retried, worker.released), (1, 1, 8))
+        self.assertEqual(sorted(row.attempts for row in rows if row.status == OutboxStatus.PENDING), [0] * 8 + [1])
+        # 반납한 메일은 기다리지 않고 바로 다시 발송 대상
+        self.assertEqual(await worker.drain_once(), 8)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+os.environ.setdefault("LOG_DIR", tempfile.gettempdir())
+
+from service.email.email_template import VERIFICATION_TEMPLATE, EmailTemplateRenderer, verification_context
+
+class TestEmailTemplateRenderer(unittest.TestCase):
+    def setUp(self):
+        self.override_dir = tempfile.TemporaryDirectory()
+        os.makedirs(os.path.join(self.override_dir.name, "email"))
+        self.version = 1_000_000_000
+
+    def tearDown(self):
+        self.override_dir.cleanup()
+
+    def _write_override(self, content: str) -> None:
+        path = os.path.join(self.override_dir.name, VERIFICATION_TEMPLATE)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        # 같은 초 안에 다시 쓰면 수정 시각이 같을 수 있으므로 쓸 때마다 수정 시각을 늘림
+        self.version += 1
+        os.utime(path, (self.version, self.version))
+
+    def test_prerendered_output_matches_full_render(self):
+        renderer = EmailTemplateRenderer(template_dir=None)
+        template = renderer.environment.get_template(VERIFICATION_TEMPLATE)
+
+        for code in ("123456", "000000"):
+            self.assertEqual(renderer.render_verification(code), template.render(**verification_context(), code=code))
+        self.assertEqual(renderer.builds, 1)
+
+    def test_code_is_escaped(self):
+        renderer = EmailTemplateRenderer(template_dir=None)
+
+        html = renderer.render_verification("<b>1</b>")
+
+        self.assertIn("&lt;b&gt;1&lt;/b&gt;", html)
+        self.assertNotIn("<b>1</b>", html)
+
+    def test_override_directory_takes_precedence(self):
+        self._write_override("<p>{{ title }}: {{ code }} / {{ code }}</p>")
+        renderer = EmailTemplateRenderer(template_dir=self.override_dir.name)
+
+        self.assertEqual(renderer.render_verification("123456"), f"<p>{verification_context()['title']}: 123456 / 123456</p>")
+
+    def test_falls_back_to_full_render_when_slot_is_filtered(self):
+        self._write_override("<p>{{ code | reverse }}</p>")
+        renderer = EmailTemplateRenderer(template_dir=self.override_dir.name)
+
+        self.assertEqual(renderer.render_verification("123456"), "<p>654321</p>")
+
+    def test_reloads_changed_template_only_when_auto_reload(self):
+        self._write_override("<p>v1 {{ code }}</p>")
+        cached = EmailTemplateRenderer(template_dir=self.override_dir.name, auto_reload=False)
+        reloading = EmailTemplateRenderer(template_dir=self.override_dir.name, auto_reload=True)
+        cached.load()
+        reloading.load()
+
+        self._write_override("<p>v2 {{ code }}</p>")
+
+        self.assertEqual(cached.render_verification("1"), "<p>v1 1</p>")
+        self.assertEqual(reloading.render_verification("1"), "<p>v2 1</p>")
+        self.assertEqual(reloading.builds, 2)
+
+if __name__ == '__main__':
+    unittest.main()
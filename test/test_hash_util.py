@@ -1,5 +1,20 @@
+import asyncio
+import threading
+import time
 import unittest
-from app.util.hash_util import HashUtil
+import uuid
+from unittest import mock
+
+from db_case import DBTestCase, async_database_url
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from config.database import RoutingSession
+from model.diary.diary import Diary  # noqa: F401 - 관계 매핑에 필요
+from model.diary.diary_image import DiaryImage  # noqa: F401 - 관계 매핑에 필요
+from model.member.member import Member
+from service.member.member_service import MemberService
+from util.hash_util import HashExecutor, HashingSaturatedError, HashUtil, calibrate_bcrypt_rounds, get_hash_rounds
 
 class TestHashUtil(unittest.TestCase):
     def test_hash_password(self):
@@ -42,5 +57,113 @@ class TestHashUtil(unittest.TestCase):
         self.assertTrue(HashUtil.verify_password(password, hashed1))
         self.assertTrue(HashUtil.verify_password(password, hashed2))
 
+    def test_calibration_stays_within_bounds(self):
+        # 목표가 아주 짧으면 하한, 아주 길면 상한으로 제한
+        self.assertEqual(calibrate_bcrypt_rounds(0.001, min_rounds=4, max_rounds=6, probe_rounds=4), 4)
+        self.assertEqual(calibrate_bcrypt_rounds(10 ** 9, min_rounds=4, max_rounds=6, probe_rounds=4), 6)
+
+    def test_needs_rehash_only_when_stored_cost_is_lower(self):
+        with mock.patch.object(HashUtil, "rounds", 5):
+            hashed_password = HashUtil.hash_password("test1234")
+            self.assertEqual(get_hash_rounds(hashed_password), 5)
+            self.assertFalse(HashUtil.needs_rehash(hashed_password))
+        with mock.patch.object(HashUtil, "rounds", 6):
+            self.assertTrue(HashUtil.needs_rehash(hashed_password))
+        # cost가 더 낮은 인스턴스는 재해싱하지 않음 - 인스턴스 간 재해싱 반복 방지
+        with mock.patch.object(HashUtil, "rounds", 4):
+            self.assertFalse(HashUtil.needs_rehash(hashed_password))
+
+class TestHashUtilAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_async_hash_and_verify(self):
+        password = "test1234"
+
+        hashed_password = await HashUtil.hash_password_async(password)
+
+        self.assertTrue(await HashUtil.verify_password_async(password, hashed_password))
+        self.assertFalse(await HashUtil.verify_password_async("wrong1234", hashed_password))
+
+    async def test_event_loop_is_not_blocked_while_hashing(self):
+        hashed_password = HashUtil.hash_password("test1234")
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        started = time.perf_counter()
+        await asyncio.gather(*(HashUtil.verify_password_async("test1234", hashed_password) for _ in range(4)))
+        elapsed = time.perf_counter() - started
+        task.cancel()
+
+        # 해싱 동안에도 이벤트 루프가 다른 작업을 계속 처리해야 함
+        self.assertGreater(ticks, elapsed / 0.005 / 4)
+
+class TestHashExecutor(unittest.IsolatedAsyncioTestCase):
+    async def test_rejects_when_queue_is_full(self):
+        executor = HashExecutor(max_workers=1, max_queue=1)
+        release = threading.Event()
+        try:
+            running = asyncio.create_task(executor.run(release.wait))
+            queued = asyncio.create_task(executor.run(release.wait))
+            await asyncio.sleep(0)
+
+            with self.assertRaises(HashingSaturatedError):
+                await executor.run(release.wait)
+            self.assertEqual(executor.rejected, 1)
+
+            release.set()
+            await asyncio.gather(running, queued)
+
+            # 대기열이 비면 다시 받아야 함
+            self.assertEqual(await executor.run(lambda: "ok"), "ok")
+            self.assertEqual(executor.snapshot()["in_flight"], 0)
+        finally:
+            release.set()
+            executor.shutdown()
+
+class TestRehashOnLogin(DBTestCase):
+    async def test_login_rehashes_password_with_current_cost(self):
+        email = f"rehash-{uuid.uuid4().hex}@sudays.com"
+        with mock.patch.object(HashUtil, "rounds", 4):
+            async with self.session_factory() as session:
+                session.add(Member(email=email, password=HashUtil.hash_password("Test1234!"), nickname=uuid.uuid4().hex[:12]))
+                await session.commit()
+
+        with mock.patch.object(HashUtil, "rounds", 5):
+            async with self.session_factory() as session:
+                member = await MemberService(session).login(email, "Test1234!")
+            self.assertEqual(get_hash_rounds(member.password), 5)
+
+            async with self.session_factory() as session:
+                stored = await MemberService(session).get_member_by_email(email)
+                self.assertEqual(get_hash_rounds(stored.password), 5)
+                # 이미 현재 cost면 다시 해싱하지 않음
+                self.assertEqual((await MemberService(session).login(email, "Test1234!")).password, stored.password)
+
+    async def test_login_reads_member_from_primary(self):
+        email = f"primary-{uuid.uuid4().hex}@sudays.com"
+        with mock.patch.object(HashUtil, "rounds", 4):
+            async with self.session_factory() as session:
+                session.add(Member(email=email, password=HashUtil.hash_password("Test1234!"), nickname=uuid.uuid4().hex[:12]))
+                await session.commit()
+
+            # 아직 가입 정보가 반영되지 않은 복제 DB - 접속 자체가 실패하는 DB로 대신함
+            replica = create_async_engine(async_database_url(database=f"missing_{uuid.uuid4().hex}"))
+            routing_factory = async_sessionmaker(
+                class_=AsyncSession, sync_session_class=RoutingSession,
+                primary=self.engine.sync_engine, replica=replica.sync_engine, expire_on_commit=False,
+            )
+            try:
+                async with routing_factory() as session:
+                    member = await MemberService(session).login(email, "Test1234!")
+            finally:
+                await replica.dispose()
+
+        self.assertIsNotNone(member)
+        self.assertEqual(member.email, email)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,127 @@
+import os
+import time
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+import uuid
+
+from db_case import DBTestCase
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from service.email.email_service import EmailService
+from service.email.verified_email_cache import verified_email_cache
+from query_plan_audit import QueryPlanAuditor
+
+ROWS_PER_EMAIL = 1000
+OTHER_ROWS = 20000
+LATEST_CODE = "654321"
+
+# 한 이메일에 인증/미인증 이력이 섞여 쌓인 경우 - 가장 최근 행만 미인증이며 유효함
+SEED_SQL = """
+INSERT INTO email_verification (id, email, verification_code, is_verified, expires_at, created_at, verified_at)
+SELECT gen_random_uuid(), :email, lpad(g::text, 6, '0'), g % 10 = 0, now() - interval '1 hour',
+       now() - g * interval '1 minute', CASE WHEN g % 10 = 0 THEN now() - g * interval '1 minute' END
+FROM generate_series(1, :rows_per_email) g;
+
+INSERT INTO email_verification (id, email, verification_code, is_verified, expires_at, created_at)
+VALUES (gen_random_uuid(), :email, :latest_code, false, now() + interval '10 minutes', now());
+
+INSERT INTO email_verification (id, email, verification_code, is_verified, expires_at, created_at)
+SELECT gen_random_uuid(), :prefix || '-other-' || g || '@sudays.com', '000000', false, now(), now()
+FROM generate_series(1, :other_rows) g;
+"""
+
+def _find_node(node: dict, node_type: str):
+    if node["Node Type"] == node_type:
+        return node
+    for child in node.get("Plans", []):
+        found = _find_node(child, node_type)
+        if found:
+            return found
+    return None
+
+class TestLatestVerification(DBTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        verified_email_cache.clear()
+
+    async def asyncTearDown(self):
+        verified_email_cache.clear()
+        await super().asyncTearDown()
+
+    async def test_reads_only_latest_row_among_many(self):
+        prefix = f"latest{uuid.uuid4().hex[:8]}"
+        email = f"{prefix}@sudays.com"
+
+        async with self.engine.connect() as conn:
+            transaction = await conn.begin()
+            try:
+                for statement in filter(str.strip, SEED_SQL.split(";")):
+                    await conn.execute(text(statement), {
+                        "email": email,
+                        "prefix": prefix,
+                        "rows_per_email": ROWS_PER_EMAIL,
+                        "other_rows": OTHER_ROWS,
+                        "latest_code": LATEST_CODE,
+                    })
+                await conn.execute(text("ANALYZE email_verification"))
+
+                session = AsyncSession(bind=conn, join_transaction_mode="create_savepoint", expire_on_commit=False)
+                service = EmailService(session)
+                auditor = QueryPlanAuditor(await conn.run_sync(QueryPlanAuditor.load_table_rows))
+                auditor.attach(conn.sync_connection)
+                try:
+                    latest = await service.get_verification_by_email(email)
+                finally:
+                    auditor.detach(conn.sync_connection)
+
+                self.assertEqual(latest.verification_code, LATEST_CODE)
+                # (email, created_at) 인덱스를 역순으로 읽고 첫 행에서 멈춤
+                [audited] = auditor.statements
+                scan = _find_node(audited.plan, "Index Scan")
+                self.assertEqual(audited.plan["Node Type"], "Limit")
+                self.assertEqual((scan["Index Name"], scan["Scan Direction"]), ("ix_email_verification_email_created_at", "Backward"))
+                self.assertEqual(scan["Actual Rows"], 1)
+
+                # 과거 인증 이력이 있으므로 최신 행이 미인증이어도 인증된 이메일
+                self.assertTrue(await service.is_email_verified(email))
+                self.assertFalse(await service.verify_code(email, "000001"))
+                self.assertTrue(await service.verify_code(email, LATEST_CODE))
+                self.assertTrue(verified_email_cache.get(email))
+                await session.close()
+            finally:
+                await transaction.rollback()
+
+    async def test_unverified_email_is_not_cached(self):
+        email = f"latest-{uuid.uuid4().hex}@sudays.com"
+        async with AsyncSession(self.engine) as session:
+            service = EmailService(session)
+            self.assertFalse(await service.is_email_verified(email))
+
+        self.assertIsNone(verified_email_cache.get(email))
+
+    async def test_create_then_verify_on_non_utc_host(self):
+        # asyncpg는 naive datetime을 호스트 로컬 시간으로 해석하므로 UTC가 아닌 호스트에서도 확인
+        email = f"latest-{uuid.uuid4().hex}@sudays.com"
+        with mock.patch.dict(os.environ, {"TZ": "Asia/Seoul"}):
+            time.tzset()
+            try:
+                async with AsyncSession(self.engine, expire_on_commit=False) as session:
+                    verification = await EmailService(session).create_verification_record(email)
+
+                async with AsyncSession(self.engine) as session:
+                    service = EmailService(session)
+                    stored = await service.get_verification_by_email(email)
+                    self.assertGreater(stored.expires_at, datetime.now(timezone.utc))
+                    self.assertTrue(await service.verify_code(email, verification.verification_code))
+
+                async with AsyncSession(self.engine) as session:
+                    verified_at = (await EmailService(session).get_verification_by_email(email)).verified_at
+                    self.assertLess(abs((datetime.now(timezone.utc) - verified_at).total_seconds()), 60)
+            finally:
+                time.tzset()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "bench"))
+os.environ.setdefault("LOG_DIR", tempfile.gettempdir())
+
+from service.email import mail_client
+from service.email.mail_client import MailClient
+from smtp_sink import SMTPSink
+
+class TestMailClient(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.sink = SMTPSink()
+        port = await self.sink.start()
+        self.client = MailClient("127.0.0.1", port, "test", "test", "test@sudays.com", start_tls=False, pool_size=2)
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await self.sink.stop()
+
+    async def test_connections_are_reused_across_sends(self):
+        await asyncio.gather(*(self.client.send(f"user{i}@sudays.com", "subject", "<p>body</p>") for i in range(10)))
+
+        self.assertEqual(self.sink.messages, 10)
+        self.assertLessEqual(self.sink.connections, 2)
+        self.assertLessEqual(self.sink.max_active_connections, 2)
+        self.assertGreater(self.sink.bytes_received, 0)
+        self.assertEqual(self.client.snapshot()["sent"], 10)
+
+    async def test_reconnects_when_server_drops_idle_connection(self):
+        await self.client.send("user@sudays.com", "subject", "<p>body</p>")
+        self.sink.drop_connections()
+        await asyncio.sleep(0.05)
+
+        await self.client.send("user@sudays.com", "subject", "<p>body</p>")
+
+        self.assertEqual(self.sink.messages, 2)
+        self.assertEqual(self.sink.connections, 2)
+
+    async def test_cancelled_send_closes_its_connection(self):
+        await self.client.send("user@sudays.com", "subject", "<p>body</p>")
+        self.sink.reply_latency = 1
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(self.client.send("user@sudays.com", "subject", "<p>body</p>"), timeout=0.1)
+
+        # 응답을 기다리던 커넥션은 풀로 돌아가지 않고, 다음 발송은 새 커넥션을 사용
+        self.sink.reply_latency = 0
+        await self.client.send("user@sudays.com", "subject", "<p>body</p>")
+        self.assertEqual(self.sink.connections, 2)
+        self.assertEqual(self.client.snapshot()["failed"], 1)
+
+    async def test_connect_failure_is_counted_as_failed(self):
+        await self.sink.stop()
+
+        with self.assertRaises(Exception):
+            await self.client.send("user@sudays.com", "subject", "<p>body</p>")
+
+        self.assertEqual(self.client.snapshot()["failed"], 1)
+        self.assertEqual(self.client.snapshot()["sent"], 0)
+
+    async def test_failed_starttls_closes_its_connection(self):
+        # 수신 서버가 STARTTLS를 지원하지 않아 연결 직후 협상에서 실패
+        self.client.start_tls = True
+
+        with self.assertRaises(Exception):
+            await self.client.send("user@sudays.com", "subject", "<p>body</p>")
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(self.sink.connections, 1)
+        self.assertEqual(self.sink.active_connections, 0)
+        self.assertEqual(self.client.snapshot()["failed"], 1)
+
+    async def test_implicit_tls_is_passed_to_smtp(self):
+        client = MailClient("smtp.sudays.com", 465, "test", "test", "test@sudays.com", start_tls=False, use_tls=True)
+        with mock.patch.object(mail_client.aiosmtplib, "SMTP") as smtp:
+            smtp.return_value.connect = mock.AsyncMock()
+            await client._connect()
+
+        self.assertTrue(smtp.call_args.kwargs["use_tls"])
+        self.assertFalse(smtp.call_args.kwargs["start_tls"])
+
+if __name__ == '__main__':
+    unittest.main()
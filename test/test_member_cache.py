@@ -0,0 +1,96 @@
+import unittest
+import uuid
+from unittest import mock
+
+from db_case import DBTestCase
+
+from config.db_monitor import count_statements
+from config.jwt_config import create_access_token
+from dependencies.auth_dependencies import get_current_member
+from service.member.token_revocation import token_revocation
+from model.diary.diary import Diary  # noqa: F401 - 관계 매핑에 필요
+from model.diary.diary_image import DiaryImage  # noqa: F401 - 관계 매핑에 필요
+from model.member.member import Member
+from service.member.member_cache import member_cache
+from service.member.member_service import MemberService
+from util.cache import TTLCache
+
+class TestTTLCache(unittest.TestCase):
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = TTLCache("test", maxsize=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.snapshot()["evictions"], 1)
+
+    def test_expired_entry_is_a_miss(self):
+        cache = TTLCache("test", maxsize=10, ttl_seconds=5)
+        with mock.patch("util.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with mock.patch("util.cache.time.monotonic", return_value=104.0):
+            self.assertEqual(cache.get("a"), 1)
+        with mock.patch("util.cache.time.monotonic", return_value=105.0):
+            self.assertIsNone(cache.get("a"))
+
+        snapshot = cache.snapshot()
+        self.assertEqual((snapshot["hits"], snapshot["misses"], snapshot["size"]), (1, 1, 0))
+
+    def test_zero_ttl_disables_cache(self):
+        cache = TTLCache("test", maxsize=10, ttl_seconds=0)
+        cache.set("a", 1)
+
+        self.assertIsNone(cache.get("a"))
+
+class TestCurrentMemberCache(DBTestCase):
+    track_statements = True
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        member_cache.clear()
+        # 서버 실행 중처럼 폐기 목록을 불러와 구독 중인 상태 - 폐기되지 않은 토큰은 DB 없이 통과
+        live = mock.patch.multiple(token_revocation, _loaded=True, _listening=True)
+        live.start()
+        self.addCleanup(live.stop)
+
+        async with self.session_factory() as session:
+            member = Member(email=f"cache-{uuid.uuid4().hex}@sudays.com", password="-", nickname=uuid.uuid4().hex[:12])
+            session.add(member)
+            await session.commit()
+            self.member_id, self.email = member.id, member.email
+        self.token = create_access_token({"sub": self.email, "jti": str(uuid.uuid4())})
+
+    async def asyncTearDown(self):
+        member_cache.clear()
+        await super().asyncTearDown()
+
+    async def test_second_request_skips_member_query(self):
+        async with self.session_factory() as session:
+            with count_statements() as first:
+                member_info = await get_current_member(self.token, session)
+            with count_statements() as second:
+                cached_info = await get_current_member(self.token, session)
+
+        self.assertEqual(member_info.id, self.member_id)
+        self.assertEqual(first.statements, 1)
+        self.assertEqual(second.statements, 0)
+        self.assertEqual(cached_info, member_info)
+
+    async def test_update_and_delete_invalidate_entry(self):
+        async with self.session_factory() as session:
+            await get_current_member(self.token, session)
+            nickname = uuid.uuid4().hex[:12]
+            await MemberService(session).update_member(self.member_id, nickname=nickname)
+
+        async with self.session_factory() as session:
+            self.assertEqual((await get_current_member(self.token, session)).nickname, nickname)
+            self.assertTrue(await MemberService(session).delete_member(self.member_id))
+
+        self.assertIsNone(member_cache.get(self.email))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,300 @@
+import inspect
+import unittest
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+from db_case import DBTestCase
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config.database import Base
+from dao.diary.diary_dao import DiaryDAO
+from dao.diary.diary_image_dao import DiaryImageDAO
+from dao.member.email_outbox_dao import EmailOutboxDAO
+from dao.member.member_dao import MemberDAO
+from dao.member.revoked_token_dao import RevokedTokenDAO
+from model.diary.diary import Diary
+from model.diary.diary_image import DiaryImage
+from model.member.email_outbox import EmailOutbox  # noqa: F401 - 테이블 생성에 필요
+from model.member.member import Member, MemberGrade, MemberRole
+from model.member.revoked_token import RevokedToken  # noqa: F401 - 테이블 생성에 필요
+from service.email.email_service import EmailService
+from query_plan_audit import QueryPlanAuditor
+
+SEED_MEMBERS = 20000
+SEED_DIARY_MEMBERS = 200
+SEED_DIARIES_PER_MEMBER = 100
+SEED_VERIFICATIONS = 50000
+# 전체 대비 비율이 높으면 순차 스캔이 정당한 계획이 되므로 필터 임계값(1000건)을 조금 넘는 정도로 유지
+SEED_TARGET_EMAIL_VERIFICATIONS = 1500
+SEED_REVOKED_TOKENS = 20000
+SEED_SENT_OUTBOX = 20000
+SEED_PENDING_OUTBOX = 100
+
+# 의도적으로 테이블 전체를 읽는 목록 조회 - 카디널리티가 낮아 인덱스가 도움이 되지 않음
+FULL_SCAN_SCENARIOS = {
+    "MemberDAO.get_members_by_role",
+    "MemberDAO.get_members_by_grade",
+}
+
+# EmailService에서 직접 쿼리를 실행하는 메서드
+EMAIL_SERVICE_QUERY_METHODS = (
+    "create_verification_record",
+    "get_verification_by_email",
+    "verify_code",
+    "is_email_verified",
+    "purge_expired_verifications",
+    "purge_verified_verifications",
+)
+
+SEED_SQL = """
+INSERT INTO member (id, email, password, nickname, role, grade, created_at)
+SELECT gen_random_uuid(), :prefix || '-' || g || '@sudays.com', '-', :prefix || g, 'USER', 'NON_MEMBER', now()
+FROM generate_series(1, :members) g;
+
+INSERT INTO diary (id, yyyymmdd, diary_date, member_id, content, image_ids, created_at, updated_at)
+SELECT gen_random_uuid(), to_char(date '2020-01-01' + d, 'YYYYMMDD'), date '2020-01-01' + d, m.id, 'content', '{}', now(), now()
+FROM (SELECT id FROM member WHERE email LIKE :prefix || '-%' ORDER BY email LIMIT :diary_members) m
+CROSS JOIN generate_series(0, :diaries_per_member - 1) d;
+
+INSERT INTO diary_image (id, diary_id, file_name, extension, base_path, created_at, updated_at)
+SELECT gen_random_uuid(), d.id, 'image', '.png', '/images', now(), now()
+FROM diary d JOIN member m ON m.id = d.member_id WHERE m.email LIKE :prefix || '-%';
+
+INSERT INTO email_verification (id, email, verification_code, is_verified, expires_at, created_at, verified_at)
+SELECT gen_random_uuid(), :prefix || '-ev-' || g || '@sudays.com', '000000', true, now(), now() - interval '1 day', now() - g * interval '1 minute'
+FROM generate_series(1, :verifications) g;
+
+INSERT INTO revoked_token (jti, expires_at, revoked_at)
+SELECT gen_random_uuid()::text, now() + (g % 60 - 30) * interval '1 minute', now()
+FROM generate_series(1, :revoked_tokens) g;
+
+-- 한 이메일에 오래된 미인증 발송 이력이 쌓인 경우
+INSERT INTO email_verification (id, email, verification_code, is_verified, expires_at, created_at)
+SELECT gen_random_uuid(), :prefix || '-target@sudays.com', '000000', false, now() - interval '1 day', now() - g * interval '1 hour'
+FROM generate_series(1, :target_verifications) g;
+
+-- 발송 완료된 메일이 쌓인 대기열 (발송 대상은 일부)
+INSERT INTO email_outbox (id, recipient, subject, body, status, attempts, next_attempt_at, created_at, sent_at)
+SELECT gen_random_uuid(), :prefix || '-ob-' || g || '@sudays.com', 'subject', 'body', 'SENT', 1, now() - interval '1 day', now(), now() - g * interval '1 minute'
+FROM generate_series(1, :sent_outbox) g;
+
+INSERT INTO email_outbox (id, recipient, subject, body, status, attempts, next_attempt_at, created_at)
+SELECT gen_random_uuid(), :prefix || '-pending-' || g || '@sudays.com', 'subject', 'body', 'PENDING', 0, now() - interval '1 minute', now()
+FROM generate_series(1, :pending_outbox) g;
+"""
+
+def _dao_methods(dao_class) -> set[str]:
+    return {
+        f"{dao_class.__name__}.{name}"
+        for name, method in inspect.getmembers(dao_class)
+        if not name.startswith("_") and (inspect.iscoroutinefunction(method) or inspect.isasyncgenfunction(method))
+    }
+
+async def _diary_scenarios(session, ctx):
+    dao = DiaryDAO(session)
+    saved = await dao.save(Diary(member_id=ctx["member_id"], yyyymmdd="19990101", content="audit", image_ids=[]))
+    yield "DiaryDAO.save"
+    await dao.upsert(ctx["member_id"], "20200105", "audit", [])
+    yield "DiaryDAO.upsert"
+    await dao.find_by_ids(ctx["diary_ids"])
+    yield "DiaryDAO.find_by_ids"
+    await dao.find_by_id(ctx["diary_ids"][0])
+    yield "DiaryDAO.find_by_id"
+    await dao.find_by_yyyymmdd(ctx["member_id"], "20200110")
+    yield "DiaryDAO.find_by_yyyymmdd"
+    await dao.find_by_date_range(ctx["member_id"], date(2020, 1, 1), date(2020, 3, 31))
+    yield "DiaryDAO.find_by_date_range"
+    async for _ in dao.stream_by_member(ctx["member_id"]):
+        pass
+    yield "DiaryDAO.stream_by_member"
+    await dao.delete(saved.id)
+    yield "DiaryDAO.delete"
+
+async def _diary_image_scenarios(session, ctx):
+    dao = DiaryImageDAO(session)
+    await dao.save(DiaryImage(diary_id=ctx["diary_ids"][0], file_name="audit", extension=".png", base_path="/images"))
+    yield "DiaryImageDAO.save"
+    await dao.save_all([DiaryImage(id=uuid.uuid4(), diary_id=ctx["diary_ids"][1], file_name="audit", extension=".png", base_path="/images")])
+    yield "DiaryImageDAO.save_all"
+    await dao.find_by_id(ctx["image_ids"][0])
+    yield "DiaryImageDAO.find_by_id"
+    await dao.find_by_id_with_diary(ctx["image_ids"][0])
+    yield "DiaryImageDAO.find_by_id_with_diary"
+    await dao.find_by_ids(ctx["image_ids"])
+    yield "DiaryImageDAO.find_by_ids"
+    await dao.find_by_diary_id(ctx["diary_ids"][2])
+    yield "DiaryImageDAO.find_by_diary_id"
+    await dao.delete_by_diary_id(ctx["diary_ids"][3])
+    yield "DiaryImageDAO.delete_by_diary_id"
+    await dao.delete(ctx["image_ids"][1])
+    yield "DiaryImageDAO.delete"
+
+async def _member_scenarios(session, ctx):
+    dao = MemberDAO(session)
+    created = await dao.create_member(f"{ctx['prefix']}-new@sudays.com", "-", f"{ctx['prefix']}new")
+    yield "MemberDAO.create_member"
+    await dao.get_member_by_id(ctx["member_id"])
+    yield "MemberDAO.get_member_by_id"
+    await dao.get_member_by_email(ctx["member_email"])
+    yield "MemberDAO.get_member_by_email"
+    await dao.find_by_email(ctx["member_email"])
+    yield "MemberDAO.find_by_email"
+    await dao.find_by_nickname(ctx["member_nickname"])
+    yield "MemberDAO.find_by_nickname"
+    await dao.get_members_by_role(MemberRole.USER)
+    yield "MemberDAO.get_members_by_role"
+    await dao.get_members_by_grade(MemberGrade.NON_MEMBER)
+    yield "MemberDAO.get_members_by_grade"
+    await dao.update_member(ctx["member_id"], nickname=f"{ctx['prefix']}renamed")
+    yield "MemberDAO.update_member"
+    await dao.update_password(ctx["member_id"], "-")
+    yield "MemberDAO.update_password"
+    await dao.delete_member(created.id)
+    yield "MemberDAO.delete_member"
+    await dao.check_signup(ctx["member_email"], ctx["member_nickname"])
+    yield "MemberDAO.check_signup"
+
+async def _revoked_token_scenarios(session, ctx):
+    dao = RevokedTokenDAO(session)
+    jti = str(uuid.uuid4())
+    await dao.revoke(jti, datetime.now(timezone.utc) + timedelta(minutes=30))
+    yield "RevokedTokenDAO.revoke"
+    await dao.notify(jti)
+    yield "RevokedTokenDAO.notify"
+    await dao.exists(jti)
+    yield "RevokedTokenDAO.exists"
+    await dao.find_active_jtis(datetime.now(timezone.utc))
+    yield "RevokedTokenDAO.find_active_jtis"
+    await dao.delete_expired(datetime.now(timezone.utc))
+    yield "RevokedTokenDAO.delete_expired"
+
+async def _email_scenarios(session, ctx):
+    service = EmailService(session)
+    verification = await service.create_verification_record(ctx["target_email"])
+    yield "EmailService.create_verification_record"
+    await service.get_verification_by_email(ctx["target_email"])
+    yield "EmailService.get_verification_by_email"
+    await service.verify_code(ctx["target_email"], verification.verification_code)
+    yield "EmailService.verify_code"
+    await service.is_email_verified(ctx["target_email"])
+    yield "EmailService.is_email_verified"
+    await service.purge_expired_verifications(datetime.now(timezone.utc), 100)
+    yield "EmailService.purge_expired_verifications"
+    await service.purge_verified_verifications(datetime.now(timezone.utc) - timedelta(days=7), 100)
+    yield "EmailService.purge_verified_verifications"
+
+async def _email_outbox_scenarios(session, ctx):
+    dao = EmailOutboxDAO(session)
+    outbox = await dao.enqueue(f"{ctx['prefix']}-new@sudays.com", "subject", "body")
+    yield "EmailOutboxDAO.enqueue"
+    rows = await dao.claim_batch(10, 60)
+    yield "EmailOutboxDAO.claim_batch"
+    await dao.mark_sent([row.id for row in rows])
+    yield "EmailOutboxDAO.mark_sent"
+    await dao.release([outbox.id])
+    yield "EmailOutboxDAO.release"
+    await dao.mark_failed(outbox.id, "audit", 30)
+    yield "EmailOutboxDAO.mark_failed"
+    await dao.delete_sent(datetime.now(timezone.utc) - timedelta(hours=1), 100)
+    yield "EmailOutboxDAO.delete_sent"
+
+SCENARIO_GROUPS = (
+    _diary_scenarios, _diary_image_scenarios, _member_scenarios, _revoked_token_scenarios, _email_scenarios,
+    _email_outbox_scenarios,
+)
+
+class TestQueryPlanAuditCoverage(unittest.TestCase):
+    def test_every_dao_method_has_a_scenario(self):
+        """DAO에 메서드가 추가되면 감사 시나리오도 함께 추가해야 합니다."""
+        expected = _dao_methods(DiaryDAO) | _dao_methods(DiaryImageDAO) | _dao_methods(MemberDAO) | _dao_methods(RevokedTokenDAO)
+        expected |= _dao_methods(EmailOutboxDAO)
+        expected |= {f"EmailService.{name}" for name in EMAIL_SERVICE_QUERY_METHODS}
+
+        source = "".join(inspect.getsource(group) for group in SCENARIO_GROUPS)
+        missing = sorted(name for name in expected if f'yield "{name}"' not in source)
+        self.assertEqual(missing, [])
+
+class TestQueryPlans(DBTestCase):
+    maxDiff = None
+
+    async def _audit(self, scenario_groups) -> QueryPlanAuditor:
+        """시드 데이터와 감사 대상 쿼리를 하나의 트랜잭션에서 실행한 뒤 롤백합니다."""
+        async with self.engine.connect() as conn:
+            transaction = await conn.begin()
+            try:
+                # 모델에 선언된 인덱스가 기존 테스트 DB에 없으면 트랜잭션 안에서만 생성
+                await conn.run_sync(lambda sync_conn: [
+                    index.create(sync_conn, checkfirst=True)
+                    for table in Base.metadata.sorted_tables for index in table.indexes
+                ])
+
+                prefix = f"audit{uuid.uuid4().hex[:8]}"
+                for statement in filter(str.strip, SEED_SQL.split(";")):
+                    await conn.execute(text(statement), {
+                        "prefix": prefix,
+                        "members": SEED_MEMBERS,
+                        "diary_members": SEED_DIARY_MEMBERS,
+                        "diaries_per_member": SEED_DIARIES_PER_MEMBER,
+                        "verifications": SEED_VERIFICATIONS,
+                        "target_verifications": SEED_TARGET_EMAIL_VERIFICATIONS,
+                        "revoked_tokens": SEED_REVOKED_TOKENS,
+                        "sent_outbox": SEED_SENT_OUTBOX,
+                        "pending_outbox": SEED_PENDING_OUTBOX,
+                    })
+                await conn.execute(text("ANALYZE member, diary, diary_image, email_verification, revoked_token, email_outbox"))
+                # 롤백된 시드의 dead tuple 때문에 비용 추정이 실행마다 달라지므로,
+                # 순차 스캔을 최후 수단으로 두고 "사용 가능한 인덱스가 있는가"를 검사
+                await conn.execute(text("SET LOCAL enable_seqscan = off"))
+
+                member = (await conn.execute(
+                    select(Member.id, Member.email, Member.nickname).
+                    filter(Member.email.like(f"{prefix}-%")).
+                    order_by(Member.email).limit(1)
+                )).one()
+                diary_ids = (await conn.scalars(select(Diary.id).filter(Diary.member_id == member.id).limit(10))).all()
+                image_ids = (await conn.scalars(select(DiaryImage.id).filter(DiaryImage.diary_id.in_(diary_ids)))).all()
+                ctx = {
+                    "prefix": prefix,
+                    "member_id": member.id,
+                    "member_email": member.email,
+                    "member_nickname": member.nickname,
+                    "diary_ids": diary_ids,
+                    "image_ids": image_ids,
+                    "target_email": f"{prefix}-target@sudays.com",
+                }
+
+                auditor = QueryPlanAuditor(await conn.run_sync(QueryPlanAuditor.load_table_rows))
+                auditor.attach(conn.sync_connection)
+                session = AsyncSession(bind=conn, join_transaction_mode="create_savepoint", autoflush=False, expire_on_commit=False)
+                try:
+                    for group in scenario_groups:
+                        # 각 시나리오는 쿼리를 실행한 뒤 자신의 이름을 yield
+                        async for scenario in group(session, ctx):
+                            auditor.label_pending(scenario)
+                finally:
+                    auditor.detach(conn.sync_connection)
+                    await session.close()
+            finally:
+                await transaction.rollback()
+        return auditor
+
+    async def test_dao_queries_use_indexes(self):
+        auditor = await self._audit(SCENARIO_GROUPS)
+
+        self.assertTrue(auditor.statements)
+        violations = [violation for violation in auditor.violations if violation.scenario not in FULL_SCAN_SCENARIOS]
+        self.assertEqual([str(violation) for violation in violations], [])
+
+    async def test_detects_seq_scan_on_large_table(self):
+        async def unindexed_lookup(session, ctx):
+            await session.execute(select(Member).filter(Member.password == "not-indexed"))
+            yield "unindexed_lookup"
+
+        auditor = await self._audit((unindexed_lookup,))
+
+        self.assertEqual([(violation.relation, violation.node_type) for violation in auditor.violations], [("member", "Seq Scan")])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import unittest
+import uuid
+from datetime import date
+from unittest import mock
+
+from db_case import DBTestCase, async_database_url
+
+from sqlalchemy import create_engine, delete, event, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from config.database import RoutingSession
+from dao.diary.diary_dao import DiaryDAO
+from dao.member.member_dao import MemberDAO
+from dao.unit_of_work import UnitOfWork
+from model.member.member import Member
+from service.member.member_service import MemberService
+from util.hash_util import HashUtil
+
+class TestRoutingSession(unittest.TestCase):
+    def setUp(self):
+        # primary / replica 역할의 로컬 DB 두 개
+        self.primary = create_engine("sqlite://")
+        self.replica = create_engine("sqlite://")
+        Member.__table__.create(self.primary)
+        Member.__table__.create(self.replica)
+        self.session = RoutingSession(primary=self.primary, replica=self.replica)
+
+    def tearDown(self):
+        self.session.close()
+
+    def test_marked_read_goes_to_replica(self):
+        statement = select(Member).execution_options(use_replica=True)
+        self.assertIs(self.session.get_bind(clause=statement), self.replica)
+
+    def test_unmarked_read_goes_to_primary(self):
+        statement = select(Member).execution_options(use_replica=False)
+        self.assertIs(self.session.get_bind(clause=statement), self.primary)
+        self.assertIs(self.session.get_bind(clause=select(Member)), self.primary)
+
+    def test_reads_after_write_stay_on_primary(self):
+        self.session.add(Member(email="writer@sudays.com", password="-", nickname="writer"))
+        self.session.flush()
+
+        statement = select(Member).execution_options(use_replica=True)
+        self.assertIs(self.session.get_bind(clause=statement), self.primary)
+        self.assertIsNotNone(self.session.execute(statement.filter(Member.email == "writer@sudays.com")).scalar())
+
+        self.session.commit()
+        self.assertIs(self.session.get_bind(clause=statement), self.replica)
+
+    def test_dml_goes_to_primary(self):
+        self.assertIs(self.session.get_bind(clause=delete(Member)), self.primary)
+
+        statement = select(Member).execution_options(use_replica=True)
+        self.assertIs(self.session.get_bind(clause=statement), self.primary)
+
+class TestRoutingSessionWithDAO(DBTestCase):
+    """같은 DB를 가리키는 서로 다른 primary / replica 엔진으로 실제 DAO 호출이 어느 엔진에서 실행되는지 확인"""
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.replica = create_async_engine(async_database_url())
+        self.executed: list[tuple[str, str]] = []
+        for name, engine in (("primary", self.engine), ("replica", self.replica)):
+            # 첫 접속 시 드라이버 초기화 쿼리가 기록되지 않도록 미리 접속
+            async with engine.connect():
+                pass
+            event.listen(engine.sync_engine, "before_cursor_execute", self._recorder(name))
+        self.routing_factory = async_sessionmaker(
+            class_=AsyncSession, sync_session_class=RoutingSession,
+            primary=self.engine.sync_engine, replica=self.replica.sync_engine,
+            autoflush=False, expire_on_commit=False,
+        )
+
+        self.email = f"routing-{uuid.uuid4().hex}@sudays.com"
+        with mock.patch.object(HashUtil, "rounds", 4):
+            password = HashUtil.hash_password("Test1234!")
+        async with self.session_factory() as session:
+            member = Member(email=self.email, password=password, nickname=uuid.uuid4().hex[:12])
+            session.add(member)
+            await session.commit()
+            self.member_id = member.id
+        self.executed.clear()
+
+    async def asyncTearDown(self):
+        await self.replica.dispose()
+        await super().asyncTearDown()
+
+    def _recorder(self, name: str):
+        def record(conn, cursor, statement, parameters, context, executemany):
+            self.executed.append((name, statement.split(None, 1)[0].upper()))
+        return record
+
+    def _binds(self, *verbs: str) -> list[str]:
+        """실행된 문장 중 verbs로 시작하는 문장이 실행된 엔진 목록"""
+        return [name for name, verb in self.executed if verb in verbs]
+
+    async def test_member_lookup_goes_to_replica_but_login_reads_primary(self):
+        async with self.routing_factory() as session:
+            self.assertIsNotNone(await MemberDAO(session).get_member_by_email(self.email, use_replica=True))
+        self.assertEqual(self._binds("SELECT"), ["replica"])
+
+        self.executed.clear()
+        with mock.patch.object(HashUtil, "rounds", 4):
+            async with self.routing_factory() as session:
+                self.assertIsNotNone(await MemberService(session).login(self.email, "Test1234!"))
+        self.assertEqual(self._binds("SELECT"), ["primary"])
+
+    async def test_signup_check_reads_primary(self):
+        async with self.routing_factory() as session:
+            await MemberDAO(session).check_signup(self.email, "nickname")
+        self.assertEqual(self._binds("SELECT"), ["primary"])
+
+    async def test_writes_and_reads_after_writes_stay_on_primary(self):
+        async with self.routing_factory() as session:
+            async with UnitOfWork(session):
+                member_dao = MemberDAO(session)
+                await member_dao.update_password(self.member_id, "-")
+                # 같은 트랜잭션에서 쓰기 이후의 읽기는 복제 지연을 피해 primary 사용
+                await member_dao.get_member_by_email(self.email, use_replica=True)
+                await DiaryDAO(session).upsert(self.member_id, "20240101", "content", [])
+            self.assertEqual(self._binds("UPDATE", "INSERT", "SELECT"), ["primary"] * 3)
+
+            # 커밋 이후의 표시된 읽기는 다시 복제 DB로
+            self.executed.clear()
+            diary_dao = DiaryDAO(session)
+            self.assertIsNotNone(await diary_dao.find_by_yyyymmdd(self.member_id, "20240101"))
+            await diary_dao.find_by_date_range(self.member_id, date(2024, 1, 1), date(2024, 1, 31))
+            self.assertEqual(self._binds("SELECT"), ["replica"] * 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from db_case import DBTestCase
+
+from fastapi import HTTPException
+
+from config.db_monitor import count_statements
+from controller.auth.auth_controller import signup
+from dto.member_dto import CreateMemberRequestDTO
+from model.diary.diary import Diary  # noqa: F401 - 관계 매핑에 필요
+from model.diary.diary_image import DiaryImage  # noqa: F401 - 관계 매핑에 필요
+from model.member.email_verification import EmailVerification
+from service.member.member_service import MemberService
+from util.hash_util import HashUtil
+
+PASSWORD = "Signup-Password-1"
+
+class TestSignup(DBTestCase):
+    track_statements = True
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.email = f"signup-{uuid.uuid4().hex}@sudays.com"
+        self.nickname = uuid.uuid4().hex[:12]
+        self.rounds = mock.patch.object(HashUtil, "rounds", 4)
+        self.rounds.start()
+
+    async def asyncTearDown(self):
+        self.rounds.stop()
+        await super().asyncTearDown()
+
+    async def _verify_email(self, email: str) -> None:
+        async with self.session_factory() as session:
+            session.add(EmailVerification(
+                email=email,
+                verification_code="000000",
+                is_verified=True,
+                expires_at=datetime.now(timezone.utc) + timedelta(minutes=5),
+            ))
+            await session.commit()
+
+    async def test_signup_runs_one_check_and_one_insert(self):
+        await self._verify_email(self.email)
+
+        async with self.session_factory() as session:
+            with count_statements() as counter:
+                created = await signup(CreateMemberRequestDTO(email=self.email, nickname=self.nickname, password=PASSWORD), session)
+
+        self.assertEqual(created.email, self.email)
+        self.assertEqual(counter.statements, 2)
+
+    async def test_signup_check_reports_conflicts_and_verification(self):
+        async with self.session_factory() as session:
+            with self.assertRaises(HTTPException) as context:
+                await signup(CreateMemberRequestDTO(email=self.email, nickname=self.nickname, password=PASSWORD), session)
+            self.assertEqual(context.exception.status_code, 400)
+
+            check = await MemberService(session).check_signup(self.email, self.nickname)
+            self.assertEqual((check.email_taken, check.nickname_taken, check.email_verified), (False, False, False))
+
+        await self._verify_email(self.email)
+        async with self.session_factory() as session:
+            await MemberService(session).register_member(self.email, PASSWORD, self.nickname)
+            check = await MemberService(session).check_signup(self.email, self.nickname)
+        self.assertEqual((check.email_taken, check.nickname_taken, check.email_verified), (True, True, True))
+
+    async def test_duplicate_insert_is_rejected_by_unique_constraint(self):
+        # 사전 확인을 동시에 통과한 두 요청을 가정
+        async with self.session_factory() as session:
+            await MemberService(session).register_member(self.email, PASSWORD, self.nickname)
+
+        async with self.session_factory() as session:
+            with self.assertRaisesRegex(ValueError, "닉네임"):
+                await MemberService(session).register_member(f"other-{self.email}", PASSWORD, self.nickname)
+            with self.assertRaisesRegex(ValueError, "이메일"):
+                await MemberService(session).register_member(self.email, PASSWORD, uuid.uuid4().hex[:12])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import uuid
+from datetime import datetime, timezone
+from unittest import mock
+
+from db_case import DBTestCase
+
+from fastapi import Response
+
+from config.jwt_config import access_token_claims, create_access_token, create_refresh_token, verify_token
+from controller.auth.auth_controller import refresh_token
+from dependencies.auth_dependencies import get_current_member
+from service.member.token_revocation import token_revocation
+from dto.auth_dto import MemberInfoDTO
+from model.diary.diary import Diary  # noqa: F401 - 관계 매핑에 필요
+from model.diary.diary_image import DiaryImage  # noqa: F401 - 관계 매핑에 필요
+from model.member.member import Member
+from service.member.member_cache import member_cache
+
+MEMBER_INFO = MemberInfoDTO(
+    id=uuid.uuid4(),
+    email="stateless@sudays.com",
+    nickname="stateless",
+    role="USER",
+    created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+)
+
+class TestStatelessAccessToken(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        member_cache.clear()
+        # 서버 실행 중처럼 폐기 목록을 불러와 구독 중인 상태 - 폐기되지 않은 토큰은 DB 없이 통과
+        live = mock.patch.multiple(token_revocation, _loaded=True, _listening=True)
+        live.start()
+        self.addCleanup(live.stop)
+
+    async def test_member_is_built_from_claims_without_db(self):
+        with mock.patch("config.jwt_config.STATELESS_ACCESS_TOKEN", True):
+            token = create_access_token(access_token_claims(MEMBER_INFO))
+            # DB 세션 없이도 인증되어야 함
+            member_info = await get_current_member(token, db=None)
+
+        self.assertEqual(member_info, MEMBER_INFO)
+
+    def test_default_mode_keeps_only_subject_and_jti(self):
+        claims = access_token_claims(MEMBER_INFO)
+
+        self.assertEqual(set(claims), {"sub", "jti"})
+
+class TestRefreshRereadsMember(DBTestCase):
+    async def asyncTearDown(self):
+        member_cache.clear()
+        await super().asyncTearDown()
+
+    async def test_refreshed_token_carries_current_member_data(self):
+        async with self.session_factory() as session:
+            member = Member(email=f"refresh-{uuid.uuid4().hex}@sudays.com", password="-", nickname=uuid.uuid4().hex[:12])
+            session.add(member)
+            await session.commit()
+            nickname = member.nickname = uuid.uuid4().hex[:12]
+            await session.commit()
+
+        response = Response()
+        with mock.patch("config.jwt_config.STATELESS_ACCESS_TOKEN", True):
+            async with self.session_factory() as session:
+                await refresh_token(response, create_refresh_token({"sub": member.email, "jti": str(uuid.uuid4())}), session)
+
+        payload = verify_token(response.headers["Authorization"].removeprefix("Bearer "))
+        self.assertEqual(payload["nickname"], nickname)
+        self.assertEqual(payload["id"], str(member.id))
+        self.assertIn("jti", payload)
+
+if __name__ == '__main__':
+    unittest.main()
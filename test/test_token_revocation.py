@@ -0,0 +1,157 @@
+import asyncio
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from db_case import DBTestCase
+
+from fastapi import HTTPException, Response
+from sqlalchemy import select
+
+from config.jwt_config import create_access_token, create_refresh_token
+from controller.auth.auth_controller import logout, refresh_token
+from dependencies.auth_dependencies import get_current_member
+from model.diary.diary import Diary  # noqa: F401 - 관계 매핑에 필요
+from model.diary.diary_image import DiaryImage  # noqa: F401 - 관계 매핑에 필요
+from model.member.member import Member
+from model.member.revoked_token import RevokedToken
+from service.member import token_revocation as token_revocation_module
+from service.member.token_revocation import TokenRevocationStore
+from util.bloom_filter import BloomFilter
+
+class TestBloomFilter(unittest.TestCase):
+    def test_no_false_negatives_and_bounded_false_positives(self):
+        bloom_filter = BloomFilter(capacity=10000, error_rate=0.01)
+        added = [str(uuid.uuid4()) for _ in range(10000)]
+        for item in added:
+            bloom_filter.add(item)
+
+        self.assertTrue(all(item in bloom_filter for item in added))
+        false_positives = sum(str(uuid.uuid4()) in bloom_filter for _ in range(10000))
+        self.assertLess(false_positives, 300)
+
+class TestTokenRevocationStore(DBTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.store = TokenRevocationStore(capacity=1000, error_rate=0.001)
+        self.watchers: list[asyncio.Task] = []
+
+    async def asyncTearDown(self):
+        for task in self.watchers:
+            task.cancel()
+        await asyncio.gather(*self.watchers, return_exceptions=True)
+        await super().asyncTearDown()
+
+    async def _watch(self, store: TokenRevocationStore) -> asyncio.Task:
+        task = asyncio.create_task(store.watch(interval_seconds=60, engine=self.engine, session_factory=self.session_factory))
+        self.watchers.append(task)
+        for _ in range(100):
+            if store.is_live:
+                return task
+            await asyncio.sleep(0.05)
+        self.fail("폐기 알림 구독이 시작되지 않았습니다")
+
+    async def test_revoked_jti_is_detected_and_others_skip_db(self):
+        await self._watch(self.store)
+        jti = str(uuid.uuid4())
+        async with self.session_factory() as session:
+            await self.store.revoke(session, jti, datetime.now(timezone.utc) + timedelta(minutes=30))
+            self.assertTrue(await self.store.is_revoked(session, jti))
+
+        # 필터에 없는 jti는 DB 세션 없이 판정
+        self.assertFalse(await self.store.is_revoked(None, str(uuid.uuid4())))
+        self.assertEqual(self.store.snapshot()["filter_hits"], 1)
+
+    async def test_reload_picks_up_other_workers_and_prunes_expired(self):
+        active, expired = str(uuid.uuid4()), str(uuid.uuid4())
+        async with self.session_factory() as session:
+            # 다른 워커가 폐기한 기록
+            session.add_all([
+                RevokedToken(jti=active, expires_at=datetime.now(timezone.utc) + timedelta(minutes=30)),
+                RevokedToken(jti=expired, expires_at=datetime.now(timezone.utc) - timedelta(minutes=1)),
+            ])
+            await session.commit()
+
+        await self._watch(self.store)
+
+        async with self.session_factory() as session:
+            self.assertTrue(await self.store.is_revoked(session, active))
+            self.assertFalse(await self.store.is_revoked(session, expired))
+            self.assertIsNone(await session.scalar(select(RevokedToken.jti).filter(RevokedToken.jti == expired)))
+        self.assertGreaterEqual(self.store.pruned, 1)
+
+    async def test_revocation_in_other_process_is_applied_immediately(self):
+        other = TokenRevocationStore(capacity=1000, error_rate=0.001)
+        await self._watch(self.store)
+        jti = str(uuid.uuid4())
+
+        async with self.session_factory() as session:
+            await other.revoke(session, jti, datetime.now(timezone.utc) + timedelta(minutes=30))
+        for _ in range(100):
+            if self.store.notifications:
+                break
+            await asyncio.sleep(0.05)
+
+        # 재구성 주기(60초)를 기다리지 않고 알림으로 필터에 반영됨
+        self.assertTrue(self.store.is_live)
+        async with self.session_factory() as session:
+            self.assertTrue(await self.store.is_revoked(session, jti))
+        self.assertEqual(self.store.snapshot()["db_checks"], 0)
+
+    async def test_unloaded_filter_checks_db_and_fails_closed(self):
+        jti = str(uuid.uuid4())
+        async with self.session_factory() as session:
+            session.add(RevokedToken(jti=jti, expires_at=datetime.now(timezone.utc) + timedelta(minutes=30)))
+            await session.commit()
+
+        # 필터를 불러오지 못한 상태에서도 폐기된 토큰을 놓치지 않음
+        async with self.session_factory() as session:
+            self.assertTrue(await self.store.is_revoked(session, jti))
+        self.assertEqual(self.store.db_checks, 1)
+
+        # DB도 확인할 수 없으면 통과시키지 않고 예외
+        broken = mock.AsyncMock()
+        broken.execute.side_effect = ConnectionError("db down")
+        with self.assertRaises(ConnectionError):
+            await self.store.is_revoked(broken, str(uuid.uuid4()))
+
+    async def test_revoked_access_token_is_rejected(self):
+        async with self.session_factory() as session:
+            member = Member(email=f"revoke-{uuid.uuid4().hex}@sudays.com", password="-", nickname=uuid.uuid4().hex[:12])
+            session.add(member)
+            await session.commit()
+
+        jti = str(uuid.uuid4())
+        token = create_access_token({"sub": member.email, "jti": jti})
+        store = token_revocation_module.token_revocation
+        async with self.session_factory() as session:
+            self.assertEqual((await get_current_member(token, session)).id, member.id)
+            await store.revoke(session, jti, datetime.now(timezone.utc) + timedelta(minutes=30))
+
+            with self.assertRaises(HTTPException) as context:
+                await get_current_member(token, session)
+        self.assertEqual(context.exception.status_code, 401)
+
+    async def test_logout_rejects_access_tokens_refreshed_from_same_refresh_token(self):
+        async with self.session_factory() as session:
+            member = Member(email=f"revoke-{uuid.uuid4().hex}@sudays.com", password="-", nickname=uuid.uuid4().hex[:12])
+            session.add(member)
+            await session.commit()
+
+        refresh_jti = str(uuid.uuid4())
+        login_token = create_access_token({"sub": member.email, "jti": str(uuid.uuid4()), "rjti": refresh_jti})
+        async with self.session_factory() as session:
+            response = Response()
+            await refresh_token(response, create_refresh_token({"sub": member.email, "jti": refresh_jti}), session)
+            refreshed_token = response.headers["Authorization"].removeprefix("Bearer ")
+            self.assertEqual((await get_current_member(refreshed_token, session)).id, member.id)
+
+            await logout(Response(), login_token, session)
+
+            with self.assertRaises(HTTPException) as context:
+                await get_current_member(refreshed_token, session)
+        self.assertEqual(context.exception.status_code, 401)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from db_case import DBTestCase
+
+from sqlalchemy import select
+
+from model.member.email_outbox import EmailOutbox, OutboxStatus
+from model.member.email_verification import EmailVerification
+from service.email.email_service import EmailService
+from service.email.verification_purge import VerificationPurgeJob
+from service.email.verified_email_cache import verified_email_cache
+
+class TestVerificationPurge(DBTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.prefix = f"purge-{uuid.uuid4().hex[:8]}"
+        verified_email_cache.clear()
+
+    async def asyncTearDown(self):
+        verified_email_cache.clear()
+        await super().asyncTearDown()
+
+    def _verification(self, name: str, is_verified: bool, expires_at: datetime, verified_at: datetime = None) -> EmailVerification:
+        return EmailVerification(
+            email=f"{self.prefix}-{name}@sudays.com",
+            verification_code="000000",
+            is_verified=is_verified,
+            expires_at=expires_at,
+            verified_at=verified_at,
+        )
+
+    def _outbox(self, name: str, status: OutboxStatus, sent_at: datetime = None) -> EmailOutbox:
+        return EmailOutbox(recipient=f"{self.prefix}-{name}@sudays.com", subject="subject", body="body", status=status, sent_at=sent_at)
+
+    async def test_purges_only_expired_and_old_rows_in_batches(self):
+        now = datetime.now(timezone.utc)
+        async with self.session_factory() as session:
+            session.add_all(
+                [self._verification(f"expired{i}", False, now - timedelta(minutes=1)) for i in range(5)] +
+                [self._verification("pending", False, now + timedelta(minutes=10))] +
+                [self._verification(f"old{i}", True, now, now - timedelta(days=2)) for i in range(3)] +
+                [self._verification("recent", True, now, now - timedelta(minutes=5))] +
+                [self._outbox(f"sent{i}", OutboxStatus.SENT, now - timedelta(days=2)) for i in range(3)] +
+                [self._outbox("recent-sent", OutboxStatus.SENT, now - timedelta(minutes=5))] +
+                [self._outbox("dead", OutboxStatus.DEAD)]
+            )
+            await session.commit()
+
+        job = VerificationPurgeJob(
+            session_factory=self.session_factory,
+            batch_size=2,
+            batch_pause_seconds=0,
+            verified_retention=timedelta(days=1),
+            sent_retention=timedelta(days=1),
+        )
+        purged = await job.purge_once()
+
+        async with self.session_factory() as session:
+            emails = (await session.scalars(
+                select(EmailVerification.email).filter(EmailVerification.email.like(f"{self.prefix}-%"))
+            )).all()
+            recipients = (await session.scalars(
+                select(EmailOutbox.recipient).filter(EmailOutbox.recipient.like(f"{self.prefix}-%"))
+            )).all()
+
+        self.assertEqual(sorted(emails), [f"{self.prefix}-pending@sudays.com", f"{self.prefix}-recent@sudays.com"])
+        self.assertEqual(sorted(recipients), [f"{self.prefix}-dead@sudays.com", f"{self.prefix}-recent-sent@sudays.com"])
+        # 다른 테스트가 남긴 행도 함께 정리될 수 있으므로 최소 건수만 확인
+        self.assertGreaterEqual(purged["expired"], 5)
+        self.assertGreaterEqual(purged["verified"], 3)
+        self.assertGreaterEqual(purged["outbox_sent"], 3)
+        # 5건을 2건씩 삭제하면 최소 3번의 배치가 필요
+        self.assertGreaterEqual(job.batches, 3 + 2 + 2)
+        self.assertEqual(job.snapshot()["purged"], purged)
+
+    async def test_purged_email_is_no_longer_verified(self):
+        now = datetime.now(timezone.utc)
+        email = f"{self.prefix}-old@sudays.com"
+        async with self.session_factory() as session:
+            session.add(self._verification("old", True, now, now - timedelta(days=2)))
+            await session.commit()
+            self.assertTrue(await EmailService(session).is_email_verified(email))
+
+        await VerificationPurgeJob(session_factory=self.session_factory, verified_retention=timedelta(days=1)).purge_once()
+
+        self.assertIsNone(verified_email_cache.get(email))
+        async with self.session_factory() as session:
+            self.assertFalse(await EmailService(session).is_email_verified(email))
+
+    async def test_cache_past_retention_is_rechecked_after_purge_in_other_process(self):
+        now = datetime.now(timezone.utc)
+        old_email = f"{self.prefix}-old@sudays.com"
+        recent_email = f"{self.prefix}-recent@sudays.com"
+        # 다른 프로세스의 정리 작업이 이미 레코드를 지운 상태 - 이 프로세스의 캐시에만 남아 있음
+        verified_email_cache.set(old_email, now - timedelta(days=2))
+        verified_email_cache.set(recent_email, now - timedelta(minutes=5))
+
+        async with self.session_factory() as session:
+            service = EmailService(session)
+            self.assertFalse(await service.is_email_verified(old_email))
+            # 보관 기간 안의 인증은 DB를 조회하지 않고 캐시로 응답
+            self.assertTrue(await service.is_email_verified(recent_email))
+
+if __name__ == '__main__':
+    unittest.main()